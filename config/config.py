@@ -1,8 +1,8 @@
 # config/config.py
 
-from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
+import json
 import os
 
 
@@ -14,14 +14,96 @@ class TestData:
     EXPLICIT_WAIT = 20
     HEADLESS = os.getenv('HEADLESS', 'False').lower() == 'true'
 
+    # Backend de WebDriver: local, remote (Grid/Selenoid en REMOTE_URL) o chromedriver (servidor local)
+    DRIVER_BACKEND = os.getenv('DRIVER_BACKEND', 'local')
+    REMOTE_URL = os.getenv('REMOTE_URL', 'http://localhost:4444/wd/hub')
+    REMOTE_HTTP_POOL_SIZE = int(os.getenv('REMOTE_HTTP_POOL_SIZE', '10'))
+    # Sesiones simultáneas por proceso (0 sin límite) y espera máxima en cola
+    MAX_SESSIONS = int(os.getenv('MAX_SESSIONS', '0'))
+    SESSION_QUEUE_TIMEOUT = int(os.getenv('SESSION_QUEUE_TIMEOUT', '300'))
+
+    # Pool de drivers reutilizables entre tests (opt-in)
+    DRIVER_POOL = os.getenv('DRIVER_POOL', 'False').lower() == 'true'
+    DRIVER_POOL_SIZE = int(os.getenv('DRIVER_POOL_SIZE', '1'))
+    DRIVER_POOL_MAX_REUSE = int(os.getenv('DRIVER_POOL_MAX_REUSE', '25'))
+
+    # Perfil "lean": bloqueo de recursos innecesarios vía CDP (opt-in)
+    LEAN_MODE = os.getenv('LEAN_MODE', 'False').lower() == 'true'
+    LEAN_BLOCKED_URLS = [pattern for pattern in os.getenv(
+        'LEAN_BLOCKED_URLS',
+        '*google-analytics.com*,*googletagmanager.com*,*backtrace.io*,'
+        '*fonts.googleapis.com*,*fonts.gstatic.com*'
+    ).split(',') if pattern]
+    LEAN_BLOCKED_RESOURCE_TYPES = [resource_type for resource_type in os.getenv(
+        'LEAN_BLOCKED_RESOURCE_TYPES', 'Image,Font,Media'
+    ).split(',') if resource_type]
+
+    # Modo de login en los fixtures: "session" (cookie) o "form" (formulario)
+    LOGIN_MODE = os.getenv('LOGIN_MODE', 'session').lower()
+
     # URL y credenciales
     BASE_URL = "https://www.saucedemo.com"
     USERNAME = "standard_user"
     PASSWORD = "secret_sauce"
 
+    # Réplica local de SauceDemo (ambiente "local")
+    LOCAL_PORT = int(os.getenv('LOCAL_PORT', '0'))
+    LOCAL_LATENCY_MS = int(os.getenv('LOCAL_LATENCY_MS', '0'))
+
     # Configuración de reportes
     REPORTS_PATH = "reports"
     SCREENSHOTS_PATH = "reports/screenshots"
+    # Ancho máximo de los screenshots guardados en disco (0 = sin reescalar, requiere Pillow)
+    SCREENSHOT_MAX_WIDTH = int(os.getenv('SCREENSHOT_MAX_WIDTH', '0'))
+
+    # Checkpoints visuales (ver utils/visual.py)
+    VISUAL_BASELINES_PATH = os.getenv('VISUAL_BASELINES_PATH', 'resources/visual_baselines')
+    VISUAL_DIFFS_PATH = "reports/visual"
+    VISUAL_UPDATE_BASELINES = os.getenv('VISUAL_UPDATE_BASELINES', 'False').lower() == 'true'
+    # Fracción máxima de píxeles distintos y diferencia por canal tolerada (0-255)
+    VISUAL_THRESHOLD = float(os.getenv('VISUAL_THRESHOLD', '0.001'))
+    VISUAL_PIXEL_TOLERANCE = int(os.getenv('VISUAL_PIXEL_TOLERANCE', '16'))
+    # Bits distintos del hash perceptual con los que se acepta un frame sin diff completo.
+    # -1 (por defecto) hace siempre el diff: el hash no detecta cambios de color de zonas pequeñas
+    VISUAL_HASH_DISTANCE = int(os.getenv('VISUAL_HASH_DISTANCE', '-1'))
+    ALLURE_RESULTS_PATH = "reports/allure-results"
+
+    # Escritura de resultados Allure en segundo plano y por lotes
+    ASYNC_REPORTING = os.getenv('ASYNC_REPORTING', 'False').lower() == 'true'
+
+    # Tiempos por paso de los page objects (JSON por test)
+    STEP_TIMING = os.getenv('STEP_TIMING', 'False').lower() == 'true'
+    TIMINGS_PATH = "reports/timings"
+
+    # Navigation Timing, paint y CDP Performance.getMetrics por transición de página (opt-in)
+    PAGE_METRICS = os.getenv('PAGE_METRICS', 'False').lower() == 'true'
+    PAGE_METRICS_PATH = "reports/metrics"
+
+    # Cargas por página para el p95 de los presupuestos (ver utils/perf_budgets.py)
+    PERF_REPEATS = int(os.getenv('PERF_REPEATS', '10'))
+
+    # Registro HAR por test a partir de los eventos CDP Network (opt-in, ver utils/har_recorder.py)
+    HAR_CAPTURE = os.getenv('HAR_CAPTURE', 'False').lower() == 'true'
+    HAR_PATH = "reports/har"
+    HAR_MAX_PENDING = int(os.getenv('HAR_MAX_PENDING', '500'))
+    HAR_POLL_COMMANDS = int(os.getenv('HAR_POLL_COMMANDS', '25'))
+    # Duración (s) a partir de la cual se adjunta el HAR aunque el test pase (0 desactiva)
+    HAR_SLOW_SECONDS = float(os.getenv('HAR_SLOW_SECONDS', '0'))
+
+    # Resultados del benchmark de localizadores (ver utils/locator_benchmark.py)
+    LOCATOR_BENCHMARK_PATH = os.getenv('LOCATOR_BENCHMARK_PATH', 'config/locator_benchmark.json')
+
+    # Caché de rutas de Chrome/chromedriver por versión del navegador (ver utils/webdriver_manager.py)
+    DRIVER_CACHE_PATH = os.getenv('DRIVER_CACHE_PATH', os.path.expanduser('~/.cache/saucedemo-automation/drivers.json'))
+
+    # Registro opt-in de los métodos de page objects y claves de Locators usados por cada test (ver utils/impact.py)
+    IMPACT_RECORD = os.getenv('IMPACT_RECORD', 'False').lower() == 'true'
+    IMPACT_MAP_PATH = os.getenv('IMPACT_MAP_PATH', 'reports/.impact_map.json')
+
+    # Histórico SQLite de resultados y duraciones por test (ver utils/run_history.py)
+    TEST_HISTORY = os.getenv('TEST_HISTORY', 'True').lower() == 'true'
+    HISTORY_DB = os.getenv('HISTORY_DB', 'reports/.test_history.sqlite')
+    TEST_ORDER = os.getenv('TEST_ORDER', 'file')
 
     # Mensajes de error personalizados
     ERROR_MESSAGES = {
@@ -76,7 +158,25 @@ class Locators:
     adaptabilidad de los localizadores para los diversos flujos de automatización,
     permitiendo elegir el metodo más apropiado según el contexto y las
     características del elemento a localizar.
+
+    El metodo resolve() devuelve la estrategia válida más rápida de cada
+    elemento según el último benchmark (utils/locator_benchmark.py). Sin
+    resultados de benchmark se aplica el orden ID > CSS > clase > XPath.
     """
+    # Estrategias soportadas y su equivalente en Selenium
+    STRATEGIES = {
+        "id": By.ID,
+        "css": By.CSS_SELECTOR,
+        "class": By.CLASS_NAME,
+        "xpath": By.XPATH
+    }
+
+    # Secciones de localizadores por página
+    SECTIONS = ("LOGIN", "INVENTORY", "CART", "CHECKOUT")
+
+    # Estrategia más rápida por elemento ("CART.checkout_button" -> "id")
+    _fastest = None
+
     # Login Page
     LOGIN = {
         "username_input": {
@@ -193,6 +293,38 @@ class Locators:
         }
     }
 
+    @classmethod
+    def resolve(cls, section, *keys):
+        """
+        Devuelve el localizador más rápido y válido de un elemento
+        Args:
+            section (str): Sección de localizadores ('LOGIN', 'CART', ...)
+            *keys (str): Claves del elemento dentro de la sección
+                (p. ej. 'summary', 'total' para elementos anidados)
+        Returns:
+            tuple: (By, valor) listo para find_element
+        """
+        entry = getattr(cls, section)
+        for key in keys:
+            entry = entry[key]
+
+        strategy = cls.fastest_strategies().get(".".join((section,) + keys))
+        if strategy not in entry:
+            strategy = next(name for name in cls.STRATEGIES if name in entry)
+        return cls.STRATEGIES[strategy], entry[strategy]
+
+    @classmethod
+    def fastest_strategies(cls):
+        """Carga (una sola vez) la estrategia más rápida por elemento del benchmark"""
+        if cls._fastest is None:
+            cls._fastest = {}
+            if os.path.exists(TestData.LOCATOR_BENCHMARK_PATH):
+                with open(TestData.LOCATOR_BENCHMARK_PATH, encoding="utf-8") as f:
+                    entries = json.load(f).get("entries", {})
+                cls._fastest = {path: result["fastest"] for path, result in entries.items()
+                                if result.get("fastest")}
+        return cls._fastest
+
 
 class Environment:
     # Configuración para diferentes ambientes (desarrollo, pruebas, producción)
@@ -211,11 +343,17 @@ class Environment:
             "url": "https://www.saucedemo.com",
             "username": "standard_user",
             "password": "secret_sauce"
+        },
+        # Réplica local servida por el fixture local_site (la URL se fija al arrancar)
+        "local": {
+            "url": "http://127.0.0.1",
+            "username": "standard_user",
+            "password": "secret_sauce"
         }
     }
 
-    # Ambiente actual (cambiar según necesidad)
-    CURRENT_ENV = "dev"
+    # Ambiente actual (cambiar según necesidad o con TEST_ENV)
+    CURRENT_ENV = os.getenv('TEST_ENV', 'dev')
 
     @classmethod
     def get_environment_config(cls):
@@ -243,11 +381,22 @@ def get_chrome_options():
 
 
     # Deshabilitar gestor de contraseñas y notificaciones
-    options.add_experimental_option('prefs', {
+    prefs = {
         'credentials_enable_service': False,
         'profile.password_manager_enabled': False,
         'profile.default_content_setting_values.notifications': 2
-    })
+    }
+
+    # Perfil lean: sin imágenes y sin esperar subrecursos (utils/lean_profile.py)
+    if TestData.LEAN_MODE:
+        prefs['profile.managed_default_content_settings.images'] = 2
+        options.page_load_strategy = 'eager'
+
+    # Log de red para contar peticiones (perfil lean) o registrarlas en HAR
+    if TestData.LEAN_MODE or TestData.HAR_CAPTURE:
+        options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+
+    options.add_experimental_option('prefs', prefs)
 
     # Deshabilitar mensajes de automatización
     options.add_experimental_option('excludeSwitches', ['enable-automation'])
@@ -1,11 +1,230 @@
 # pages/base_page.py
-from selenium.webdriver.support.ui import WebDriverWait
+import functools
+import inspect
+import warnings
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Optional
+
+import allure
+from selenium.common import StaleElementReferenceException
 from selenium.webdriver.support import expected_conditions as EC
+from config.config import Locators, TestData
+from utils import page_metrics, visual
+from utils.step_timing import TimedWait, timed_step
+
+
+@dataclass(frozen=True)
+class PageBudget:
+    """
+    Presupuesto de rendimiento de una página (ver utils/perf_budgets.py)
+    Attributes:
+        path (str): Ruta de la página relativa a la URL del ambiente
+        key_element (str): Id del elemento que hace la página utilizable
+        tti_ms (float): Tiempo máximo (p95) hasta que el elemento clave es interactivo
+        max_requests (int): Peticiones de red máximas (p95) de la carga
+        requires_login (bool): Si la página solo es accesible con sesión iniciada
+    """
+    path: str
+    key_element: str
+    tti_ms: float
+    max_requests: int
+    requires_login: bool = True
+
+
+class MixedWaitsWarning(UserWarning):
+    """Se combina un wait implícito con los waits explícitos de los page objects"""
+
+
+def page_transition(func):
+    """
+    Marca un método de page object que puede cargar un documento nuevo
+    (envío de formularios, enlaces, navegación). Con PAGE_METRICS=True se
+    capturan las métricas de la página de destino al terminar el método.
+    """
+    func.__page_transition__ = True
+    return func
+
+
+def _capture_after(func, label):
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        result = func(self, *args, **kwargs)
+        if TestData.PAGE_METRICS:
+            # Paso propio de la transición: las métricas se adjuntan a él
+            # aunque STEP_TIMING no abra pasos para los page objects
+            with allure.step(label):
+                page_metrics.capture(self.driver, label)
+        return result
+
+    return wrapper
+
 
 class BasePage:
+    # Timeout (segundos) de los waits explícitos
+    TIMEOUT = 10
+
+    # Presupuesto de carga de la página (None si el page object no declara uno)
+    BUDGET: Optional[PageBudget] = None
+
+    # Pulsa los botones indicados por id y devuelve cuáles existían
+    CLICK_BUTTONS_SCRIPT = """
+        return arguments[0].map(id => {
+            const button = document.getElementById(id);
+            if (!button) return false;
+            button.click();
+            return true;
+        });
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Instrumenta los métodos públicos de cada page object (utils/step_timing.py)
+        y captura las métricas de página tras los marcados con @page_transition
+        """
+        super().__init_subclass__(**kwargs)
+        for name, attribute in list(vars(cls).items()):
+            if not name.startswith("_") and inspect.isfunction(attribute) and not getattr(attribute, "__timed__", False):
+                wrapped = timed_step(attribute, cls.__name__)
+                if getattr(attribute, "__page_transition__", False):
+                    # Fuera del paso cronometrado: la captura no cuenta en sus tiempos
+                    wrapped = _capture_after(wrapped, f"{cls.__name__}.{name}")
+                setattr(cls, name, wrapped)
+
     def __init__(self, driver):
         self.driver = driver
-        self.wait = WebDriverWait(driver, 10)
+        self.wait = TimedWait(driver, self.TIMEOUT)
+        self._check_mixed_waits()
+
+    def open(self, url):
+        """
+        Navega a una URL y, con PAGE_METRICS=True, captura las métricas de la página
+        Args:
+            url (str): URL a abrir
+        """
+        self.driver.get(url)
+        if TestData.PAGE_METRICS:
+            with allure.step(f"open {url}"):
+                page_metrics.capture(self.driver, f"open {url}")
 
     def find_element(self, locator, method):
-        return self.wait.until(EC.presence_of_element_located((method, locator)))
\ No newline at end of file
+        return self.wait.until(EC.presence_of_element_located((method, locator)))
+
+    def find_fastest(self, section, *keys):
+        """
+        Localiza un elemento de Locators con la estrategia válida más rápida
+        según el último benchmark (ver Locators.resolve)
+        Args:
+            section (str): Sección de localizadores ('LOGIN', 'CART', ...)
+            *keys (str): Claves del elemento dentro de la sección
+        """
+        method, locator = Locators.resolve(section, *keys)
+        return self.find_element(locator, method)
+
+    @contextmanager
+    def no_implicit_wait(self):
+        """
+        Desactiva temporalmente el wait implícito para que las búsquedas de
+        elementos ausentes respondan de inmediato en lugar de agotar el timeout
+        """
+        implicit_wait = self._implicit_wait()
+        if not implicit_wait:
+            yield
+            return
+
+        self.driver.implicitly_wait(0)
+        try:
+            yield
+        finally:
+            self.driver.implicitly_wait(implicit_wait)
+
+    def is_present(self, locator, method):
+        """
+        Indica si el elemento existe ahora mismo, sin esperar
+        Returns:
+            bool: True si hay al menos un elemento
+        """
+        return self.count_elements(locator, method) > 0
+
+    def count_elements(self, locator, method):
+        """
+        Cuenta los elementos que coinciden ahora mismo, sin esperar
+        Returns:
+            int: Número de elementos encontrados
+        """
+        with self.no_implicit_wait():
+            return len(self.driver.find_elements(method, locator))
+
+    def get_text_or_none(self, locator, method):
+        """
+        Obtiene el texto del elemento si existe ahora mismo, sin esperar
+        Returns:
+            str: Texto del primer elemento, o None si no existe
+        """
+        with self.no_implicit_wait():
+            for _ in range(2):
+                elements = self.driver.find_elements(method, locator)
+                if not elements:
+                    return None
+                try:
+                    return elements[0].text
+                except StaleElementReferenceException:
+                    # El elemento se re-renderizó entre la búsqueda y la lectura
+                    continue
+        return None
+
+    def click_buttons_by_id(self, button_ids):
+        """
+        Pulsa varios botones en un único round-trip al navegador
+        Args:
+            button_ids (list): Ids de los botones a pulsar, en orden
+        Returns:
+            list: True por cada botón encontrado y pulsado, False si no existía
+        """
+        return self.driver.execute_script(self.CLICK_BUTTONS_SCRIPT, list(button_ids))
+
+    def visual_checkpoint(self, name, ignore=()):
+        """
+        Compara el viewport actual con la baseline visual del checkpoint
+        (se crea a partir de esta captura si aún no existe)
+        Args:
+            name (str): Nombre del checkpoint dentro del page object
+            ignore (iterable): Ids de elementos o rectángulos (x, y, ancho, alto) a ignorar
+        Returns:
+            dict: Resultado de la comparación (ver utils/visual.py)
+        Raises:
+            VisualMismatchError: Si la captura difiere de la baseline
+        """
+        return visual.checkpoint(self.driver, f"{type(self).__name__}-{name}", ignore)
+
+    @staticmethod
+    def item_slug(item_name):
+        """
+        Convierte el nombre de un producto en el sufijo que usa SauceDemo en los ids
+        de sus botones (p. ej. 'Sauce Labs Backpack' -> 'sauce-labs-backpack')
+        """
+        return item_name.strip().lower().replace(" ", "-")
+
+    def _implicit_wait(self):
+        """
+        Wait implícito de la sesión, consultado una sola vez por driver. Se
+        guarda en el propio driver para que se libere con él al hacer quit()
+        """
+        if not hasattr(self.driver, "_implicit_wait"):
+            self.driver._implicit_wait = self.driver.timeouts.implicit_wait
+        return self.driver._implicit_wait
+
+    def _check_mixed_waits(self):
+        """Avisa (una vez por driver) si se mezclan waits implícitos y explícitos"""
+        if hasattr(self.driver, "_implicit_wait"):
+            return
+        implicit_wait = self._implicit_wait()
+        if implicit_wait:
+            warnings.warn(
+                f"El driver tiene un wait implícito de {implicit_wait}s y los page objects usan "
+                f"waits explícitos: las búsquedas de elementos ausentes pueden tardar hasta "
+                f"{implicit_wait + self.TIMEOUT}s. Usa las consultas sin espera "
+                f"(is_present, count_elements, get_text_or_none) para comprobar ausencias.",
+                MixedWaitsWarning,
+                stacklevel=3
+            )
@@ -1,36 +1,57 @@
 # pages/cart_page.py
 from selenium.webdriver.common.by import By
-from .base_page import BasePage
+from .base_page import BasePage, PageBudget, page_transition
 from config.config import Locators
 
 class CartPage(BasePage):
+    # Presupuesto de carga (ver utils/perf_budgets.py)
+    BUDGET = PageBudget(path="/cart.html", key_element="checkout", tti_ms=2000, max_requests=25)
+
     def __init__(self, driver):
         super().__init__(driver)
         self.locators = Locators.CART
 
-    def get_cart_items(self):
-        """Retorna una lista de diccionarios con nombre y precio de cada item"""
-        items = []
-        cart_items = self.driver.find_elements(By.CLASS_NAME, self.locators["cart_item"]["class"])
+    REMOVE_BUTTON_PREFIX = "remove-"
 
-        for item in cart_items:
-            name = item.find_element(By.CLASS_NAME, self.locators["item_name"]["class"]).text
-            price = item.find_element(By.CLASS_NAME, self.locators["item_price"]["class"]).text
-            items.append({"name": name, "price": price})
+    # Lectura de todas las filas del carrito en un único round-trip
+    CART_ITEMS_SCRIPT = """
+        const [itemClass, nameClass, priceClass] = arguments;
+        return Array.from(document.getElementsByClassName(itemClass), item => {
+            const text = cls => {
+                const el = item.getElementsByClassName(cls)[0];
+                return el ? el.textContent.trim() : '';
+            };
+            return {name: text(nameClass), price: text(priceClass)};
+        });
+    """
 
-        return items
+    def get_cart_items(self):
+        """Retorna una lista de diccionarios con nombre y precio de cada item"""
+        return self.driver.execute_script(
+            self.CART_ITEMS_SCRIPT,
+            self.locators["cart_item"]["class"],
+            self.locators["item_name"]["class"],
+            self.locators["item_price"]["class"]
+        )
 
     def remove_item(self, item_name):
         """Elimina un item específico del carrito"""
-        cart_items = self.driver.find_elements(By.CLASS_NAME, self.locators["cart_item"]["class"])
-        for item in cart_items:
-            name = item.find_element(By.CLASS_NAME, self.locators["item_name"]["class"]).text
-            if name.lower() == item_name.lower():
-                remove_button = item.find_element(By.CSS_SELECTOR, self.locators["remove_button"]["css"])
-                remove_button.click()
-                return True
-        return False
+        return self.remove_items([item_name])[item_name]
+
+    def remove_items(self, item_names):
+        """
+        Elimina varios items del carrito en un único round-trip, pulsando
+        directamente el botón 'remove-<slug>' de cada uno
+        Args:
+            item_names (list): Nombres de los items a eliminar
+        Returns:
+            dict: Nombre del item -> True si se eliminó
+        """
+        button_ids = [self.REMOVE_BUTTON_PREFIX + self.item_slug(name) for name in item_names]
+        removed = self.click_buttons_by_id(button_ids)
+        return dict(zip(item_names, removed))
 
+    @page_transition
     def proceed_to_checkout(self):
         """Procede al checkout"""
         checkout_button = self.find_element(self.locators["checkout_button"]["id"], By.ID)
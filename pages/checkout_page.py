@@ -1,20 +1,83 @@
 # pages/checkout_page.py
+import re
+from decimal import Decimal
+
 from selenium.webdriver.common.by import By
-from .base_page import BasePage
+from .base_page import BasePage, PageBudget, page_transition
 from config.config import Locators
 
 class CheckoutPage(BasePage):
+    # Presupuesto de carga (ver utils/perf_budgets.py)
+    BUDGET = PageBudget(path="/checkout-step-two.html", key_element="finish", tti_ms=2000, max_requests=25)
+
     def __init__(self, driver):
         super().__init__(driver)
         self.locators = Locators.CHECKOUT
 
-    def fill_checkout_info(self, first_name, last_name, postal_code):
-        """Completa el formulario de información de checkout"""
+    # Rellena los campos con eventos compatibles con React y envía el formulario.
+    # Devuelve el id del primer elemento que no exista todavía, o null si completó
+    FAST_FILL_SCRIPT = """
+        const [values, submitId] = arguments;
+        const setValue = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+        const missing = Object.keys(values).concat([submitId])
+            .find(id => !document.getElementById(id));
+        if (missing) return missing;
+        for (const [id, value] of Object.entries(values)) {
+            const input = document.getElementById(id);
+            input.focus();
+            setValue.call(input, value);
+            input.dispatchEvent(new Event('input', {bubbles: true}));
+            input.dispatchEvent(new Event('change', {bubbles: true}));
+        }
+        document.getElementById(submitId).click();
+        return null;
+    """
+
+    # Lee las tres etiquetas del resumen; null mientras no estén renderizadas
+    SUMMARY_SCRIPT = """
+        const labels = arguments[0].map(cls => document.getElementsByClassName(cls)[0]);
+        if (labels.some(label => !label || !label.textContent.trim())) return null;
+        return labels.map(label => label.textContent.trim());
+    """
+
+    AMOUNT_PATTERN = re.compile(r"\$\s*([\d,]+(?:\.\d+)?)")
+
+    @page_transition
+    def fill_checkout_info(self, first_name, last_name, postal_code, fast=False):
+        """
+        Completa el formulario de información de checkout
+        Args:
+            first_name (str): Nombre
+            last_name (str): Apellido
+            postal_code (str): Código postal
+            fast (bool): Si es True rellena y envía el formulario en una única
+                ejecución de script en lugar de teclear cada campo
+        """
+        if fast:
+            self._fill_checkout_info_fast(first_name, last_name, postal_code)
+            return
+
         self.find_element(self.locators["first_name"]["id"], By.ID).send_keys(first_name)
         self.find_element(self.locators["last_name"]["id"], By.ID).send_keys(last_name)
         self.find_element(self.locators["postal_code"]["id"], By.ID).send_keys(postal_code)
         self.find_element(self.locators["continue_button"]["id"], By.ID).click()
 
+    def _fill_checkout_info_fast(self, first_name, last_name, postal_code):
+        values = {
+            self.locators["first_name"]["id"]: first_name,
+            self.locators["last_name"]["id"]: last_name,
+            self.locators["postal_code"]["id"]: postal_code
+        }
+        submit_id = self.locators["continue_button"]["id"]
+
+        # Si el formulario aún no se ha renderizado se espera a él y se reintenta
+        missing = self.driver.execute_script(self.FAST_FILL_SCRIPT, values, submit_id)
+        if missing:
+            self.find_element(missing, By.ID)
+            missing = self.driver.execute_script(self.FAST_FILL_SCRIPT, values, submit_id)
+        if missing:
+            raise RuntimeError(f"No se encontró el elemento '{missing}' del formulario de checkout")
+
     def get_summary_info(self):
         """Obtiene la información del resumen de compra"""
         item_total = self.find_element(self.locators["summary"]["item_total"]["class"], By.CLASS_NAME).text
@@ -26,6 +89,34 @@ class CheckoutPage(BasePage):
             "total": total
         }
 
+    def get_summary_amounts(self):
+        """
+        Obtiene los importes del resumen de compra en una única llamada al navegador
+        Returns:
+            dict: 'item_total', 'tax' y 'total' como Decimal
+        Raises:
+            AssertionError: Si una etiqueta no contiene un importe o si
+                subtotal + impuestos no coincide con el total (fallo del test,
+                como el resto de verificaciones de CheckoutJourney)
+        """
+        keys = ("item_total", "tax", "total")
+        classes = [self.locators["summary"][key]["class"] for key in keys]
+        labels = self.wait.until(lambda driver: driver.execute_script(self.SUMMARY_SCRIPT, classes))
+
+        amounts = {}
+        for key, label in zip(keys, labels):
+            match = self.AMOUNT_PATTERN.search(label)
+            if not match:
+                raise AssertionError(f"No se encontró un importe en '{label}'")
+            amounts[key] = Decimal(match.group(1).replace(",", ""))
+
+        if amounts["item_total"] + amounts["tax"] != amounts["total"]:
+            raise AssertionError(
+                f"El resumen no cuadra: {amounts['item_total']} + {amounts['tax']} != {amounts['total']}"
+            )
+        return amounts
+
+    @page_transition
     def complete_purchase(self):
         """Completa la compra"""
         self.find_element(self.locators["finish_button"]["id"], By.ID).click()
@@ -33,4 +124,4 @@ class CheckoutPage(BasePage):
     def is_purchase_successful(self):
         """Verifica si la compra fue exitosa"""
         complete_header = self.find_element(self.locators["complete_header"]["class"], By.CLASS_NAME)
-        return "Thank you for your order" in complete_header.text
\ No newline at end of file
+        return "Thank you for your order" in complete_header.text
@@ -0,0 +1,90 @@
+# pages/flows.py
+from contextlib import nullcontext
+from decimal import Decimal
+from typing import Dict, List
+
+from .cart_page import CartPage
+from .checkout_page import CheckoutPage
+from .inventory_page import InventoryPage
+from .login_page import LoginPage
+
+
+class CheckoutJourney:
+    """
+    Recorrido de compra completo (login, alta en el carrito y checkout) sobre
+    los page objects. Lo comparten los tests funcionales (test_checkout.py) y
+    el generador de carga (utils/load_generator.py), de modo que ambos
+    ejercitan exactamente el mismo código.
+
+    Cada paso verifica su resultado y lanza AssertionError si falla.
+    """
+
+    # Pasos del recorrido, en orden (nombres usados en las métricas de carga)
+    STEPS = ("login", "add_to_cart", "checkout")
+
+    login_page: LoginPage
+    inventory_page: InventoryPage
+    cart_page: CartPage
+    checkout_page: CheckoutPage
+
+    def __init__(self, driver, step=None):
+        """
+        Args:
+            driver (WebDriver): Driver de la sesión
+            step (callable): Fábrica de context managers para los subpasos del
+                checkout a partir de su título (p. ej. allure.step); sin él no se anotan
+        """
+        self.driver = driver
+        self.step = step or (lambda title: nullcontext())
+        self.login_page = LoginPage(driver)
+        self.inventory_page = InventoryPage(driver)
+        self.cart_page = CartPage(driver)
+        self.checkout_page = CheckoutPage(driver)
+
+    def login(self, url, username, password, mode="form"):
+        """
+        Abre la aplicación e inicia sesión
+        Args:
+            url (str): URL base del ambiente
+            username (str): Usuario
+            password (str): Contraseña
+            mode (str): Estrategia de login ('form' o 'session', ver LoginPage.login_as)
+        """
+        self.login_page.open(url)
+        self.login_page.login_as(username=username, password=password, mode=mode)
+
+    def add_to_cart(self, items: List[str]):
+        """
+        Agrega los items al carrito y abre el carrito
+        Args:
+            items (List[str]): Nombres de los productos
+        """
+        added = self.inventory_page.add_items_to_cart(items)
+        for item in items:
+            assert added[item], f"No se pudo agregar el item: {item}"
+        self.inventory_page.go_to_cart()
+
+    def checkout(self, customer_info: Dict[str, str]) -> Dict[str, Decimal]:
+        """
+        Completa el checkout desde el carrito
+        Args:
+            customer_info (Dict[str, str]): first_name, last_name y postal_code
+        Returns:
+            Dict[str, Decimal]: Importes del resumen de compra
+        """
+        with self.step("Iniciar checkout"):
+            self.cart_page.proceed_to_checkout()
+
+        with self.step("Completar información de envío"):
+            self.checkout_page.fill_checkout_info(**customer_info, fast=True)
+
+        with self.step("Verificar resumen de compra"):
+            # get_summary_amounts ya verifica que subtotal + impuestos == total
+            summary = self.checkout_page.get_summary_amounts()
+            assert summary["total"] > 0, "El total de la compra debería ser mayor que cero"
+
+        with self.step("Completar compra"):
+            self.checkout_page.complete_purchase()
+            assert self.checkout_page.is_purchase_successful(), \
+                "La compra no se completó exitosamente"
+        return summary
@@ -1,15 +1,35 @@
 # pages/inventory_page.py
-from selenium.common import NoSuchElementException, TimeoutException, StaleElementReferenceException
+import uuid
+from dataclasses import dataclass
+from typing import List, Optional
+
+from selenium.common import NoSuchElementException
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.select import Select
-from .base_page import BasePage
+from .base_page import BasePage, PageBudget, page_transition
 from config.config import Locators
 
+@dataclass(frozen=True)
+class InventoryItem:
+    """Estado de un producto del inventario en el momento de la captura"""
+    name: str
+    # None si el precio no se pudo leer (p. ej. item sin texto de precio)
+    price: Optional[float]
+    description: str
+    button_id: str
+    in_cart: bool
+
+
 class InventoryPage(BasePage):
+    # Presupuesto de carga (ver utils/perf_budgets.py)
+    BUDGET = PageBudget(path="/inventory.html", key_element="shopping_cart_container", tti_ms=2500, max_requests=40)
+
     def __init__(self, driver):
         super().__init__(driver)
         self.cart_icon_locator = Locators.INVENTORY["cart_icon"]
+        # Última captura del catálogo y token que la identifica en la página
+        self._snapshot = None
+        self._snapshot_token = uuid.uuid4().hex
 
 
     # Locators para productos
@@ -24,30 +44,78 @@ class InventoryPage(BasePage):
     PRODUCT_LABEL = "inventory_item_description"
     PRICE_LABEL = "inventory_item_price"
 
+    # Lectura de todo el catálogo en un único round-trip al navegador.
+    # Un MutationObserver instalado en la página marca la captura como sucia
+    # ante cualquier cambio del DOM; mientras siga limpia y el token coincida
+    # con la última captura de este page object, el script devuelve null y
+    # se reutiliza la captura en caché. Una navegación crea un documento
+    # nuevo sin estado, así que siempre obliga a capturar de nuevo.
+    INVENTORY_ITEM = "inventory_item"
+    INVENTORY_ITEM_DESC = "inventory_item_desc"
+    SNAPSHOT_SCRIPT = """
+        const [token, force, itemClass, nameClass, priceClass, descClass, removePrefix] = arguments;
+        let state = window.__inventorySnapshot;
+        if (!force && state && state.token === token && !state.dirty) return null;
+        if (!state) {
+            state = window.__inventorySnapshot = {token: null, dirty: true};
+            new MutationObserver(() => { state.dirty = true; }).observe(document.body, {
+                childList: true, subtree: true, attributes: true, characterData: true
+            });
+        }
+        state.dirty = false;
+        state.token = token;
+        return Array.from(document.getElementsByClassName(itemClass), item => {
+            const text = cls => {
+                const el = item.getElementsByClassName(cls)[0];
+                return el ? el.textContent.trim() : '';
+            };
+            const button = item.querySelector('button');
+            const buttonId = button ? button.id : '';
+            return {
+                name: text(nameClass),
+                price: text(priceClass),
+                description: text(descClass),
+                button_id: buttonId,
+                in_cart: buttonId.startsWith(removePrefix)
+            };
+        });
+    """
+
 
     def verify_cart_icon(self):
         # Usando el método más óptimo (ID)
         return self.find_element(self.cart_icon_locator["id"],By.ID).is_displayed()
 
     def add_item_to_cart(self, item_name):
-        """Añade un item específico al carrito"""
-        items = self.driver.find_elements(By.CLASS_NAME, self.INVENTORY_ITEM_NAME)
-        for item in items:
-            if item.text.lower() == item_name.lower():
-                item_container = item.find_element(By.XPATH, "./ancestor::div[contains(@class, 'inventory_item')]")
-                add_button = item_container.find_element(By.CSS_SELECTOR, f"button[id^='{self.ADD_TO_CART_PREFIX}']")
-                add_button.click()
-                return True
-        return False
+        """
+        Añade un item específico al carrito con un único script, sin esperar:
+        si el botón no existe (item desconocido o ya añadido) devuelve False
+        """
+        return self.add_items_to_cart([item_name])[item_name]
+
+    def add_items_to_cart(self, item_names):
+        """
+        Añade varios items al carrito en una única ejecución de script
+        Args:
+            item_names (list): Nombres de los items a añadir
+        Returns:
+            dict: Nombre del item -> True si se añadió
+        """
+        # Tras el login o una navegación el listado se renderiza por script:
+        # se espera al primer producto para que existan sus botones
+        self.find_element(self.INVENTORY_ITEM, By.CLASS_NAME)
+        clicked = self.click_buttons_by_id(self.ADD_TO_CART_PREFIX + self.item_slug(name) for name in item_names)
+        return dict(zip(item_names, clicked))
+
+    def invalidate_cache(self):
+        """Descarta la captura del catálogo; se vuelve a leer en el próximo uso"""
+        self._snapshot = None
 
     def get_item_price(self, item_name):
         """Obtiene el precio de un item específico"""
-        items = self.driver.find_elements(By.CLASS_NAME, self.INVENTORY_ITEM_NAME)
-        for item in items:
-            if item.text.lower() == item_name.lower():
-                item_container = item.find_element(By.XPATH, "./ancestor::div[contains(@class, 'inventory_item')]")
-                price = item_container.find_element(By.CLASS_NAME, self.INVENTORY_ITEM_PRICE)
-                return price.text
+        for item in self.get_catalog_snapshot():
+            if item.name.lower() == item_name.lower():
+                return None if item.price is None else f"${item.price:.2f}"
         return None
 
     def get_cart_count(self):
@@ -56,33 +124,26 @@ class InventoryPage(BasePage):
         Returns:
             int: Número de items en el carrito
         """
-        try:
-            badge = self.wait.until(
-                EC.presence_of_element_located((By.CLASS_NAME, self.CART_BADGE))
-            )
-            return int(badge.text)
-        except (NoSuchElementException, TimeoutException):
-            # Si el badge no existe, significa que no hay items
+        # Se espera al enlace del carrito, presente con y sin items; el badge
+        # se renderiza con él, así que se consulta sin esperar y un carrito
+        # vacío no agota ningún timeout
+        self.find_element(self.cart_icon_locator["id"], By.ID)
+        badge_text = self.get_text_or_none(self.CART_BADGE, By.CLASS_NAME)
+        if badge_text is None:
             return 0
+        try:
+            return int(badge_text)
         except ValueError as e:
             # Si el texto no se puede convertir a entero
             print(f"Error al convertir el texto del badge a número: {str(e)}")
             return 0
-        except StaleElementReferenceException:
-            # Si el elemento se vuelve obsoleto, intentar una vez más
-            try:
-                badge = self.wait.until(
-                    EC.presence_of_element_located((By.CLASS_NAME, self.CART_BADGE))
-                )
-                return int(badge.text)
-            except:
-                return 0
-
 
+    @page_transition
     def go_to_cart(self):
         """Navega a la página del carrito"""
         cart_icon = self.find_element(self.cart_icon_locator["id"], By.ID)
         cart_icon.click()
+        self.invalidate_cache()
 
     def sort_products(self, option):
         """
@@ -105,35 +166,70 @@ class InventoryPage(BasePage):
             sort_dropdown = self.find_element(self.SORT_DROPDOWN, By.CLASS_NAME)
             select = Select(sort_dropdown)
             select.select_by_value(option)
+            self.invalidate_cache()
         except NoSuchElementException as e:
             raise NoSuchElementException("No se encontró el menú de ordenamiento") from e
         except Exception as e:
             raise Exception(f"Error al ordenar productos: {str(e)}") from e
 
 
+    def get_catalog_snapshot(self) -> List[InventoryItem]:
+        """
+        Captura todos los productos del inventario con una sola llamada a execute_script.
+        Si la página no ha cambiado desde la captura anterior (ni ha habido
+        navegación u ordenación) se devuelve la captura en caché tras una
+        comprobación de una sola llamada.
+        Returns:
+            List[InventoryItem]: Productos en el orden actual de la página
+        """
+        rows = self.driver.execute_script(
+            self.SNAPSHOT_SCRIPT, self._snapshot_token, self._snapshot is None,
+            self.INVENTORY_ITEM, self.INVENTORY_ITEM_NAME, self.PRICE_LABEL,
+            self.INVENTORY_ITEM_DESC, self.REMOVE_FROM_CART_PREFIX
+        )
+        if rows is None:
+            return list(self._snapshot)
+
+        self._snapshot = [
+            InventoryItem(
+                name=row["name"],
+                price=self._parse_price(row["price"]),
+                description=row["description"],
+                button_id=row["button_id"],
+                in_cart=row["in_cart"]
+            )
+            for row in rows
+        ]
+        return list(self._snapshot)
+
+    @staticmethod
+    def _parse_price(text):
+        """Convierte '$29.99' en 29.99; None si el texto está vacío o no es un precio"""
+        try:
+            return float(text.replace('$', '').strip())
+        except ValueError:
+            return None
+
     def get_product_names(self):
         """Retorna lista de nombres de productos en orden actual"""
-        items = self.driver.find_elements(By.CLASS_NAME, self.INVENTORY_ITEM_NAME)
-        return [item.text for item in items]
+        return [item.name for item in self.get_catalog_snapshot()]
 
     def get_product_prices(self):
-        """Retorna lista de precios en orden actual"""
-        prices = self.driver.find_elements(By.CLASS_NAME, self.PRICE_LABEL)
-        return [float(price.text.replace('$', '')) for price in prices]
+        """
+        Retorna lista de precios en orden actual, alineada con get_product_names()
+        Raises:
+            ValueError: Si algún item no tiene un precio legible
+        """
+        items = self.get_catalog_snapshot()
+        unreadable = [item.name for item in items if item.price is None]
+        if unreadable:
+            raise ValueError(f"Items sin precio legible: {', '.join(unreadable)}")
+        return [item.price for item in items]
 
     def filter_by_price_range(self, min_price, max_price):
         """Retorna productos dentro del rango de precios especificado"""
-        items = self.driver.find_elements(By.CLASS_NAME, self.INVENTORY_ITEM_NAME)
-        filtered_items = []
-
-        for item in items:
-            item_container = item.find_element(By.XPATH, "./ancestor::div[contains(@class, 'inventory_item')]")
-            price = float(item_container.find_element(By.CLASS_NAME, self.PRICE_LABEL).text.replace('$', ''))
-            if min_price <= price <= max_price:
-                filtered_items.append({
-                    'name': item.text,
-                    'price': price
-                })
-
-        return filtered_items
-
+        return [
+            {'name': item.name, 'price': item.price}
+            for item in self.get_catalog_snapshot()
+            if item.price is not None and min_price <= item.price <= max_price
+        ]
@@ -1,38 +1,94 @@
 # pages/login_page.py
+from urllib.parse import urlparse
+
+from selenium.common import TimeoutException
 from selenium.webdriver.common.by import By
-from .base_page import BasePage
+from .base_page import BasePage, PageBudget, page_transition
 
 from config.config import Locators
 
 class LoginPage(BasePage):
+    # Presupuesto de carga (ver utils/perf_budgets.py)
+    BUDGET = PageBudget(path="/", key_element="login-button", tti_ms=2000, max_requests=20, requires_login=False)
+
+    # Cookie con la que SauceDemo identifica al usuario logueado
+    SESSION_COOKIE = "session-username"
+    INVENTORY_PATH = "/inventory.html"
+    LOGIN_MODES = ("form", "session")
+
     def __init__(self, driver):
         super().__init__(driver)
         # Obtenemos los locators del diccionario
         self.username_input = Locators.LOGIN["username_input"]
         self.password_input = Locators.LOGIN["password_input"]
         self.login_button = Locators.LOGIN["login_button"]
+        self.cart_icon = Locators.INVENTORY["cart_icon"]
         self.ERROR_MESSAGE = "[data-test='error']"
 
 
+    @page_transition
     def login(self, username, password):
-        # Usando el método más óptimo (ID)
-        username_field = self.find_element(
-            self.username_input["id"],
-            By.ID
-        )
-        username_field.send_keys(username)
-
-        password_field = self.find_element(
-            self.password_input["id"],
-            By.ID
-        )
-        password_field.send_keys(password)
-
-        login_button = self.find_element(
-            self.login_button["id"],
-            By.ID
-        )
-        login_button.click()
+        # Usando la estrategia más rápida según el benchmark (ID por defecto)
+        self.find_fastest("LOGIN", "username_input").send_keys(username)
+        self.find_fastest("LOGIN", "password_input").send_keys(password)
+        self.find_fastest("LOGIN", "login_button").click()
+
+    @page_transition
+    def login_with_session(self, username, password):
+        """
+        Login rápido: inyecta la cookie de sesión y abre el inventario directamente.
+        Requiere que el navegador esté ya en la aplicación (dominio de la cookie).
+        Si la aplicación rechaza la cookie, recurre al formulario de login.
+        Args:
+            username (str): Usuario a inyectar en la cookie
+            password (str): Contraseña, usada solo en el fallback por formulario
+        Returns:
+            bool: True si bastó la cookie, False si se usó el formulario
+        """
+        current = urlparse(self.driver.current_url)
+        origin = f"{current.scheme}://{current.netloc}"
+
+        self.driver.add_cookie({"name": self.SESSION_COOKIE, "value": username, "path": "/"})
+        self.driver.get(origin + self.INVENTORY_PATH)
+
+        # La app redirige al login si no acepta la cookie; se consulta el DOM
+        # por script para no pagar el wait implícito del elemento ausente
+        try:
+            landed_on = self.wait.until(lambda driver: driver.execute_script(
+                "if (document.getElementById(arguments[0])) return 'inventory';"
+                "if (document.getElementById(arguments[1])) return 'login';"
+                "return null;",
+                self.cart_icon["id"], self.login_button["id"]
+            ))
+        except TimeoutException:
+            landed_on = None
+
+        if landed_on == "inventory":
+            return True
+
+        self.driver.delete_cookie(self.SESSION_COOKIE)
+        if landed_on != "login":
+            self.driver.get(origin)
+        self.login(username, password)
+        return False
+
+    def login_as(self, username, password, mode="form"):
+        """
+        Realiza el login con la estrategia indicada
+        Args:
+            username (str): Usuario
+            password (str): Contraseña
+            mode (str): 'form' (formulario) o 'session' (cookie de sesión)
+        Raises:
+            ValueError: Si el modo no es válido
+        """
+        if mode not in self.LOGIN_MODES:
+            raise ValueError(f"Modo de login inválido. Modos válidos: {list(self.LOGIN_MODES)}")
+
+        if mode == "session":
+            self.login_with_session(username, password)
+        else:
+            self.login(username, password)
 
 
     def get_error_message(self):
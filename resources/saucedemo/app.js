@@ -0,0 +1,328 @@
+// Réplica funcional mínima de SauceDemo para pruebas sin red.
+// Mantiene los mismos ids, clases y data-test que config.Locators.
+(function () {
+    'use strict';
+
+    var PASSWORD = 'secret_sauce';
+    var VALID_USERS = ['standard_user', 'problem_user', 'performance_glitch_user', 'error_user', 'visual_user'];
+    var LOCKED_USERS = ['locked_out_user'];
+    var SESSION_COOKIE = 'session-username';
+    var CART_KEY = 'cart-contents';
+    var LOGIN_ERROR_KEY = 'login-error';
+    var TAX_RATE = 0.08;
+
+    var CATALOG = [
+        {id: 4, name: 'Sauce Labs Backpack', price: 29.99,
+         desc: 'carry.allTheThings() with the sleek, streamlined Sly Pack that melds uncompromising style with unequaled laptop and tablet protection.'},
+        {id: 0, name: 'Sauce Labs Bike Light', price: 9.99,
+         desc: "A red light isn't the desired state in testing but it sure helps when riding your bike at night. Water-resistant with 3 lighting modes, 1 AAA battery included."},
+        {id: 1, name: 'Sauce Labs Bolt T-Shirt', price: 15.99,
+         desc: 'Get your testing superhero on with the Sauce Labs bolt T-shirt. From American Apparel, 100% ringspun combed cotton, heather gray with red bolt.'},
+        {id: 5, name: 'Sauce Labs Fleece Jacket', price: 49.99,
+         desc: "It's not every day that you come across a midweight quarter-zip fleece jacket capable of handling everything from a relaxing day outdoors to a busy day at the office."},
+        {id: 2, name: 'Sauce Labs Onesie', price: 7.99,
+         desc: "Rib snap infant onesie for the junior automation engineer in development. Reinforced 3-snap bottom closure, two-needle hemmed sleeved and bottom won't unravel."},
+        {id: 3, name: 'Test.allTheThings() T-Shirt (Red)', price: 15.99,
+         desc: 'This classic Sauce Labs t-shirt is perfect to wear when cozying up to your keyboard to automate a few tests. Super-soft and comfy ringspun combed cotton.'}
+    ];
+
+    function slug(name) {
+        return name.toLowerCase().replace(/ /g, '-');
+    }
+
+    function money(value) {
+        return '$' + value.toFixed(2);
+    }
+
+    function byId(id) {
+        for (var i = 0; i < CATALOG.length; i++) {
+            if (CATALOG[i].id === id) return CATALOG[i];
+        }
+        return null;
+    }
+
+    function getCookie(name) {
+        var match = document.cookie.match(new RegExp('(?:^|; )' + name + '=([^;]*)'));
+        return match ? decodeURIComponent(match[1]) : null;
+    }
+
+    function getCart() {
+        try {
+            return JSON.parse(localStorage.getItem(CART_KEY)) || [];
+        } catch (e) {
+            return [];
+        }
+    }
+
+    function setCart(cart) {
+        if (cart.length) {
+            localStorage.setItem(CART_KEY, JSON.stringify(cart));
+        } else {
+            localStorage.removeItem(CART_KEY);
+        }
+        renderBadge();
+    }
+
+    function go(path) {
+        window.location.href = path;
+    }
+
+    function el(tag, attrs, children) {
+        var node = document.createElement(tag);
+        Object.keys(attrs || {}).forEach(function (key) {
+            if (key === 'text') {
+                node.textContent = attrs[key];
+            } else {
+                node.setAttribute(key, attrs[key]);
+            }
+        });
+        (children || []).forEach(function (child) {
+            node.appendChild(child);
+        });
+        return node;
+    }
+
+    function showError(message) {
+        var container = document.querySelector('.error-message-container');
+        container.innerHTML = '';
+        container.classList.add('error');
+        container.appendChild(el('h3', {'data-test': 'error', text: message}));
+    }
+
+    function requireSession(path) {
+        var user = getCookie(SESSION_COOKIE);
+        if (VALID_USERS.indexOf(user) === -1) {
+            sessionStorage.setItem(LOGIN_ERROR_KEY,
+                "Epic sadface: You can only access '" + path + "' when you are logged in.");
+            window.location.replace('/');
+            return false;
+        }
+        return true;
+    }
+
+    function renderBadge() {
+        var link = document.querySelector('.shopping_cart_link');
+        if (!link) return;
+        var count = getCart().length;
+        var badge = link.querySelector('.shopping_cart_badge');
+        if (!count) {
+            if (badge) link.removeChild(badge);
+            return;
+        }
+        if (!badge) {
+            badge = el('span', {'class': 'shopping_cart_badge', 'data-test': 'shopping-cart-badge'});
+            link.appendChild(badge);
+        }
+        badge.textContent = String(count);
+    }
+
+    function bindHeader() {
+        renderBadge();
+        var menu = document.getElementById('react-burger-menu-btn');
+        if (menu) {
+            menu.addEventListener('click', function () {
+                document.body.classList.toggle('menu_open');
+            });
+        }
+    }
+
+    // --- Login ---------------------------------------------------------------
+
+    function initLogin() {
+        var pending = sessionStorage.getItem(LOGIN_ERROR_KEY);
+        if (pending) {
+            sessionStorage.removeItem(LOGIN_ERROR_KEY);
+            showError(pending);
+        }
+        document.getElementById('login-button').addEventListener('click', function (event) {
+            event.preventDefault();
+            var username = document.getElementById('user-name').value;
+            var password = document.getElementById('password').value;
+            if (!username) return showError('Epic sadface: Username is required');
+            if (!password) return showError('Epic sadface: Password is required');
+            if (password === PASSWORD && LOCKED_USERS.indexOf(username) !== -1) {
+                return showError('Epic sadface: Sorry, this user has been locked out.');
+            }
+            if (password !== PASSWORD || VALID_USERS.indexOf(username) === -1) {
+                return showError('Epic sadface: Username and password do not match any user in this service');
+            }
+            document.cookie = SESSION_COOKIE + '=' + encodeURIComponent(username) + '; path=/';
+            go('/inventory.html');
+        });
+    }
+
+    // --- Inventario ----------------------------------------------------------
+
+    var SORTERS = {
+        az: function (a, b) { return a.name.localeCompare(b.name); },
+        za: function (a, b) { return b.name.localeCompare(a.name); },
+        lohi: function (a, b) { return a.price - b.price; },
+        hilo: function (a, b) { return b.price - a.price; }
+    };
+
+    function cartButton(product, inCart, extraClass) {
+        var button = el('button', {
+            'class': 'btn btn_small ' + (inCart ? 'btn_secondary ' : 'btn_primary ') + extraClass,
+            'id': (inCart ? 'remove-' : 'add-to-cart-') + slug(product.name),
+            'name': (inCart ? 'remove-' : 'add-to-cart-') + slug(product.name),
+            'data-test': (inCart ? 'remove-' : 'add-to-cart-') + slug(product.name),
+            text: inCart ? 'Remove' : 'Add to cart'
+        });
+        button.addEventListener('click', function () {
+            var cart = getCart();
+            var index = cart.indexOf(product.id);
+            if (index === -1) {
+                cart.push(product.id);
+            } else {
+                cart.splice(index, 1);
+            }
+            setCart(cart);
+            button.parentNode.replaceChild(cartButton(product, index === -1, extraClass), button);
+        });
+        return button;
+    }
+
+    function itemLabel(product, withDescription) {
+        var children = [
+            el('a', {'href': '#', 'id': 'item_' + product.id + '_title_link'}, [
+                el('div', {'class': 'inventory_item_name', 'data-test': 'inventory-item-name', text: product.name})
+            ])
+        ];
+        if (withDescription) {
+            children.push(el('div', {'class': 'inventory_item_desc', 'data-test': 'inventory-item-desc', text: product.desc}));
+        }
+        return children;
+    }
+
+    function renderInventory(sortKey) {
+        var list = document.querySelector('.inventory_list');
+        var cart = getCart();
+        list.innerHTML = '';
+        CATALOG.slice().sort(SORTERS[sortKey]).forEach(function (product) {
+            list.appendChild(el('div', {'class': 'inventory_item', 'data-test': 'inventory-item'}, [
+                el('div', {'class': 'inventory_item_description'}, [
+                    el('div', {'class': 'inventory_item_label'}, itemLabel(product, true)),
+                    el('div', {'class': 'pricebar'}, [
+                        el('div', {'class': 'inventory_item_price', 'data-test': 'inventory-item-price',
+                                   text: money(product.price)}),
+                        cartButton(product, cart.indexOf(product.id) !== -1, 'btn_inventory')
+                    ])
+                ])
+            ]));
+        });
+    }
+
+    function initInventory() {
+        if (!requireSession('/inventory.html')) return;
+        bindHeader();
+        var select = document.querySelector('.product_sort_container');
+        select.addEventListener('change', function () {
+            renderInventory(select.value);
+        });
+        renderInventory(select.value);
+    }
+
+    // --- Carrito -------------------------------------------------------------
+
+    function renderCartRows(list, editable) {
+        getCart().forEach(function (id) {
+            var product = byId(id);
+            if (!product) return;
+            var pricebar = [el('div', {'class': 'inventory_item_price', 'data-test': 'inventory-item-price',
+                                       text: money(product.price)})];
+            var row = el('div', {'class': 'cart_item', 'data-test': 'inventory-item'}, [
+                el('div', {'class': 'cart_quantity', 'data-test': 'item-quantity', text: '1'}),
+                el('div', {'class': 'cart_item_label'}, itemLabel(product, true).concat([
+                    el('div', {'class': 'item_pricebar'}, pricebar)
+                ]))
+            ]);
+            if (editable) {
+                var remove = el('button', {
+                    'class': 'btn btn_secondary btn_small cart_button',
+                    'id': 'remove-' + slug(product.name),
+                    'name': 'remove-' + slug(product.name),
+                    'data-test': 'remove-' + slug(product.name),
+                    text: 'Remove'
+                });
+                remove.addEventListener('click', function () {
+                    setCart(getCart().filter(function (other) { return other !== id; }));
+                    row.parentNode.removeChild(row);
+                });
+                row.querySelector('.item_pricebar').appendChild(remove);
+            }
+            list.appendChild(row);
+        });
+    }
+
+    function initCart() {
+        if (!requireSession('/cart.html')) return;
+        bindHeader();
+        renderCartRows(document.querySelector('.cart_list'), true);
+        document.getElementById('continue-shopping').addEventListener('click', function () {
+            go('/inventory.html');
+        });
+        document.getElementById('checkout').addEventListener('click', function () {
+            go('/checkout-step-one.html');
+        });
+    }
+
+    // --- Checkout ------------------------------------------------------------
+
+    function initCheckoutStepOne() {
+        if (!requireSession('/checkout-step-one.html')) return;
+        bindHeader();
+        document.getElementById('cancel').addEventListener('click', function (event) {
+            event.preventDefault();
+            go('/cart.html');
+        });
+        document.getElementById('continue').addEventListener('click', function (event) {
+            event.preventDefault();
+            if (!document.getElementById('first-name').value) return showError('Error: First Name is required');
+            if (!document.getElementById('last-name').value) return showError('Error: Last Name is required');
+            if (!document.getElementById('postal-code').value) return showError('Error: Postal Code is required');
+            go('/checkout-step-two.html');
+        });
+    }
+
+    function initCheckoutStepTwo() {
+        if (!requireSession('/checkout-step-two.html')) return;
+        bindHeader();
+        renderCartRows(document.querySelector('.cart_list'), false);
+
+        var subtotal = getCart().reduce(function (sum, id) {
+            var product = byId(id);
+            return sum + (product ? product.price : 0);
+        }, 0);
+        var tax = Math.round(subtotal * TAX_RATE * 100) / 100;
+        document.querySelector('.summary_subtotal_label').textContent = 'Item total: ' + money(subtotal);
+        document.querySelector('.summary_tax_label').textContent = 'Tax: ' + money(tax);
+        document.querySelector('.summary_total_label').textContent = 'Total: ' + money(subtotal + tax);
+
+        document.getElementById('cancel').addEventListener('click', function () {
+            go('/inventory.html');
+        });
+        document.getElementById('finish').addEventListener('click', function () {
+            setCart([]);
+            go('/checkout-complete.html');
+        });
+    }
+
+    function initCheckoutComplete() {
+        if (!requireSession('/checkout-complete.html')) return;
+        bindHeader();
+        document.getElementById('back-to-products').addEventListener('click', function () {
+            go('/inventory.html');
+        });
+    }
+
+    var PAGES = {
+        'login': initLogin,
+        'inventory': initInventory,
+        'cart': initCart,
+        'checkout-step-one': initCheckoutStepOne,
+        'checkout-step-two': initCheckoutStepTwo,
+        'checkout-complete': initCheckoutComplete
+    };
+
+    PAGES[document.body.getAttribute('data-page')]();
+})();
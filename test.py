@@ -16,12 +16,12 @@ class TestWebsite:
     self.use_selenoid = False  # set to True to run tests with Selenoid
 
     if self.use_selenoid:
+      # Selenium 4 ya no acepta desired_capabilities: las capacidades van en las options
+      options = webdriver.ChromeOptions()
+      options.set_capability("selenoid:options", {"screenResolution": "1920x1080x24"})
       self.browser = webdriver.Remote(
         command_executor='http://localhost:4444/wd/hub',
-        desired_capabilities={
-          "browserName": "chrome",
-          "browserSize": "1920x1080"
-        }
+        options=options
       )
     else:
       self.browser = webdriver.Chrome()
@@ -1,18 +1,70 @@
 # tests/conftest.py
 import pytest
-from selenium import webdriver
 from selenium.webdriver.support.ui import WebDriverWait
-from config.config import Environment, TestData, get_chrome_options
+from config.config import Environment, TestData
+from utils.allure_writer import BufferedAllureWriter
+from utils.command_budget import CommandCounter
+from utils import impact
+from utils.driver_pool import DriverPool
+from utils.har_recorder import HarRecorder
+from utils.lean_profile import RequestCounter
+from utils.local_server import LocalSiteServer
+from utils.screenshots import ScreenshotPipeline
+from utils.step_timing import StepTimer
+from utils.run_history import ORDER_MODES, TestHistory
+from utils.webdriver_manager import create_driver, startup_report
+import json
 import os
+import warnings
 import allure
 
+# Capturas de fallos: adjuntas desde memoria y guardadas en disco en segundo plano
+screenshot_pipeline = ScreenshotPipeline()
+
+# Writer de Allure con buffer (se instala en pytest_configure si ASYNC_REPORTING)
+allure_writer = None
+
+# Símbolos usados en ejecución por cada test (ver utils/impact.py)
+_impact_symbols = {}
+
+# Histórico de resultados y duraciones (se abre en pytest_configure si TEST_HISTORY)
+test_history = None
+
+@pytest.fixture(scope="session", autouse=True)
+def local_site():
+    """
+    Arranca la réplica local de SauceDemo cuando el ambiente es "local"
+    (TEST_ENV=local) y apunta la URL del ambiente al servidor arrancado.
+    La latencia por petición se configura con LOCAL_LATENCY_MS.
+    """
+    if Environment.CURRENT_ENV != "local":
+        yield None
+        return
+
+    with LocalSiteServer() as server:
+        Environment.ENVIRONMENTS["local"]["url"] = server.url
+        yield server
+
+@pytest.fixture(scope="session")
+def driver_pool():
+    """
+    Pool de drivers compartido por la sesión (o por worker en ejecuciones paralelas).
+    Solo se crea si DRIVER_POOL=True; en caso contrario cada test arranca su navegador.
+    """
+    if not TestData.DRIVER_POOL:
+        yield None
+        return
+
+    pool = DriverPool(create_driver)
+    yield pool
+    pool.shutdown()
+
 @pytest.fixture(scope="function")
-def setup_driver(request):
+def setup_driver(request, driver_pool):
     """
     Fixture principal para configurar el WebDriver
     """
-    driver = webdriver.Chrome(options=get_chrome_options())
-    driver.implicitly_wait(TestData.IMPLICIT_WAIT)
+    driver = driver_pool.acquire() if driver_pool else create_driver()
 
     # Configurar wait explícito
     wait = WebDriverWait(driver, TestData.EXPLICIT_WAIT)
@@ -25,25 +77,183 @@ def setup_driver(request):
     request.cls.wait = wait
     request.cls.env_config = env_config
 
+    # Contador de peticiones permitidas/bloqueadas del perfil lean
+    request_counter = RequestCounter.attach(driver) if TestData.LEAN_MODE else None
+
+    # Registro HAR de las peticiones del test (ver utils/har_recorder.py)
+    har_recorder = HarRecorder.attach(driver, request.node.nodeid) if TestData.HAR_CAPTURE else None
+
+    # Conteo de comandos WebDriver por fase (ver marcador command_budget)
+    command_counter = CommandCounter.attach(driver)
+    request.node._command_counter = command_counter
+
+    # Métodos de page objects y claves de Locators usados (selección por impacto)
+    if TestData.IMPACT_RECORD:
+        impact.start_recording()
+
+    # Línea temporal de pasos de page objects (incluye el login del fixture)
+    step_timer = StepTimer.attach(driver, request.node.nodeid) if TestData.STEP_TIMING else None
+
     yield driver
 
-    # Capturar screenshot en caso de fallo
-    if request.node.rep_call.failed:
+    if TestData.IMPACT_RECORD:
+        _impact_symbols[request.node.nodeid] = impact.stop_recording()
+
+    if step_timer:
+        step_timer.detach()
+        step_timer.save()
+
+    command_counter.detach()
+    allure.attach(
+        json.dumps(command_counter.summary(), indent=2),
+        name="Comandos WebDriver",
+        attachment_type=allure.attachment_type.JSON
+    )
+
+    if request_counter:
+        allure.attach(
+            json.dumps(request_counter.detach(), indent=2),
+            name="Peticiones de red (perfil lean)",
+            attachment_type=allure.attachment_type.JSON
+        )
+
+    # Capturar screenshot en caso de fallo (sin rep_call el setup falló)
+    rep_call = getattr(request.node, "rep_call", None)
+    failed = rep_call is None or rep_call.failed
+    if failed:
         take_screenshot(driver, request.node.name)
 
-    driver.quit()
+    # El HAR solo se adjunta a los tests fallidos (o que exceden su presupuesto) y a los lentos
+    if har_recorder:
+        har_recorder.detach()
+        slow = TestData.HAR_SLOW_SECONDS and rep_call is not None and rep_call.duration > TestData.HAR_SLOW_SECONDS
+        if failed or slow:
+            har_recorder.attach_to_allure()
+
+    if driver_pool:
+        # Un driver de un test fallido no se reutiliza: su estado es desconocido
+        driver_pool.release(driver, reusable=not failed)
+    else:
+        driver.quit()
+
+@pytest.fixture
+def login_mode(request):
+    """
+    Estrategia de login usada por los fixtures de las clases de test.
+    Por defecto TestData.LOGIN_MODE; se puede fijar por test con
+    @pytest.mark.parametrize("login_mode", ["form"], indirect=True)
+    """
+    return getattr(request, "param", TestData.LOGIN_MODE)
 
 def take_screenshot(driver, name):
     """Utilidad para tomar screenshots"""
-    os.makedirs(TestData.SCREENSHOTS_PATH, exist_ok=True)
-    screenshot_path = f"{TestData.SCREENSHOTS_PATH}/failure_{name}.png"
-    driver.save_screenshot(screenshot_path)
-    allure.attach.file(
-        screenshot_path,
-        name="Screenshot",
-        attachment_type=allure.attachment_type.PNG
+    return screenshot_pipeline.capture(driver, name)
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--impact-base", default=None, metavar="REF",
+        help="Ejecuta solo los tests afectados por los cambios respecto a la referencia git REF"
+    )
+    parser.addoption(
+        "--order", default=TestData.TEST_ORDER, choices=ORDER_MODES,
+        help="Orden de ejecución según el histórico: primero los que fallaron recientemente "
+             "y después los más largos (failed-first), solo por duración (longest-first) o el de los ficheros"
+    )
+    parser.addoption(
+        "--perf-budgets", action="store_true", default=False,
+        help="Ejecuta los tests de presupuestos de carga de los page objects (marcador perf_budget)"
+    )
+    parser.addoption(
+        "--perf-repeats", type=int, default=TestData.PERF_REPEATS, metavar="N",
+        help="Cargas por página con las que se calcula el p95 de los presupuestos"
     )
 
+@pytest.hookimpl(trylast=True)
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "command_budget(n): falla el test si su fase call envía más de n comandos WebDriver"
+    )
+    config.addinivalue_line(
+        "markers",
+        "perf_budget: mide los presupuestos de carga de los page objects (solo con --perf-budgets)"
+    )
+
+    if TestData.IMPACT_RECORD:
+        impact.track_locators()
+
+    # trylast: el AllureFileLogger de allure-pytest ya está registrado
+    global allure_writer, test_history
+    if TestData.ASYNC_REPORTING and not config.option.collectonly:
+        allure_writer = BufferedAllureWriter.install()
+
+    if TestData.TEST_HISTORY and not config.option.collectonly:
+        test_history = TestHistory()
+
+def pytest_unconfigure(config):
+    """
+    Vuelca los resultados de Allure pendientes y cierra el histórico al terminar la sesión
+    """
+    global allure_writer, test_history
+    if allure_writer:
+        try:
+            allure_writer.uninstall()
+        except Exception as e:
+            warnings.warn(f"No se pudieron escribir los resultados de Allure pendientes: {type(e).__name__}: {e}")
+        allure_writer = None
+
+    if test_history:
+        test_history.close()
+        test_history = None
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Con --impact-base deselecciona los tests que no usan ningún page object
+    ni localizador modificado respecto a la referencia indicada, y con
+    --order reordena los restantes según el histórico de ejecuciones. Los
+    tests perf_budget se omiten salvo con --perf-budgets
+    """
+    if not config.getoption("perf_budgets"):
+        skip_perf = pytest.mark.skip(reason="presupuestos de carga: ejecutar con --perf-budgets")
+        for item in items:
+            if item.get_closest_marker("perf_budget"):
+                item.add_marker(skip_perf)
+
+    base = config.getoption("impact_base")
+    if base:
+        selected, deselected = impact.select(items, base, str(config.rootpath))
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = selected
+
+    mode = config.getoption("order")
+    if mode != "file" and os.path.exists(TestData.HISTORY_DB):
+        history = test_history or TestHistory()
+        by_nodeid = {item.nodeid: item for item in items}
+        items[:] = [by_nodeid[nodeid] for nodeid in history.order(list(by_nodeid), mode)]
+        if history is not test_history:
+            history.close()
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    """
+    Hook para contar por separado los comandos de la fase call y aplicar
+    el presupuesto del marcador command_budget
+    """
+    counter = getattr(item, "_command_counter", None)
+    if counter:
+        counter.phase = "call"
+
+    outcome = yield
+
+    if counter:
+        counter.phase = "teardown"
+        marker = item.get_closest_marker("command_budget")
+        if marker and outcome.excinfo is None:
+            error = counter.budget_error(marker.args[0])
+            if error:
+                outcome.force_exception(pytest.fail.Exception(error, pytrace=False))
+
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     """
@@ -51,4 +261,41 @@ def pytest_runtest_makereport(item, call):
     """
     outcome = yield
     rep = outcome.get_result()
-    setattr(item, "rep_" + rep.when, rep)
\ No newline at end of file
+    setattr(item, "rep_" + rep.when, rep)
+
+    # Resultado y duración por fase para el histórico
+    if test_history:
+        test_history.add_report(rep)
+
+    # Ante un fallo se vuelca el buffer de Allure para no perder nada
+    if rep.failed and allure_writer:
+        try:
+            allure_writer.flush()
+        except Exception as e:
+            # Un error al escribir el reporte no debe ocultar el resultado del test
+            warnings.warn(f"No se pudieron escribir los resultados de Allure pendientes: {type(e).__name__}: {e}")
+
+def pytest_sessionfinish(session):
+    """
+    Escribe los screenshots pendientes y guarda el mapa de impacto y la
+    ejecución en el histórico (del que se reparte la ejecución paralela)
+    """
+    screenshot_pipeline.drain()
+
+    if _impact_symbols:
+        impact_map = impact.ImpactMap()
+        impact_map.update(_impact_symbols)
+        impact_map.save()
+
+    if test_history:
+        test_history.save_run(worker=os.getenv("PYTEST_WORKER_ID"))
+
+def pytest_terminal_summary(terminalreporter):
+    """
+    Muestra el tiempo de arranque de los drivers creados en la sesión
+    """
+    report = startup_report()
+    if report:
+        terminalreporter.write_sep("-", "Arranque de drivers")
+        for line in report.splitlines():
+            terminalreporter.write_line(line)
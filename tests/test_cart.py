@@ -20,7 +20,7 @@ class TestCart:
     cart_page: CartPage
 
     @pytest.fixture(autouse=True)
-    def setup(self, setup_driver):
+    def setup(self, setup_driver, login_mode):
         """Configuración inicial de la prueba"""
         self.driver = setup_driver
         self.login_page = LoginPage(self.driver)
@@ -28,10 +28,11 @@ class TestCart:
         self.cart_page = CartPage(self.driver)
 
         # Navegar y hacer login
-        self.driver.get(Environment.get_environment_config()["url"])
-        self.login_page.login(
+        self.login_page.open(Environment.get_environment_config()["url"])
+        self.login_page.login_as(
             username=Environment.ENVIRONMENTS["dev"]["username"],
-            password=Environment.ENVIRONMENTS["dev"]["password"]
+            password=Environment.ENVIRONMENTS["dev"]["password"],
+            mode=login_mode
         )
 
     def log_cart_state(self, items: List[dict], description: str):
@@ -52,6 +53,7 @@ class TestCart:
 
     @allure.story("Operaciones del carrito")
     @allure.severity(allure.severity_level.CRITICAL)
+    @pytest.mark.command_budget(20)
     @pytest.mark.parametrize("test_case,items,action", [
         (
                 "Agregar un item",
@@ -79,8 +81,9 @@ class TestCart:
         """
         with allure.step(f"Ejecutar {test_case}"):
             if action == "add":
+                added = self.inventory_page.add_items_to_cart(items)
                 for item in items:
-                    assert self.inventory_page.add_item_to_cart(item), \
+                    assert added[item], \
                         f"No se pudo agregar el item: {item}"
                 self.inventory_page.go_to_cart()
 
@@ -91,13 +94,13 @@ class TestCart:
 
             elif action == "remove":
                 # Primero añadimos los items
-                for item in items:
-                    self.inventory_page.add_item_to_cart(item)
+                self.inventory_page.add_items_to_cart(items)
                 self.inventory_page.go_to_cart()
 
                 # Luego los removemos
+                removed = self.cart_page.remove_items(items)
                 for item in items:
-                    assert self.cart_page.remove_item(item), \
+                    assert removed[item], \
                         f"No se pudo remover el item: {item}"
 
                 cart_items = self.cart_page.get_cart_items()
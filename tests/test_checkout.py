@@ -1,13 +1,11 @@
 # tests/test_checkout.py
 import allure
 import pytest
+from decimal import Decimal
 from typing import Dict
 from selenium import webdriver
 from config.config import TestData, Environment, get_chrome_options
-from pages.login_page import LoginPage
-from pages.inventory_page import InventoryPage
-from pages.cart_page import CartPage
-from pages.checkout_page import CheckoutPage
+from pages.flows import CheckoutJourney
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support.wait import WebDriverWait
 
@@ -18,33 +16,29 @@ class TestCheckout:
     driver: WebDriver
     wait: WebDriverWait
     env_config: dict
-    login_page: LoginPage
-    inventory_page: InventoryPage
-    cart_page: CartPage
-    checkout_page: CheckoutPage
+    journey: CheckoutJourney
 
     @pytest.fixture(autouse=True)
-    def setup(self, setup_driver):
+    def setup(self, setup_driver, login_mode):
         """Configuración inicial de la prueba"""
         self.driver = setup_driver
-        self.login_page = LoginPage(self.driver)
-        self.inventory_page = InventoryPage(self.driver)
-        self.cart_page = CartPage(self.driver)
-        self.checkout_page = CheckoutPage(self.driver)
+        # Mismo recorrido que el generador de carga (utils/load_generator.py)
+        self.journey = CheckoutJourney(self.driver, step=allure.step)
 
         # Navegar y hacer login
-        self.driver.get(Environment.get_environment_config()["url"])
-        self.login_page.login(
+        self.journey.login(
+            Environment.get_environment_config()["url"],
             username=Environment.ENVIRONMENTS["dev"]["username"],
-            password=Environment.ENVIRONMENTS["dev"]["password"]
+            password=Environment.ENVIRONMENTS["dev"]["password"],
+            mode=login_mode
         )
 
 
-    def log_purchase_summary(self, summary: Dict[str, str]):
+    def log_purchase_summary(self, summary: Dict[str, Decimal]):
         """
         Registra el resumen de la compra en Allure
         Args:
-            summary (Dict[str, str]): Información del resumen de compra
+            summary (Dict[str, Decimal]): Importes del resumen de compra
         """
         allure.attach(
             '\n'.join(f"{key}: {value}" for key, value in summary.items()),
@@ -54,6 +48,7 @@ class TestCheckout:
 
     @allure.story("Proceso de checkout")
     @allure.severity(allure.severity_level.CRITICAL)
+    @pytest.mark.command_budget(40)
     @pytest.mark.parametrize("customer_info,items", [
         (
                 {
@@ -80,35 +75,14 @@ class TestCheckout:
             items (list): Lista de items a comprar
         """
         with allure.step("Agregar items al carrito"):
+            self.journey.add_to_cart(items)
             for item in items:
-                assert self.inventory_page.add_item_to_cart(item), \
-                    f"No se pudo agregar el item: {item}"
                 allure.attach(
                     f"Item agregado: {item}",
                     'Agregar al carrito',
                     allure.attachment_type.TEXT
                 )
-            self.inventory_page.go_to_cart()
 
-        with allure.step("Iniciar checkout"):
-            self.cart_page.proceed_to_checkout()
-
-        with allure.step("Completar información de envío"):
-            self.checkout_page.fill_checkout_info(**customer_info)
-            """
-            allure.attach(
-                str(customer_info),
-                'Información del cliente',
-                allure.attachment_type.TEXT
-            )
-            """
-
-        with allure.step("Verificar resumen de compra"):
-            summary = self.checkout_page.get_summary_info()
-            self.log_purchase_summary(summary)
-            assert "$" in summary["total"], "El total no incluye el símbolo de dólar"
-
-        with allure.step("Completar compra"):
-            self.checkout_page.complete_purchase()
-            assert self.checkout_page.is_purchase_successful(), \
-                "La compra no se completó exitosamente"
\ No newline at end of file
+        # Iniciar checkout, completar envío, verificar resumen y completar compra
+        summary = self.journey.checkout(customer_info)
+        self.log_purchase_summary(summary)
\ No newline at end of file
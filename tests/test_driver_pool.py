@@ -0,0 +1,133 @@
+# tests/test_driver_pool.py
+import allure
+import pytest
+from selenium.common import WebDriverException
+from utils.driver_pool import DriverPool
+
+
+class FakeSwitchTo:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, handle):
+        self.driver.current = handle
+
+
+class FakeDriver:
+    """Driver mínimo: ventanas con historial de navegación, cookies y registro de comandos CDP"""
+
+    def __init__(self, history=None, alive=True):
+        self.history = history or {"main": ["https://www.saucedemo.com/inventory.html"]}
+        self.current = "main"
+        self.cookies = [{"name": "session-username"}]
+        self.alive = alive
+        self.cdp = []
+        self.quit_calls = 0
+        self.switch_to = FakeSwitchTo(self)
+
+    @property
+    def window_handles(self):
+        if not self.alive:
+            raise WebDriverException("sesión cerrada")
+        return list(self.history)
+
+    @property
+    def current_url(self):
+        return self.history[self.current][-1]
+
+    def close(self):
+        del self.history[self.current]
+
+    def execute_script(self, script):
+        pass
+
+    def execute_cdp_cmd(self, command, params):
+        self.cdp.append((command, params))
+        if command == "Page.getNavigationHistory":
+            return {"entries": [{"url": url} for url in self.history[self.current]]}
+        if command == "Network.clearBrowserCookies":
+            self.cookies = []
+        return {}
+
+    def delete_all_cookies(self):
+        self.cookies = []
+
+    def get_cookies(self):
+        return self.cookies
+
+    def get(self, url):
+        self.history[self.current].append(url)
+
+    def implicitly_wait(self, seconds):
+        pass
+
+    def quit(self):
+        self.quit_calls += 1
+
+
+@allure.epic("Sauce Demo Testing")
+@allure.feature("Driver Pool")
+class TestDriverPool:
+
+    @pytest.fixture
+    def created(self):
+        return []
+
+    @pytest.fixture
+    def pool(self, created):
+        def factory():
+            created.append(FakeDriver())
+            return created[-1]
+        return DriverPool(factory, size=1, max_reuse=2)
+
+    @allure.story("Reutilización entre tests")
+    def test_release_and_reuse(self, pool, created):
+        driver = pool.acquire()
+        pool.release(driver)
+        assert pool.acquire() is driver
+        assert len(created) == 1
+
+    @allure.story("Reciclado tras el máximo de usos")
+    def test_max_reuse(self, pool, created):
+        for _ in range(2):
+            driver = pool.acquire()
+            pool.release(driver)
+        assert created[0].quit_calls == 1
+        assert pool.acquire() is not created[0]
+
+    @allure.story("Descarte tras un fallo")
+    def test_failed_test_discards_driver(self, pool, created):
+        pool.release(pool.acquire(), reusable=False)
+        assert created[0].quit_calls == 1
+        assert pool.acquire() is not created[0]
+
+    @allure.story("Health check al entregar")
+    def test_dead_idle_driver_is_replaced(self, pool, created):
+        driver = pool.acquire()
+        pool.release(driver)
+        driver.alive = False
+        assert pool.acquire() is not driver
+        assert driver.quit_calls == 1
+
+    @allure.story("Limpieza del estado")
+    def test_reset_clears_every_visited_origin(self):
+        driver = FakeDriver({
+            "main": ["https://www.saucedemo.com/", "http://127.0.0.1:8000/cart.html"],
+            "popup": ["https://saucelabs.com/pricing"]
+        })
+        assert DriverPool.reset(driver)
+        cleared = {params["origin"] for command, params in driver.cdp if command == "Storage.clearDataForOrigin"}
+        assert cleared == {"https://www.saucedemo.com", "http://127.0.0.1:8000", "https://saucelabs.com"}
+        assert driver.window_handles == ["main"] and driver.current_url == "about:blank"
+
+    @allure.story("Limpieza del estado")
+    def test_failed_reset_discards_driver(self, pool, created):
+        driver = pool.acquire()
+
+        def failing_cdp(command, params):
+            raise WebDriverException("CDP no disponible")
+        driver.execute_cdp_cmd = failing_cdp
+        driver.cookies = [{"name": "session-username"}]
+        driver.delete_all_cookies = lambda: None
+        pool.release(driver)
+        assert driver.quit_calls == 1
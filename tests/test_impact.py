@@ -0,0 +1,65 @@
+# tests/test_impact.py
+import ast
+import subprocess
+import allure
+import pytest
+from utils import impact
+
+BASE_PAGE = "pages/base_page.py"
+
+
+def line_of(source, text):
+    """Primera línea (1-based) que contiene el texto"""
+    return next(number for number, line in enumerate(source.splitlines(), 1) if text in line)
+
+
+@pytest.fixture(scope="module")
+def base_page():
+    with open(BASE_PAGE, encoding="utf-8") as f:
+        source = f.read()
+    return source, ast.parse(source, BASE_PAGE)
+
+
+@allure.epic("Sauce Demo Testing")
+@allure.feature("Impact Selection")
+class TestPageChange:
+
+    @allure.story("Cambios asociables a un método")
+    def test_method_change(self, base_page):
+        source, tree = base_page
+        assert impact._page_change(tree, line_of(source, "def is_present(")) == "BasePage.is_present"
+
+    @allure.story("Cambios que ejecutan toda la suite")
+    @pytest.mark.parametrize("text", [
+        "def __init_subclass__(",    # método especial
+        "def page_transition(",      # función de módulo
+        "from typing import",        # import
+        "key_element: str",          # campo de una dataclass
+    ])
+    def test_change_runs_everything(self, base_page, text):
+        source, tree = base_page
+        assert impact._page_change(tree, line_of(source, text)) == impact.ALL
+
+
+def git(root, *args):
+    subprocess.run(["git", "-C", str(root), *args], check=True, capture_output=True)
+
+
+@allure.epic("Sauce Demo Testing")
+@allure.feature("Impact Selection")
+class TestChangedSymbols:
+
+    @allure.story("Cambios que ejecutan toda la suite")
+    @pytest.mark.parametrize("path", ["resources/saucedemo/app.js", "requirements.txt"])
+    def test_non_python_change_runs_everything(self, tmp_path, path):
+        changed = tmp_path / path
+        changed.parent.mkdir(parents=True, exist_ok=True)
+        changed.write_text("original\n")
+        git(tmp_path, "init", "-q")
+        git(tmp_path, "add", "-A")
+        git(tmp_path, "-c", "user.name=test", "-c", "user.email=test@example.com", "commit", "-q", "-m", "base")
+        changed.write_text("modificado\n")
+
+        assert impact.changed_symbols("HEAD", str(tmp_path)) == {impact.ALL}
+        items = ["test_a", "test_b"]
+        assert impact.select(items, "HEAD", str(tmp_path)) == (items, [])
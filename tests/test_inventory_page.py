@@ -0,0 +1,81 @@
+# tests/test_inventory_page.py
+import threading
+import time
+import allure
+import pytest
+from selenium.common import NoSuchElementException
+from selenium.webdriver.common.by import By
+from pages.inventory_page import InventoryPage
+
+# Wait implícito del driver simulado: una búsqueda sin resultados lo agota
+IMPLICIT_WAIT = 1.0
+
+
+class FakeElement:
+    def __init__(self, text=""):
+        self.text = text
+
+
+class FakeDriver:
+    """Driver mínimo con la cabecera de inventario y semántica de wait implícito"""
+
+    def __init__(self, badge=None):
+        self.session_id = "fake"
+        self.timeouts = type("Timeouts", (), {"implicit_wait": IMPLICIT_WAIT})()
+        self.implicit_wait = IMPLICIT_WAIT
+        self.elements = {(By.ID, "shopping_cart_container"): FakeElement()}
+        if badge is not None:
+            self.elements[(By.CLASS_NAME, InventoryPage.CART_BADGE)] = FakeElement(badge)
+
+    def execute_script(self, script, button_ids):
+        return [(By.ID, button_id) in self.elements for button_id in button_ids]
+
+    def implicitly_wait(self, seconds):
+        self.implicit_wait = seconds
+
+    def find_elements(self, by, value):
+        element = self.elements.get((by, value))
+        if element is None:
+            time.sleep(self.implicit_wait)
+            return []
+        return [element]
+
+    def find_element(self, by, value):
+        elements = self.find_elements(by, value)
+        if not elements:
+            raise NoSuchElementException(value)
+        return elements[0]
+
+
+@allure.epic("Sauce Demo Testing")
+@allure.feature("Inventory")
+@pytest.mark.filterwarnings("ignore::pages.base_page.MixedWaitsWarning")
+class TestCartCount:
+
+    @allure.story("Contador del carrito")
+    def test_empty_cart_returns_immediately(self):
+        page = InventoryPage(FakeDriver())
+        start = time.perf_counter()
+        assert page.get_cart_count() == 0
+        assert time.perf_counter() - start < 0.1
+
+    @allure.story("Contador del carrito")
+    def test_cart_count_reads_badge(self):
+        assert InventoryPage(FakeDriver(badge="2")).get_cart_count() == 2
+
+
+@allure.epic("Sauce Demo Testing")
+@allure.feature("Inventory")
+@pytest.mark.filterwarnings("ignore::pages.base_page.MixedWaitsWarning")
+class TestAddItems:
+
+    @allure.story("Alta de items en lote")
+    def test_waits_for_inventory_to_render(self):
+        driver = FakeDriver()
+        # El listado aparece poco después de la navegación
+        threading.Timer(0.2, driver.elements.update, [{
+            (By.CLASS_NAME, InventoryPage.INVENTORY_ITEM): FakeElement(),
+            (By.ID, "add-to-cart-sauce-labs-backpack"): FakeElement()
+        }]).start()
+        added = InventoryPage(driver).add_items_to_cart(["Sauce Labs Backpack", "Unknown"])
+        assert added == {"Sauce Labs Backpack": True, "Unknown": False}
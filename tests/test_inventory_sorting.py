@@ -21,17 +21,18 @@ class TestInventorySorting:
 
 
     @pytest.fixture(autouse=True)
-    def setup(self, setup_driver):
+    def setup(self, setup_driver, login_mode):
         """Configuración inicial de la prueba"""
         self.driver = setup_driver
         self.login_page = LoginPage(self.driver)
         self.inventory_page = InventoryPage(self.driver)
 
         # Navegar y hacer login
-        self.driver.get(Environment.get_environment_config()["url"])
-        self.login_page.login(
+        self.login_page.open(Environment.get_environment_config()["url"])
+        self.login_page.login_as(
             username=Environment.ENVIRONMENTS["dev"]["username"],
-            password=Environment.ENVIRONMENTS["dev"]["password"]
+            password=Environment.ENVIRONMENTS["dev"]["password"],
+            mode=login_mode
         )
 
 
@@ -85,6 +86,7 @@ class TestInventorySorting:
 
     @allure.story("Ordenamiento de productos por precio")
     @allure.severity(allure.severity_level.NORMAL)
+    @pytest.mark.command_budget(15)
     @pytest.mark.parametrize("sort_option,sort_type,reverse", [
         ('lohi', 'menor a mayor', False),
         ('hilo', 'mayor a menor', True)
@@ -113,6 +115,7 @@ class TestInventorySorting:
 
     @allure.story("Ordenamiento alfabético de productos")
     @allure.severity(allure.severity_level.NORMAL)
+    @pytest.mark.command_budget(15)
     @pytest.mark.parametrize("sort_option,sort_type,reverse", [
         ('az', 'A a Z', False),
         ('za', 'Z a A', True)
@@ -26,7 +26,7 @@ class TestLogin:
         self.driver = setup_driver
         self.login_page = LoginPage(self.driver)
         self.inventory_page = InventoryPage(self.driver)
-        self.driver.get(Environment.get_environment_config()["url"])
+        self.login_page.open(Environment.get_environment_config()["url"])
 
     @allure.story("Intentos de login")
     @allure.severity(allure.severity_level.CRITICAL)
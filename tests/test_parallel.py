@@ -0,0 +1,89 @@
+# tests/test_parallel.py
+import json
+import uuid
+from types import SimpleNamespace
+import allure
+from utils.parallel import merge_allure_results, result_statuses, schedule, worker_options
+from utils.run_history import TestHistory
+
+# Resultados de una ejecución en serie: (fullName, parámetros, estado)
+SERIAL_RESULTS = [
+    ("tests.test_cart.TestCart#test_cart_operations", [("test_case", "Agregar un item")], "passed"),
+    ("tests.test_cart.TestCart#test_cart_operations", [("test_case", "Remover items")], "failed"),
+    ("tests.test_login.TestLogin#test_login_scenarios", [("username", "locked_out_user")], "passed"),
+    ("tests.test_checkout.TestCheckout#test_checkout_process", [], "broken"),
+]
+
+
+def write_results(directory, results):
+    directory.mkdir(parents=True, exist_ok=True)
+    for full_name, parameters, status in results:
+        result = {
+            "fullName": full_name,
+            "status": status,
+            "parameters": [{"name": name, "value": value} for name, value in parameters]
+        }
+        # Allure nombra los ficheros con UUIDs, así que no colisionan entre workers
+        (directory / f"{uuid.uuid4()}-result.json").write_text(json.dumps(result))
+        (directory / f"{uuid.uuid4()}-attachment.txt").write_text(status)
+
+
+@allure.epic("Sauce Demo Testing")
+@allure.feature("Parallel Execution")
+class TestMergeAllureResults:
+
+    @allure.story("Los resultados fusionados equivalen a una ejecución en serie")
+    def test_merged_results_match_serial_run(self, tmp_path):
+        serial_dir = tmp_path / "serial"
+        write_results(serial_dir, SERIAL_RESULTS)
+
+        results_dir = tmp_path / "parallel"
+        worker_dirs = [results_dir / "worker-0", results_dir / "worker-1"]
+        write_results(worker_dirs[0], SERIAL_RESULTS[::2])
+        write_results(worker_dirs[1], SERIAL_RESULTS[1::2])
+
+        merge_allure_results([str(directory) for directory in worker_dirs], str(results_dir))
+
+        assert result_statuses([str(results_dir)]) == result_statuses([str(serial_dir)])
+        assert len(result_statuses([str(results_dir)])) == len(SERIAL_RESULTS)
+        assert not any(directory.exists() for directory in worker_dirs)
+
+
+def phase_reports(nodeid, seconds):
+    """Reportes setup/call/teardown de un test que pasa con la duración indicada en la fase call"""
+    return [SimpleNamespace(nodeid=nodeid, when=when, duration=seconds if when == "call" else 0.0,
+                            failed=False, skipped=False) for when in ("setup", "call", "teardown")]
+
+
+@allure.epic("Sauce Demo Testing")
+@allure.feature("Parallel Execution")
+class TestSchedule:
+
+    @allure.story("El reparto usa las duraciones del histórico")
+    def test_schedule_from_history(self, tmp_path):
+        history = TestHistory(str(tmp_path / "history.sqlite"))
+        for nodeid, seconds in [("t::long", 8.0), ("t::medium", 5.0), ("t::short_a", 3.0), ("t::short_b", 2.0)]:
+            for report in phase_reports(nodeid, seconds):
+                history.add_report(report)
+        history.save_run(worker="worker-0")
+        durations = history.durations(TestHistory.RECENT_RUNS)
+        history.close()
+
+        nodeids = ["t::short_a", "t::long", "t::new", "t::short_b", "t::medium"]
+        shards = schedule(nodeids, durations, workers=2)
+
+        # LPT: long (8) + short_a (3) frente a medium (5) + new (mediana: 4) + short_b (2),
+        # cada shard en el orden de colección
+        assert shards == [["t::short_a", "t::long"], ["t::new", "t::short_b", "t::medium"]]
+
+
+@allure.epic("Sauce Demo Testing")
+@allure.feature("Parallel Execution")
+class TestWorkerOptions:
+
+    @allure.story("Los workers reciben las opciones de la ejecución en serie")
+    def test_options_without_targets(self):
+        args = ["tests/", "-m", "critical", "-x", "-p", "no:cacheprovider", "--perf-budgets",
+                "--perf-repeats", "5", "-o", "log_cli=true", "tests/test_cart.py::TestCart"]
+        assert worker_options(args) == ["-m", "critical", "-x", "-p", "no:cacheprovider", "--perf-budgets",
+                                        "--perf-repeats", "5", "-o", "log_cli=true"]
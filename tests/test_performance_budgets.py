@@ -0,0 +1,69 @@
+# tests/test_performance_budgets.py
+import json
+import allure
+import pytest
+from selenium.webdriver.remote.webdriver import WebDriver
+from config.config import Environment
+from pages.cart_page import CartPage
+from pages.checkout_page import CheckoutPage
+from pages.inventory_page import InventoryPage
+from pages.login_page import LoginPage
+from utils import perf_budgets
+
+BUDGETED_PAGES = [LoginPage, InventoryPage, CartPage, CheckoutPage]
+
+
+@allure.epic("Sauce Demo Testing")
+@allure.feature("Performance Budgets")
+@pytest.mark.perf_budget
+class TestPerformanceBudgets:
+    """Presupuestos de carga de los page objects (solo con pytest --perf-budgets)"""
+    driver: WebDriver
+    login_page: LoginPage
+
+    @pytest.fixture(autouse=True)
+    def setup(self, setup_driver):
+        """Configuración inicial de la prueba"""
+        self.driver = setup_driver
+        self.login_page = LoginPage(self.driver)
+        self.url = Environment.get_environment_config()["url"]
+
+        # Una vez por driver (los drivers del pool se reutilizan entre tests)
+        if not hasattr(self.driver, "_key_element_observer"):
+            self.driver._key_element_observer = perf_budgets.install_observer(
+                self.driver, [page.BUDGET.key_element for page in BUDGETED_PAGES]
+            )
+
+    @allure.story("Tiempo hasta interactivo y peticiones por página")
+    @allure.severity(allure.severity_level.NORMAL)
+    @pytest.mark.parametrize("page", BUDGETED_PAGES, ids=lambda page: page.__name__)
+    def test_page_budget(self, page, request):
+        """
+        Carga la página N veces (--perf-repeats) y compara el p95 con page.BUDGET
+        Args:
+            page (type): Page object con presupuesto declarado
+        """
+        budget = page.BUDGET
+        repeats = request.config.getoption("perf_repeats")
+
+        with allure.step("Preparar sesión"):
+            self.login_page.open(self.url)
+            if budget.requires_login:
+                self.login_page.login_with_session(
+                    username=Environment.ENVIRONMENTS["dev"]["username"],
+                    password=Environment.ENVIRONMENTS["dev"]["password"]
+                )
+            else:
+                self.driver.delete_all_cookies()
+
+        with allure.step(f"Medir {budget.path} ({repeats} cargas)"):
+            samples = [perf_budgets.measure(self.driver, self.url, budget) for _ in range(repeats)]
+
+        summary, violations = perf_budgets.evaluate(samples, budget)
+        summary["observed"] = all(sample["observed"] for sample in samples)
+        allure.attach(
+            json.dumps({"summary": summary, "samples": samples}, indent=2),
+            name=f"Presupuesto de {page.__name__}",
+            attachment_type=allure.attachment_type.JSON
+        )
+        assert not violations, f"{page.__name__} excede su presupuesto: " + "; ".join(violations)
@@ -0,0 +1,170 @@
+# tests/test_visual.py
+import io
+import os
+import allure
+import pytest
+from selenium.webdriver.remote.webdriver import WebDriver
+from config.config import Environment, TestData
+from pages.login_page import LoginPage
+from utils import visual
+
+# Baseline de la página de login; sin ella el test se omite al recogerlo, sin arrancar Chrome
+LOGIN_CHECKPOINT = visual.checkpoint_name("LoginPage-formulario")
+
+# NumPy y Pillow son opcionales en utils/visual.py
+np = pytest.importorskip("numpy")
+Image = pytest.importorskip("PIL.Image")
+
+
+def to_png(pixels):
+    output = io.BytesIO()
+    Image.fromarray(pixels).save(output, format="PNG")
+    return output.getvalue()
+
+
+def login_frame():
+    """Imagen sintética con la estructura de la página de login"""
+    pixels = np.full((300, 400, 3), 240, dtype=np.uint8)
+    pixels[40:80, 100:300] = (20, 20, 20)      # logo
+    pixels[120:150, 100:300] = (255, 255, 255)  # usuario
+    pixels[170:200, 100:300] = (255, 255, 255)  # contraseña
+    pixels[230:260, 100:300] = (61, 220, 145)   # botón de login
+    return pixels
+
+
+class FakeDriver:
+    """Driver mínimo: devuelve siempre la misma captura y los rectángulos indicados"""
+
+    def __init__(self, pixels, rects=()):
+        self.png = to_png(pixels)
+        self.rects = [list(rect) for rect in rects]
+
+    def get_screenshot_as_png(self):
+        return self.png
+
+    def execute_script(self, script, element_ids):
+        return self.rects
+
+
+@allure.epic("Sauce Demo Testing")
+@allure.feature("Visual Regression")
+class TestVisualDiff:
+
+    @pytest.fixture(autouse=True)
+    def baselines(self, tmp_path, monkeypatch):
+        """Baselines y diffs en un directorio temporal"""
+        monkeypatch.setattr(visual, "baselines", visual.BaselineCache(str(tmp_path / "baselines")))
+        monkeypatch.setattr(TestData, "VISUAL_DIFFS_PATH", str(tmp_path / "diffs"))
+        monkeypatch.setattr(TestData, "VISUAL_UPDATE_BASELINES", False)
+        monkeypatch.setattr(TestData, "VISUAL_HASH_DISTANCE", -1)
+
+    def record(self, name, pixels):
+        visual.baselines.save(name, visual.Frame(to_png(pixels)))
+
+    @allure.story("Máscara de regiones ignoradas")
+    @pytest.mark.parametrize("region,ignored", [
+        ((2, 3, 4, 2), 8),
+        ((-5, -5, 3, 3), 0),        # por encima y a la izquierda del viewport
+        ((-2, -2, 4, 4), 4),        # parcialmente visible
+        ((8, 8, 10, 10), 4),        # se sale por abajo a la derecha
+        ((20, 20, 5, 5), 0),        # fuera de la imagen
+        ((1.5, 1.5, 1, 1), 4)       # coordenadas fraccionarias (devicePixelRatio)
+    ])
+    def test_mask(self, region, ignored):
+        mask = visual._mask(10, 10, [region])
+        assert mask.size - mask.sum() == ignored
+
+    @allure.story("Diff vectorizado")
+    def test_diff(self):
+        baseline = login_frame()
+        current = baseline.copy()
+        current[0:10, 0:10] = (0, 0, 0)              # 100 píxeles distintos
+        current[20:30, 0:10] = baseline[20:30, 0:10] + 5  # dentro de la tolerancia
+        mask = visual._mask(300, 400, [])
+
+        ratio, changed = visual.diff(current, baseline, mask, tolerance=16)
+        assert changed.sum() == 100
+        assert ratio == pytest.approx(100 / (300 * 400))
+
+        ratio, changed = visual.diff(current, baseline, visual._mask(300, 400, [(0, 0, 10, 10)]), tolerance=16)
+        assert changed.sum() == 0 and ratio == 0
+
+    @allure.story("Hash perceptual")
+    def test_perceptual_hash(self):
+        frame = login_frame()
+        mask = visual._mask(300, 400, [])
+        same = visual.perceptual_hash(frame.copy(), mask)
+        assert visual.hash_distance(visual.perceptual_hash(frame, mask), same) == 0
+
+        moved = np.roll(frame, 60, axis=0)
+        assert visual.hash_distance(visual.perceptual_hash(moved, mask), same) > 0
+
+        # Lo que cambia dentro de una región ignorada no altera el hash
+        masked = visual._mask(300, 400, [(100, 40, 200, 40)])
+        no_logo = frame.copy()
+        no_logo[40:80, 100:300] = 240
+        assert visual.perceptual_hash(no_logo, masked) == visual.perceptual_hash(frame, masked)
+
+    @allure.story("Checkpoint contra baseline")
+    def test_checkpoint_matches_baseline(self):
+        self.record("LoginPage-formulario", login_frame())
+        result = visual.checkpoint(FakeDriver(login_frame()), "LoginPage-formulario")
+        assert result["method"] == "digest"
+
+    @allure.story("Checkpoint contra baseline")
+    def test_checkpoint_ignores_regions(self):
+        self.record("LoginPage-formulario", login_frame())
+        current = login_frame()
+        current[40:80, 100:300] = (200, 0, 0)
+        result = visual.checkpoint(FakeDriver(current, rects=[(100, 40, 200, 40)]), "LoginPage-formulario",
+                                   ignore=["login_logo"])
+        assert result["ratio"] == 0
+
+    @allure.story("Checkpoint contra baseline")
+    def test_checkpoint_detects_change(self, tmp_path):
+        self.record("LoginPage-formulario", login_frame())
+        current = login_frame()
+        current[230:260, 100:300] = (226, 35, 26)  # botón de otro color
+        with pytest.raises(visual.VisualMismatchError, match="difiere de su baseline"):
+            visual.checkpoint(FakeDriver(current), "LoginPage-formulario")
+        assert (tmp_path / "diffs" / "LoginPage-formulario-diff.png").exists()
+
+    @allure.story("Checkpoint contra baseline")
+    def test_hash_precheck_is_opt_in(self, monkeypatch):
+        self.record("LoginPage-formulario", login_frame())
+        current = login_frame()
+        current[230:260, 100:300] = (226, 35, 26)
+        # El hash no distingue el cambio de color: con el pre-check activo se acepta sin diff
+        monkeypatch.setattr(TestData, "VISUAL_HASH_DISTANCE", 0)
+        assert visual.checkpoint(FakeDriver(current), "LoginPage-formulario")["method"] == "hash"
+
+    @allure.story("Checkpoint contra baseline")
+    def test_checkpoint_without_baseline_fails(self, tmp_path):
+        with pytest.raises(visual.MissingBaselineError):
+            visual.checkpoint(FakeDriver(login_frame()), "LoginPage-formulario")
+        assert not (tmp_path / "baselines" / "LoginPage-formulario.png").exists()
+
+
+@allure.epic("Sauce Demo Testing")
+@allure.feature("Visual Regression")
+class TestVisualCheckpoints:
+    driver: WebDriver
+    login_page: LoginPage
+
+    @pytest.fixture(autouse=True)
+    def setup(self, setup_driver):
+        """Configuración inicial de la prueba"""
+        self.driver = setup_driver
+        self.login_page = LoginPage(self.driver)
+        self.login_page.open(Environment.get_environment_config()["url"])
+
+    @allure.story("Página de login")
+    @allure.severity(allure.severity_level.MINOR)
+    @pytest.mark.skipif(
+        not os.path.exists(visual.baselines.path(LOGIN_CHECKPOINT)) and not TestData.VISUAL_UPDATE_BASELINES,
+        reason=f"Sin baseline {visual.baselines.path(LOGIN_CHECKPOINT)}: grábala con "
+               f"VISUAL_UPDATE_BASELINES=True pytest tests/test_visual.py"
+    )
+    def test_login_page_layout(self):
+        """Compara la página de login con su baseline (resources/visual_baselines)"""
+        self.login_page.visual_checkpoint("formulario")
@@ -0,0 +1,115 @@
+# utils/allure_writer.py
+"""
+Escritura asíncrona y por lotes de los resultados de Allure.
+
+allure-pytest escribe cada adjunto y cada resultado (con sus pasos) en disco
+de forma síncrona, dentro del propio test. BufferedAllureWriter sustituye al
+AllureFileLogger del plugin: encola esas escrituras en memoria y un único hilo
+de fondo las vuelca por lotes, en el mismo orden en que se produjeron.
+
+El buffer se vacía al fallar un test (flush) y al terminar la sesión (close).
+"""
+import queue
+import threading
+
+import allure_commons
+from allure_commons.logger import AllureFileLogger
+
+_STOP = object()
+
+
+class BufferedAllureWriter:
+    """Plugin de allure_commons que delega en AllureFileLogger desde un hilo de fondo"""
+
+    def __init__(self, file_logger, batch_size=50):
+        """
+        Args:
+            file_logger (AllureFileLogger): Logger original que escribe en disco
+            batch_size (int): Escrituras máximas procesadas por lote
+        """
+        self.file_logger = file_logger
+        self.batch_size = batch_size
+        self._queue = queue.Queue()
+        self._error = None
+        self._thread = threading.Thread(target=self._run, name="allure-writer", daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def install(cls):
+        """
+        Sustituye el AllureFileLogger registrado por un writer con buffer
+        Returns:
+            BufferedAllureWriter: El writer instalado, o None si Allure no escribe a disco
+        """
+        manager = allure_commons.plugin_manager
+        file_logger = next((plugin for plugin in manager.get_plugins()
+                            if isinstance(plugin, AllureFileLogger)), None)
+        if file_logger is None:
+            return None
+        manager.unregister(file_logger)
+        writer = cls(file_logger)
+        manager.register(writer)
+        return writer
+
+    def uninstall(self):
+        """Vacía el buffer y devuelve el AllureFileLogger original al plugin manager"""
+        manager = allure_commons.plugin_manager
+        manager.unregister(self)
+        manager.register(self.file_logger)
+        self.close()
+
+    @allure_commons.hookimpl
+    def report_result(self, result):
+        self._queue.put((self.file_logger.report_result, result))
+
+    @allure_commons.hookimpl
+    def report_container(self, container):
+        self._queue.put((self.file_logger.report_container, container))
+
+    @allure_commons.hookimpl
+    def report_attached_data(self, body, file_name):
+        self._queue.put((self.file_logger.report_attached_data, body, file_name))
+
+    @allure_commons.hookimpl
+    def report_attached_file(self, source, file_name):
+        # El fichero de origen podría cambiar o borrarse: se copia al momento,
+        # después de lo que ya estuviera en cola para conservar el orden
+        self.flush()
+        self.file_logger.report_attached_file(source, file_name)
+
+    def flush(self):
+        """Bloquea hasta que todo lo encolado esté escrito en disco"""
+        self._queue.join()
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def close(self):
+        """Vacía el buffer y detiene el hilo de escritura"""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+        self.flush()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            for task in batch:
+                try:
+                    if task is not _STOP:
+                        write, *args = task
+                        write(*args)
+                except Exception as e:
+                    if self._error is None:
+                        self._error = e
+                finally:
+                    self._queue.task_done()
+
+            if any(task is _STOP for task in batch):
+                return
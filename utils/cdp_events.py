@@ -0,0 +1,49 @@
+# utils/cdp_events.py
+import json
+
+
+class PerformanceLogReader:
+    """
+    Lee los eventos CDP que Chrome deja en el log "performance"
+    (capability goog:loggingPrefs) y los reparte entre los suscriptores.
+
+    Leer el log lo vacía, así que todos los consumidores de un mismo driver
+    deben compartir un único lector (ver for_driver).
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self._listeners = []
+
+    @classmethod
+    def for_driver(cls, driver):
+        """Devuelve el lector asociado al driver, creándolo la primera vez"""
+        reader = getattr(driver, "_performance_log_reader", None)
+        if reader is None:
+            reader = cls(driver)
+            driver._performance_log_reader = reader
+        return reader
+
+    def subscribe(self, listener):
+        """
+        Args:
+            listener (callable): Recibe (method, params) por cada evento CDP
+        """
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def poll(self):
+        """
+        Vacía el log del navegador y entrega los eventos a los suscriptores
+        Returns:
+            int: Número de eventos leídos
+        """
+        entries = self.driver.get_log("performance")
+        for entry in entries:
+            message = json.loads(entry["message"])["message"]
+            for listener in list(self._listeners):
+                listener(message["method"], message.get("params", {}))
+        return len(entries)
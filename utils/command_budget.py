@@ -0,0 +1,80 @@
+# utils/command_budget.py
+"""
+Conteo de comandos WebDriver por test y presupuestos de round-trips.
+
+Cada comando WebDriver es una petición HTTP al driver, así que su número es
+la principal fuente de latencia de la suite. setup_driver instala un
+CommandCounter en cada driver y el marcador @pytest.mark.command_budget(n)
+hace fallar el test si su fase call envía más de n comandos.
+"""
+from collections import Counter, defaultdict
+
+from utils.step_timing import install_command_hook, metered
+
+
+class CommandCounter:
+    """Cuenta y cronometra los comandos WebDriver enviados, por fase del test"""
+
+    PHASES = ("setup", "call", "teardown")
+
+    def __init__(self, backend="local"):
+        self.backend = backend
+        self.phase = "setup"
+        self.counts = {phase: Counter() for phase in self.PHASES}
+        self.durations = {phase: defaultdict(float) for phase in self.PHASES}
+        self._listeners = None
+
+    @classmethod
+    def attach(cls, driver):
+        counter = cls(getattr(driver, "_backend", "local"))
+        counter._listeners = install_command_hook(driver)
+        counter._listeners.append(counter._on_command)
+        return counter
+
+    def detach(self):
+        self._listeners.remove(self._on_command)
+
+    @metered
+    def _on_command(self, command, elapsed):
+        self.counts[self.phase][command] += 1
+        self.durations[self.phase][command] += elapsed
+
+    def total(self, phase="call"):
+        """Número de comandos enviados en una fase"""
+        return sum(self.counts[phase].values())
+
+    def summary(self):
+        """
+        Returns:
+            dict: Backend del driver y, por fase, total de comandos, tiempo,
+                latencia media y desglose por comando
+        """
+        summary = {"backend": self.backend}
+        summary.update({
+            phase: {
+                "commands": self.total(phase),
+                "time_ms": round(sum(self.durations[phase].values()) * 1000, 3),
+                "mean_ms": round(sum(self.durations[phase].values()) * 1000 / max(1, self.total(phase)), 3),
+                "by_command": {
+                    command: {
+                        "count": count,
+                        "time_ms": round(self.durations[phase][command] * 1000, 3)
+                    }
+                    for command, count in self.counts[phase].most_common()
+                }
+            }
+            for phase in self.PHASES
+        })
+        return summary
+
+    def budget_error(self, budget):
+        """
+        Returns:
+            str: Mensaje de error si la fase call superó el presupuesto, o None
+        """
+        used = self.total("call")
+        if used <= budget:
+            return None
+        top = ", ".join(f"{command}={count}" for command, count in self.counts["call"].most_common(5))
+        return (f"El test envió {used} comandos WebDriver y su presupuesto es {budget} "
+                f"(comandos más frecuentes: {top})")
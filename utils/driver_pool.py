@@ -0,0 +1,177 @@
+# utils/driver_pool.py
+import threading
+from urllib.parse import urlparse
+
+from selenium.common import WebDriverException
+
+from config.config import TestData
+
+
+class PooledDriver:
+    """Envoltorio con los metadatos de un driver gestionado por el pool"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.uses = 0
+
+
+class DriverPool:
+    """
+    Mantiene un conjunto de sesiones de Chrome "calientes" para reutilizarlas
+    entre tests en lugar de arrancar un navegador nuevo por cada uno.
+
+    Garantías de aislamiento:
+    - Cada driver se entrega a un único test a la vez.
+    - Antes de volver al pool se limpian cookies y storage (localStorage,
+      sessionStorage, IndexedDB, caché...) de todos los orígenes del historial
+      de sus ventanas, se cierran las ventanas extra y se navega a about:blank.
+    - Si la limpieza falla, el test falló o el driver alcanzó el máximo de
+      reutilizaciones, se descarta y se crea uno nuevo.
+    - Al entregarse se comprueba que la sesión siga viva (health check).
+    """
+
+    def __init__(self, factory, size=TestData.DRIVER_POOL_SIZE,
+                 max_reuse=TestData.DRIVER_POOL_MAX_REUSE):
+        """
+        Args:
+            factory (callable): Función sin argumentos que crea un driver nuevo
+            size (int): Número máximo de drivers ociosos que se conservan
+            max_reuse (int): Número de tests tras el cual se recicla un driver
+        """
+        self.factory = factory
+        self.size = size
+        self.max_reuse = max_reuse
+        self._idle = []
+        self._in_use = {}
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Entrega un driver sano, reutilizando uno ocioso si es posible
+        Returns:
+            WebDriver: Driver listo para el test
+        """
+        while True:
+            with self._lock:
+                entry = self._idle.pop() if self._idle else None
+            if entry is None:
+                entry = PooledDriver(self.factory())
+                break
+            if self.is_healthy(entry.driver):
+                break
+            self._discard(entry)
+
+        entry.uses += 1
+        # Restaurar el wait implícito por si el test anterior lo modificó
+        entry.driver.implicitly_wait(TestData.IMPLICIT_WAIT)
+        with self._lock:
+            self._in_use[id(entry.driver)] = entry
+        return entry.driver
+
+    def release(self, driver, reusable=True):
+        """
+        Devuelve un driver al pool tras limpiar su estado
+        Args:
+            driver (WebDriver): Driver entregado por acquire()
+            reusable (bool): False para forzar su descarte (p. ej. test fallido)
+        """
+        with self._lock:
+            entry = self._in_use.pop(id(driver), None)
+        if entry is None:
+            driver.quit()
+            return
+
+        if not reusable or entry.uses >= self.max_reuse or not self.reset(driver):
+            self._discard(entry)
+            return
+
+        with self._lock:
+            if len(self._idle) < self.size:
+                self._idle.append(entry)
+                return
+        self._discard(entry)
+
+    def shutdown(self):
+        """Cierra todos los drivers del pool, ociosos y en uso"""
+        with self._lock:
+            entries = self._idle + list(self._in_use.values())
+            self._idle = []
+            self._in_use = {}
+        for entry in entries:
+            self._discard(entry)
+
+    @staticmethod
+    def is_healthy(driver):
+        """
+        Comprueba que la sesión del driver siga respondiendo
+        Returns:
+            bool: True si la sesión está operativa
+        """
+        try:
+            return len(driver.window_handles) > 0
+        except WebDriverException:
+            return False
+
+    @staticmethod
+    def reset(driver):
+        """
+        Deja el navegador en un estado equivalente a una sesión recién creada
+        Returns:
+            bool: True si el estado quedó limpio
+        """
+        try:
+            handles = driver.window_handles
+            origins = set()
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                origins |= DriverPool.visited_origins(driver)
+                driver.close()
+            driver.switch_to.window(handles[0])
+            origins |= DriverPool.visited_origins(driver)
+
+            # Sin CDP (p. ej. backend remoto) solo se alcanza el storage del origen actual
+            if urlparse(driver.current_url).scheme in ("http", "https"):
+                driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+            driver.delete_all_cookies()
+            # Storage de todos los orígenes visitados, no solo del actual; si falla
+            # el driver no queda limpio y se descarta
+            for origin in sorted(origins):
+                driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+                driver.execute_cdp_cmd("DOMStorage.clear", {
+                    "storageId": {"securityOrigin": origin, "isLocalStorage": False}
+                })
+            try:
+                # Limpia también las cookies de otros dominios visitados
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            except (AttributeError, WebDriverException):
+                pass
+            driver.get("about:blank")
+
+            return len(driver.window_handles) == 1 and not driver.get_cookies()
+        except WebDriverException:
+            return False
+
+    @staticmethod
+    def visited_origins(driver):
+        """
+        Orígenes http(s) del historial de navegación de la ventana actual (CDP)
+        Returns:
+            set: Orígenes como 'https://www.saucedemo.com'; vacío si no hay CDP
+        """
+        try:
+            history = driver.execute_cdp_cmd("Page.getNavigationHistory", {})
+        except (AttributeError, WebDriverException):
+            return set()
+        origins = set()
+        for entry in history.get("entries", []):
+            url = urlparse(entry.get("url", ""))
+            if url.scheme in ("http", "https"):
+                origins.add(f"{url.scheme}://{url.netloc}")
+        return origins
+
+    @staticmethod
+    def _discard(entry):
+        try:
+            entry.driver.quit()
+        except WebDriverException:
+            pass
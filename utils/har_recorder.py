@@ -0,0 +1,236 @@
+# utils/har_recorder.py
+"""
+Registro HAR de las peticiones de red de cada test (opt-in, HAR_CAPTURE).
+
+Los eventos CDP Network.* del log "performance" se convierten en entradas
+HAR 1.2 y se escriben en reports/har/<test>.har a medida que terminan las
+peticiones, sin acumularlas en memoria:
+- el log del navegador se vacía cada HAR_POLL_COMMANDS comandos WebDriver,
+  de modo que tampoco crece el buffer de chromedriver en recorridos largos;
+  esas lecturas no cuentan en los contadores de comandos ni en los tiempos
+  por paso, así que activar el registro no cambia el resultado de los tests
+- solo se guardan las peticiones en curso, como mucho HAR_MAX_PENDING; al
+  superarlo la más antigua se escribe incompleta (_error: "evicted")
+
+setup_driver adjunta a Allure una copia comprimida (.har.gz) solo de los
+tests fallidos (incluidos los que exceden su presupuesto de comandos o de
+carga) o más lentos que HAR_SLOW_SECONDS.
+"""
+import gzip
+import json
+import os
+import re
+import shutil
+from datetime import datetime, timezone
+
+import allure
+
+from config.config import TestData
+from utils.cdp_events import PerformanceLogReader
+from utils.step_timing import install_command_hook, unmetered
+
+
+def _headers(headers):
+    return [{"name": name, "value": str(value)} for name, value in (headers or {}).items()]
+
+
+def _query_string(url):
+    query = url.split("?", 1)[1].split("#", 1)[0] if "?" in url else ""
+    pairs = [pair.split("=", 1) for pair in query.split("&") if pair]
+    return [{"name": pair[0], "value": pair[1] if len(pair) > 1 else ""} for pair in pairs]
+
+
+def _timings(timing, total_ms):
+    """
+    Fases HAR a partir de Network.ResourceTiming (milisegundos, -1 si no aplica)
+    Args:
+        timing (dict): response.timing del evento responseReceived, o None
+        total_ms (float): Duración total de la petición
+    """
+    if not timing:
+        return {"blocked": -1, "dns": -1, "connect": -1, "ssl": -1, "send": 0, "wait": 0,
+                "receive": round(total_ms, 3)}
+
+    def span(start, end):
+        return round(timing[end] - timing[start], 3) if timing.get(start, -1) >= 0 else -1
+
+    first = next((timing[key] for key in ("dnsStart", "connectStart", "sendStart") if timing.get(key, -1) >= 0), 0)
+    return {
+        "blocked": round(first, 3),
+        "dns": span("dnsStart", "dnsEnd"),
+        "connect": span("connectStart", "connectEnd"),
+        "ssl": span("sslStart", "sslEnd"),
+        "send": span("sendStart", "sendEnd"),
+        "wait": round(timing["receiveHeadersEnd"] - timing["sendEnd"], 3),
+        "receive": round(max(0.0, total_ms - timing["receiveHeadersEnd"]), 3)
+    }
+
+
+class HarRecorder:
+    """Escribe en streaming un HAR con las peticiones de un test"""
+
+    # Comandos que no disparan la lectura del log (el propio get_log entre ellos)
+    SKIPPED_COMMANDS = frozenset({"getLog"})
+
+    def __init__(self, path, max_pending=TestData.HAR_MAX_PENDING, poll_every=TestData.HAR_POLL_COMMANDS):
+        """
+        Args:
+            path (str): Fichero HAR a escribir
+            max_pending (int): Peticiones en curso que se conservan como máximo
+            poll_every (int): Comandos WebDriver entre lecturas del log del navegador
+        """
+        self.path = path
+        self.max_pending = max_pending
+        self.poll_every = poll_every
+        self.entries = 0
+        self.evicted = 0
+        self._pending = {}
+        self._commands = 0
+        self._file = None
+        self._reader = None
+        self._listeners = None
+
+    @classmethod
+    def attach(cls, driver, test_name):
+        """
+        Empieza a registrar las peticiones del driver; descarta las de tests anteriores
+        Args:
+            driver (WebDriver): Driver con el log "performance" habilitado
+            test_name (str): Node id del test (da nombre al fichero)
+        Returns:
+            HarRecorder: Registrador suscrito a los eventos del driver
+        """
+        name = re.sub(r"[^\w.-]+", "_", test_name).strip("_")
+        recorder = cls(os.path.join(TestData.HAR_PATH, f"{name}.har"))
+        recorder._start(getattr(driver, "_backend", "local"))
+        recorder._reader = PerformanceLogReader.for_driver(driver)
+        with unmetered(driver):
+            recorder._reader.poll()
+        recorder._reader.subscribe(recorder)
+        recorder._listeners = install_command_hook(driver)
+        recorder._listeners.append(recorder._on_command)
+        return recorder
+
+    def detach(self):
+        """
+        Lee los eventos pendientes, deja de registrar y cierra el HAR
+        Returns:
+            str: Ruta del fichero escrito
+        """
+        self._listeners.remove(self._on_command)
+        try:
+            self._poll()
+        finally:
+            # Aunque falle la lectura, el driver (quizá del pool) queda sin
+            # suscripción y el fichero se cierra como JSON válido
+            self._reader.unsubscribe(self)
+            # Las peticiones sin terminar (p. ej. conexiones abiertas) se escriben tal cual
+            for request_id in list(self._pending):
+                self._finish(request_id, None, error="unfinished")
+            self._file.write('\n], "_evicted": %d}}\n' % self.evicted)
+            self._file.close()
+        return self.path
+
+    def attach_to_allure(self):
+        """Adjunta a Allure una copia comprimida del HAR (tras detach)"""
+        gz_path = self.path + ".gz"
+        with open(self.path, "rb") as source, gzip.open(gz_path, "wb") as target:
+            shutil.copyfileobj(source, target)
+        allure.attach.file(gz_path, name=f"HAR ({self.entries} peticiones)", extension="har.gz")
+
+    def _start(self, backend):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._file = open(self.path, "w", encoding="utf-8")
+        header = {"version": "1.2", "creator": {"name": "saucedemo-automation", "version": "1.0"},
+                  "_backend": backend, "pages": []}
+        # Se deja abierta la lista de entradas y se cierra en detach()
+        self._file.write(json.dumps({"log": header})[:-2] + ', "entries": [\n')
+
+    def _on_command(self, command, elapsed):
+        if command in self.SKIPPED_COMMANDS:
+            return
+        self._commands += 1
+        if self._commands % self.poll_every == 0:
+            self._poll()
+
+    def _poll(self):
+        # get_log no debe contar en el presupuesto de comandos ni en los tiempos del test
+        with unmetered(self._reader.driver):
+            self._reader.poll()
+        self._file.flush()
+
+    def __call__(self, method, params):
+        request_id = params.get("requestId")
+        if method == "Network.requestWillBeSent":
+            if params.get("redirectResponse") and request_id in self._pending:
+                # Un redirect reutiliza el requestId: se cierra la petición anterior
+                self._pending[request_id]["response"] = params["redirectResponse"]
+                self._finish(request_id, params["timestamp"])
+            self._add(request_id, params)
+        elif request_id not in self._pending:
+            return
+        elif method == "Network.responseReceived":
+            self._pending[request_id]["response"] = params["response"]
+        elif method == "Network.loadingFinished":
+            self._pending[request_id]["transfer_size"] = params.get("encodedDataLength", -1)
+            self._finish(request_id, params["timestamp"])
+        elif method == "Network.loadingFailed":
+            self._finish(request_id, params["timestamp"], error=params.get("blockedReason") or params.get("errorText"))
+
+    def _add(self, request_id, params):
+        if len(self._pending) >= self.max_pending:
+            oldest = next(iter(self._pending))
+            self.evicted += 1
+            self._finish(oldest, None, error="evicted")
+        self._pending[request_id] = {
+            "request": params["request"],
+            "type": params.get("type", "Other"),
+            "wall_time": params.get("wallTime"),
+            "timestamp": params["timestamp"],
+            "response": None,
+            "transfer_size": -1
+        }
+
+    def _finish(self, request_id, timestamp, error=None):
+        """Convierte la petición en una entrada HAR y la escribe en el fichero"""
+        pending = self._pending.pop(request_id)
+        request, response = pending["request"], pending["response"] or {}
+        total_ms = (timestamp - pending["timestamp"]) * 1000 if timestamp else 0.0
+        started = datetime.fromtimestamp(pending["wall_time"], timezone.utc) if pending["wall_time"] else \
+            datetime.now(timezone.utc)
+        headers = response.get("headers", {})
+        entry = {
+            "startedDateTime": started.isoformat(timespec="milliseconds").replace("+00:00", "Z"),
+            "time": round(total_ms, 3),
+            "request": {
+                "method": request["method"],
+                "url": request["url"],
+                "httpVersion": response.get("protocol", ""),
+                "headers": _headers(request.get("headers")),
+                "queryString": _query_string(request["url"]),
+                "cookies": [],
+                "headersSize": -1,
+                "bodySize": len(request.get("postData", ""))
+            },
+            "response": {
+                "status": response.get("status", 0),
+                "statusText": response.get("statusText", ""),
+                "httpVersion": response.get("protocol", ""),
+                "headers": _headers(headers),
+                "cookies": [],
+                "content": {"size": -1, "mimeType": response.get("mimeType", "")},
+                "redirectURL": headers.get("location", headers.get("Location", "")),
+                "headersSize": -1,
+                "bodySize": pending["transfer_size"]
+            },
+            "cache": {},
+            "timings": _timings(response.get("timing"), total_ms),
+            "_resourceType": pending["type"]
+        }
+        if response.get("fromDiskCache"):
+            entry["_fromCache"] = "disk"
+        if error:
+            entry["_error"] = error
+
+        self._file.write((",\n" if self.entries else "") + json.dumps(entry, ensure_ascii=False))
+        self.entries += 1
@@ -0,0 +1,511 @@
+# utils/impact.py
+"""
+Selección de tests por impacto de los cambios en page objects y localizadores.
+
+Cada test se relaciona con los "símbolos" que usa:
+- métodos y atributos de clase de los page objects ("CartPage.remove_items")
+- claves de Locators ("Locators.CHECKOUT.first_name")
+
+La relación se obtiene de dos fuentes que se combinan:
+- estática: análisis AST de tests/ y pages/ (llamadas a page objects, uso de
+  Locators y llamadas internas entre métodos, incluidas las heredadas)
+- en ejecución: los métodos de page objects (vía timed_step) y las claves de
+  Locators leídas por cada test, guardadas en TestData.IMPACT_MAP_PATH
+
+Un git diff contra una referencia base se traduce a símbolos; solo se
+ejecutan los tests que usan alguno. Cualquier cambio que no se pueda
+asociar a símbolos concretos (imports, código de módulo de pages/, métodos
+especiales como __init_subclass__, dataclasses, TestData, utils/,
+conftest, ficheros que no son Python como resources/saucedemo o
+requirements.txt...) ejecuta la suite completa.
+
+El registro en ejecución es opt-in (IMPACT_RECORD=True); sin él la
+selección usa solo el análisis estático y el mapa ya guardado.
+"""
+import argparse
+import ast
+import json
+import os
+import re
+import subprocess
+
+from config.config import Locators, TestData
+
+# Símbolo que representa un cambio no asociable: se ejecuta todo
+ALL = "*"
+
+HUNK_PATTERN = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@")
+
+# Símbolos registrados por el test en curso (None si no se está registrando)
+_recording = None
+
+
+def record(symbol):
+    """Anota un símbolo usado por el test en curso"""
+    if _recording is not None:
+        _recording.add(symbol)
+
+
+def start_recording():
+    global _recording
+    _recording = set()
+
+
+def stop_recording():
+    """
+    Returns:
+        set: Símbolos usados desde start_recording()
+    """
+    global _recording
+    symbols, _recording = _recording or set(), None
+    return symbols
+
+
+class TrackedSection(dict):
+    """Sección de Locators que anota las claves leídas"""
+
+    def __init__(self, name, entries):
+        super().__init__(entries)
+        self.name = name
+
+    def __getitem__(self, key):
+        record(f"Locators.{self.name}.{key}")
+        return super().__getitem__(key)
+
+    def get(self, key, default=None):
+        record(f"Locators.{self.name}.{key}")
+        return super().get(key, default)
+
+
+def track_locators():
+    """Sustituye las secciones de Locators por versiones que registran su uso (idempotente)"""
+    for section in Locators.SECTIONS:
+        entries = getattr(Locators, section)
+        if not isinstance(entries, TrackedSection):
+            setattr(Locators, section, TrackedSection(section, entries))
+
+
+class ImpactMap:
+    """Almacén local (JSON) de los símbolos usados en ejecución por cada test"""
+
+    def __init__(self, path=TestData.IMPACT_MAP_PATH):
+        self.path = path
+        self.symbols = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.symbols = json.load(f)
+
+    def update(self, symbols):
+        """
+        Args:
+            symbols (dict): Símbolos usados por node id (sustituyen a los anteriores)
+        """
+        for nodeid, used in symbols.items():
+            self.symbols[nodeid] = sorted(used)
+
+    def save(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(self.symbols, f, indent=2, sort_keys=True)
+
+
+class PageIndex:
+    """Análisis estático de pages/: qué usa cada método de cada page object"""
+
+    def __init__(self, directory="pages"):
+        self.classes = {}
+        self.uses = {}
+        for file_name in sorted(os.listdir(directory)):
+            if file_name.endswith(".py"):
+                self._index_file(os.path.join(directory, file_name))
+        for class_name, info in self.classes.items():
+            # Flujos que componen page objects (pages/flows.py)
+            pages = _page_variables(info["node"], self)
+            for name, node in info["methods"].items():
+                self.uses[f"{class_name}.{name}"] = self._method_uses(class_name, node) | _function_symbols(node, pages, self)
+
+    def _index_file(self, path):
+        with open(path, encoding="utf-8") as f:
+            tree = ast.parse(f.read(), path)
+        for node in tree.body:
+            if not isinstance(node, ast.ClassDef):
+                continue
+            info = {
+                "bases": [base.id for base in node.bases if isinstance(base, ast.Name)],
+                "methods": {},
+                "attributes": set(),
+                "locators": {},
+                "node": node
+            }
+            for item in node.body:
+                if isinstance(item, ast.FunctionDef):
+                    info["methods"][item.name] = item
+                elif isinstance(item, (ast.Assign, ast.AnnAssign)):
+                    targets = item.targets if isinstance(item, ast.Assign) else [item.target]
+                    info["attributes"].update(t.id for t in targets if isinstance(t, ast.Name))
+            if "__init__" in info["methods"]:
+                info["locators"] = _locator_attributes(info["methods"]["__init__"])
+            self.classes[node.name] = info
+
+    def lookup(self, class_name, name):
+        """
+        Resuelve un método o atributo de clase siguiendo la herencia
+        Returns:
+            str: Símbolo "Clase.nombre" de la clase que lo define, o None
+        """
+        info = self.classes.get(class_name)
+        if info is None:
+            return None
+        if name in info["methods"] or name in info["attributes"]:
+            return f"{class_name}.{name}"
+        for base in info["bases"]:
+            symbol = self.lookup(base, name)
+            if symbol:
+                return symbol
+        return None
+
+    def _locator_of(self, class_name, attribute):
+        """Sección o clave de Locators asignada a self.<attribute> en algún __init__"""
+        info = self.classes.get(class_name)
+        if info is None:
+            return None
+        if attribute in info["locators"]:
+            return info["locators"][attribute]
+        for base in info["bases"]:
+            locator = self._locator_of(base, attribute)
+            if locator:
+                return locator
+        return None
+
+    def _method_uses(self, class_name, function):
+        uses = set()
+        for node in ast.walk(function):
+            if isinstance(node, ast.Subscript):
+                section = _locators_section(node.value)
+                if section is None and _is_self_attribute(node.value):
+                    locator = self._locator_of(class_name, node.value.attr)
+                    section = locator if locator and locator.count(".") == 1 else None
+                key = _constant(node.slice)
+                if section and key:
+                    uses.add(f"{section}.{key}")
+            elif isinstance(node, ast.Attribute):
+                if _is_self_attribute(node):
+                    symbol = self.lookup(class_name, node.attr)
+                    locator = self._locator_of(class_name, node.attr)
+                    if symbol:
+                        uses.add(symbol)
+                    elif locator and locator.count(".") == 2:
+                        uses.add(locator)
+                elif _is_super_call(node.value):
+                    info = self.classes[class_name]
+                    uses.update(filter(None, (self.lookup(base, node.attr) for base in info["bases"])))
+            elif isinstance(node, ast.Call) and _call_name(node) in ("find_fastest", "resolve"):
+                args = [_constant(arg) for arg in node.args[:2]]
+                if all(args) and len(args) == 2:
+                    uses.add(f"Locators.{args[0]}.{args[1]}")
+        uses.discard(f"{class_name}.{function.name}")
+        return uses
+
+    def closure(self, symbols):
+        """
+        Returns:
+            set: Los símbolos y todo lo que usan, transitivamente
+        """
+        result = set()
+        pending = list(symbols)
+        while pending:
+            symbol = pending.pop()
+            if symbol in result:
+                continue
+            result.add(symbol)
+            pending.extend(self.uses.get(symbol, ()))
+        return result
+
+
+def _constant(node):
+    return node.value if isinstance(node, ast.Constant) and isinstance(node.value, str) else None
+
+
+def _is_self_attribute(node):
+    return isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) and node.value.id in ("self", "cls")
+
+
+def _is_super_call(node):
+    return isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == "super"
+
+
+def _call_name(node):
+    func = node.func
+    return func.attr if isinstance(func, ast.Attribute) else getattr(func, "id", None)
+
+
+def _locators_section(node):
+    """'Locators.CART' para un nodo Locators.CART"""
+    if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) and node.value.id == "Locators":
+        return f"Locators.{node.attr}"
+    return None
+
+
+def _locator_attributes(init):
+    """Atributos de instancia asignados en __init__ a una sección o clave de Locators"""
+    locators = {}
+    for node in ast.walk(init):
+        if not isinstance(node, ast.Assign) or len(node.targets) != 1 or not _is_self_attribute(node.targets[0]):
+            continue
+        value = node.value
+        section = _locators_section(value)
+        if section is None and isinstance(value, ast.Subscript):
+            key = _constant(value.slice)
+            parent = _locators_section(value.value)
+            section = f"{parent}.{key}" if parent and key else None
+        if section:
+            locators[node.targets[0].attr] = section
+    return locators
+
+
+def symbols_by_test(path, index):
+    """
+    Análisis estático de un módulo de tests
+    Args:
+        path (str): Fichero de tests
+        index (PageIndex): Índice de page objects
+    Returns:
+        dict: (clase, función) -> símbolos de page objects usados directamente
+    """
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), path)
+
+    result = {}
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef):
+            pages = _page_variables(node, index)
+            methods = [item for item in node.body if isinstance(item, ast.FunctionDef)]
+            # Fixtures y helpers de la clase cuentan para todos sus tests
+            shared = set()
+            for method in methods:
+                if not method.name.startswith("test"):
+                    shared |= _function_symbols(method, pages, index)
+            for method in methods:
+                if method.name.startswith("test"):
+                    result[(node.name, method.name)] = shared | _function_symbols(method, pages, index)
+        elif isinstance(node, ast.FunctionDef) and node.name.startswith("test"):
+            result[(None, node.name)] = _function_symbols(node, _page_variables(node, index), index)
+    return result
+
+
+def _page_variables(scope, index):
+    """Nombres (variables o self.<atributo>) que contienen un page object"""
+    pages = {}
+    for node in ast.walk(scope):
+        if isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name) \
+                and isinstance(node.annotation, ast.Name) and node.annotation.id in index.classes:
+            pages[node.target.id] = node.annotation.id
+        elif isinstance(node, ast.Assign) and isinstance(node.value, ast.Call) \
+                and getattr(node.value.func, "id", None) in index.classes:
+            for target in node.targets:
+                name = target.attr if _is_self_attribute(target) else getattr(target, "id", None)
+                if name:
+                    pages[name] = node.value.func.id
+    return pages
+
+
+def _function_symbols(function, pages, index):
+    symbols = set()
+    for node in ast.walk(function):
+        if isinstance(node, ast.Call) and getattr(node.func, "id", None) in index.classes:
+            symbols.add(index.lookup(node.func.id, "__init__"))
+        elif isinstance(node, ast.Attribute):
+            owner = node.value
+            name = owner.attr if _is_self_attribute(owner) else getattr(owner, "id", None)
+            if name in pages:
+                symbols.add(index.lookup(pages[name], node.attr))
+    symbols.discard(None)
+    return symbols
+
+
+def changed_lines(base, root="."):
+    """
+    Líneas modificadas respecto a una referencia git (numeración del fichero actual)
+    Args:
+        base (str): Referencia git base
+        root (str): Raíz del repositorio
+    Returns:
+        dict: Ruta -> lista de líneas; None como lista si el fichero se borró
+    """
+    output = subprocess.run(
+        ["git", "-C", root, "diff", "-U0", "--no-color", base],
+        capture_output=True, text=True, check=True
+    ).stdout
+
+    changes = {}
+    current = old = None
+    in_header = False
+    for line in output.splitlines():
+        if line.startswith("diff --git "):
+            in_header = True
+        elif in_header and line.startswith("--- "):
+            old = line[4:]
+        elif in_header and line.startswith("+++ "):
+            new = line[4:]
+            if new == "/dev/null":
+                changes[old[2:]] = None
+                current = None
+            else:
+                current = changes.setdefault(new[2:], [])
+        elif line.startswith("@@"):
+            in_header = False
+            if current is None:
+                continue
+            match = HUNK_PATTERN.match(line)
+            start, count = int(match.group(1)), int(match.group(2) or 1)
+            # Un hunk solo de borrado se asocia a la línea anterior al corte
+            current.extend(range(start, start + count) if count else [max(start, 1)])
+    return changes
+
+
+def _first_line(node):
+    return min([node.lineno] + [decorator.lineno for decorator in getattr(node, "decorator_list", [])])
+
+
+def _innermost(tree, line):
+    """Cadena de nodos de clase/función/asignación que contienen la línea"""
+    chain = []
+    body = tree.body
+    while True:
+        node = next((n for n in body if _first_line(n) <= line <= n.end_lineno), None)
+        if node is None:
+            return chain
+        chain.append(node)
+        if not isinstance(node, ast.ClassDef):
+            return chain
+        body = node.body
+
+
+def _page_change(tree, line):
+    chain = _innermost(tree, line)
+    # Código de módulo (imports, decoradores como page_transition) y clases
+    # decoradas (dataclasses como PageBudget) no se asocian a un método
+    if len(chain) < 2 or not isinstance(chain[0], ast.ClassDef) or chain[0].decorator_list:
+        return ALL
+    class_name, member = chain[0].name, chain[1]
+    if isinstance(member, ast.FunctionDef) and member.name.startswith("__") and member.name.endswith("__"):
+        # __init_subclass__, __init__...: afectan a la clase y sus subclases enteras
+        return ALL
+    if isinstance(member, ast.FunctionDef):
+        return f"{class_name}.{member.name}"
+    if isinstance(member, (ast.Assign, ast.AnnAssign)):
+        targets = member.targets if isinstance(member, ast.Assign) else [member.target]
+        names = [target.id for target in targets if isinstance(target, ast.Name)]
+        if names:
+            return f"{class_name}.{names[0]}"
+    if isinstance(member, ast.Expr) and isinstance(member.value, ast.Constant):
+        return None  # docstring de la clase
+    return ALL
+
+
+def _config_change(tree, line):
+    chain = _innermost(tree, line)
+    if len(chain) < 2 or not isinstance(chain[0], ast.ClassDef) or chain[0].name != "Locators":
+        return ALL
+    member = chain[1]
+    if isinstance(member, ast.Expr) and isinstance(member.value, ast.Constant):
+        return None  # docstring de Locators
+    if not isinstance(member, ast.Assign) or not isinstance(member.value, ast.Dict):
+        return ALL
+    section = member.targets[0].id
+    if section not in Locators.SECTIONS:
+        return ALL
+    for key, value in zip(member.value.keys, member.value.values):
+        if key.lineno <= line <= value.end_lineno:
+            return f"Locators.{section}.{_constant(key)}"
+    return f"Locators.{section}.*"
+
+
+def changed_symbols(base, root="."):
+    """
+    Traduce el diff contra base a símbolos
+    Args:
+        base (str): Referencia git base
+        root (str): Raíz del repositorio
+    Returns:
+        set: Símbolos modificados, "file:<ruta>" para módulos de tests o ALL
+    """
+    symbols = set()
+    for path, lines in changed_lines(base, root).items():
+        if not path.endswith(".py") or lines is None:
+            # Ficheros borrados y cambios fuera de Python (réplica local, requirements,
+            # Makefile, baselines...) no se pueden asociar a símbolos
+            symbols.add(ALL)
+            continue
+        name = os.path.basename(path)
+        if path.startswith("tests/") and name.startswith("test_"):
+            symbols.add(f"file:{path}")
+            continue
+        if path.startswith("pages/") and name != "__init__.py":
+            mapper = _page_change
+        elif path == "config/config.py":
+            mapper = _config_change
+        else:
+            symbols.add(ALL)
+            continue
+        with open(os.path.join(root, path), encoding="utf-8") as f:
+            tree = ast.parse(f.read(), path)
+        symbols.update(filter(None, (mapper(tree, line) for line in lines)))
+    return symbols
+
+
+def _matches(changed, used):
+    for symbol in changed:
+        if symbol.endswith(".*"):
+            if any(name.startswith(symbol[:-1]) for name in used):
+                return True
+        elif symbol in used:
+            return True
+    return False
+
+
+def select(items, base, root=".", impact_map=None):
+    """
+    Separa los tests afectados por los cambios respecto a base
+    Args:
+        items (list): Items de pytest (con .nodeid, .path, .cls y .originalname)
+        base (str): Referencia git contra la que comparar (p. ej. origin/main)
+        root (str): Raíz del repositorio
+        impact_map (ImpactMap): Símbolos registrados en ejecuciones anteriores
+    Returns:
+        tuple: (seleccionados, deseleccionados)
+    """
+    changed = changed_symbols(base, root)
+    if ALL in changed:
+        return list(items), []
+
+    index = PageIndex(os.path.join(root, "pages"))
+    impact_map = impact_map or ImpactMap()
+    static = {}
+    selected, deselected = [], []
+    for item in items:
+        path = os.path.relpath(item.path, root).replace(os.sep, "/")
+        if path not in static:
+            static[path] = symbols_by_test(item.path, index)
+        key = (item.cls.__name__ if item.cls else None, item.originalname)
+        used = index.closure(static[path].get(key, set()) | set(impact_map.symbols.get(item.nodeid, ())))
+        used.add(f"file:{path}")
+        (selected if _matches(changed, used) else deselected).append(item)
+    return selected, deselected
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Muestra los símbolos modificados respecto a una referencia git")
+    parser.add_argument("--base", default="HEAD", help="Referencia git base (por defecto HEAD)")
+    args = parser.parse_args()
+    symbols = changed_symbols(args.base)
+    if ALL in symbols:
+        print("Cambios no asociables a page objects o localizadores: se ejecutaría toda la suite")
+    for symbol in sorted(symbols - {ALL}):
+        print(symbol)
+
+
+if __name__ == "__main__":
+    main()
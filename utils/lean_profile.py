@@ -0,0 +1,85 @@
+# utils/lean_profile.py
+"""
+Perfil de navegación "lean": bloquea mediante CDP las peticiones que las
+aserciones nunca usan (imágenes, fuentes, scripts de terceros...) y cuenta
+por test las peticiones permitidas y bloqueadas.
+
+Se activa con LEAN_MODE=True (ver TestData y get_chrome_options).
+"""
+from collections import Counter
+
+from config.config import TestData
+from utils.cdp_events import PerformanceLogReader
+
+# Patrones de URL equivalentes a cada tipo de recurso de CDP
+RESOURCE_TYPE_PATTERNS = {
+    "Image": ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico"],
+    "Font": ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"],
+    "Media": ["*.mp4", "*.webm", "*.mp3", "*.ogg", "*.wav"],
+    "Stylesheet": ["*.css"]
+}
+
+
+def blocked_url_patterns():
+    """
+    Patrones de URL a bloquear: los configurados más los de cada tipo de recurso
+    Returns:
+        list: Patrones con comodines en el formato de Network.setBlockedURLs
+    """
+    patterns = list(TestData.LEAN_BLOCKED_URLS)
+    for resource_type in TestData.LEAN_BLOCKED_RESOURCE_TYPES:
+        patterns.extend(RESOURCE_TYPE_PATTERNS.get(resource_type, []))
+    return patterns
+
+
+def apply_lean_profile(driver):
+    """Activa el bloqueo de peticiones en el navegador mediante CDP"""
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": blocked_url_patterns()})
+
+
+class RequestCounter:
+    """Cuenta las peticiones de red permitidas y bloqueadas durante un test"""
+
+    def __init__(self):
+        self._types = {}
+        self.blocked = Counter()
+
+    @classmethod
+    def attach(cls, driver):
+        """
+        Empieza a contar las peticiones del driver; descarta las de tests anteriores
+        Returns:
+            RequestCounter: Contador suscrito a los eventos del driver
+        """
+        counter = cls()
+        counter._reader = PerformanceLogReader.for_driver(driver)
+        counter._reader.poll()
+        counter._reader.subscribe(counter)
+        return counter
+
+    def detach(self):
+        """
+        Deja de contar y devuelve el resumen
+        Returns:
+            dict: Totales de peticiones permitidas y bloqueadas (por tipo de recurso)
+        """
+        self._reader.poll()
+        self._reader.unsubscribe(self)
+        return self.summary()
+
+    def __call__(self, method, params):
+        if method == "Network.requestWillBeSent":
+            self._types[params["requestId"]] = params.get("type", "Other")
+        elif method == "Network.loadingFailed" and params.get("blockedReason"):
+            self.blocked[self._types.get(params["requestId"], params.get("type", "Other"))] += 1
+
+    def summary(self):
+        total = len(self._types)
+        blocked = sum(self.blocked.values())
+        return {
+            "total": total,
+            "allowed": total - blocked,
+            "blocked": blocked,
+            "blocked_by_type": dict(self.blocked)
+        }
@@ -0,0 +1,240 @@
+# utils/load_generator.py
+"""
+Generador de carga sintética sobre los page objects.
+
+Lanza K sesiones de Chrome concurrentes, cada una repitiendo el mismo
+recorrido de compra que test_checkout_process (pages/flows.py) durante un
+tiempo fijo o un número de iteraciones. Por cada paso del recorrido (login,
+add_to_cart, checkout) informa del throughput, los errores y la latencia
+p50/p95/p99.
+
+Por defecto se ejecuta contra la réplica local (ambiente "local"), que se
+arranca automáticamente; LOCAL_LATENCY_MS simula la latencia del servidor.
+
+Uso:
+    python -m utils.load_generator --users 4 --duration 60
+    python -m utils.load_generator --users 2 --iterations 10 --env dev
+"""
+import argparse
+import json
+import os
+import threading
+import time
+from contextlib import nullcontext
+
+from selenium.common import WebDriverException
+
+from config.config import Environment, TestData
+from pages.flows import CheckoutJourney
+from utils.driver_pool import DriverPool
+from utils.local_server import LocalSiteServer
+from utils.stats import percentile
+from utils.webdriver_manager import create_driver
+
+DEFAULT_ITEMS = ["Sauce Labs Backpack", "Sauce Labs Bike Light"]
+DEFAULT_CUSTOMER = {"first_name": "Load", "last_name": "Test", "postal_code": "12345"}
+
+
+class LoadResults:
+    """Latencias y errores por paso, compartidos por todos los usuarios virtuales"""
+
+    def __init__(self):
+        self.samples = {step: [] for step in CheckoutJourney.STEPS}
+        self.errors = {step: 0 for step in CheckoutJourney.STEPS}
+        self.journeys = 0
+        self.startup_errors = 0
+        self.replaced_drivers = 0
+        self.started = time.perf_counter()
+        self.finished = None
+        self._lock = threading.Lock()
+
+    def add_sample(self, step, seconds):
+        with self._lock:
+            self.samples[step].append(seconds)
+
+    def add_error(self, step):
+        with self._lock:
+            self.errors[step] += 1
+
+    def add_startup_error(self):
+        with self._lock:
+            self.startup_errors += 1
+
+    def add_replaced_driver(self):
+        with self._lock:
+            self.replaced_drivers += 1
+
+    def add_journey(self):
+        with self._lock:
+            self.journeys += 1
+
+    def summary(self):
+        """
+        Returns:
+            dict: Throughput global, navegadores sustituidos y, por paso, muestras, errores,
+                throughput y percentiles en ms
+        """
+        elapsed = (self.finished or time.perf_counter()) - self.started
+        steps = {}
+        for step, samples in self.samples.items():
+            steps[step] = {
+                "count": len(samples),
+                "errors": self.errors[step],
+                "throughput_per_s": round(len(samples) / elapsed, 3) if elapsed else 0.0
+            }
+            if samples:
+                steps[step].update({
+                    f"p{int(fraction * 100)}_ms": round(percentile(samples, fraction) * 1000, 1)
+                    for fraction in (0.5, 0.95, 0.99)
+                })
+        return {
+            "elapsed_s": round(elapsed, 3),
+            "journeys": self.journeys,
+            "journeys_per_s": round(self.journeys / elapsed, 3) if elapsed else 0.0,
+            "replaced_drivers": self.replaced_drivers,
+            "steps": steps
+        }
+
+
+def virtual_user(results, url, username, password, items, customer, duration, iterations, login_mode, start):
+    """
+    Repite el recorrido de compra con un único navegador
+    Args:
+        duration (float): Segundos durante los que iniciar recorridos, o None
+        iterations (int): Recorridos a completar, o None
+        start (threading.Barrier): Sincroniza el arranque de todos los usuarios
+    """
+    try:
+        driver = create_driver()
+    except Exception:
+        # Sin este navegador la barrera no se completaría nunca
+        results.add_startup_error()
+        start.abort()
+        raise
+
+    try:
+        try:
+            start.wait()
+        except threading.BrokenBarrierError:
+            return
+        # La duración cuenta desde que todos los navegadores están arrancados
+        deadline = results.started + duration if duration else None
+        done = 0
+        while (iterations is None or done < iterations) and (deadline is None or time.perf_counter() < deadline):
+            journey = CheckoutJourney(driver)
+            steps = (
+                ("login", lambda: journey.login(url, username, password, mode=login_mode)),
+                ("add_to_cart", lambda: journey.add_to_cart(items)),
+                ("checkout", lambda: journey.checkout(customer))
+            )
+            for step, action in steps:
+                begin = time.perf_counter()
+                try:
+                    action()
+                except Exception:
+                    results.add_error(step)
+                    break
+                results.add_sample(step, time.perf_counter() - begin)
+            else:
+                results.add_journey()
+            done += 1
+            # Cada recorrido empieza con el navegador limpio (sin cookies ni carrito);
+            # si no se puede limpiar (p. ej. la sesión dejó de responder) se sustituye
+            if not DriverPool.reset(driver):
+                results.add_replaced_driver()
+                stale, driver = driver, None
+                try:
+                    stale.quit()
+                except WebDriverException:
+                    pass
+                try:
+                    driver = create_driver()
+                except Exception:
+                    # Como en el arranque: se cuenta y este usuario deja de generar carga
+                    results.add_startup_error()
+                    return
+    finally:
+        if driver:
+            driver.quit()
+
+
+def run(users, duration=None, iterations=None, env="local", items=DEFAULT_ITEMS,
+        customer=DEFAULT_CUSTOMER, login_mode=TestData.LOGIN_MODE):
+    """
+    Ejecuta la carga y espera a que terminen todos los usuarios
+    Args:
+        users (int): Sesiones de navegador concurrentes
+        duration (float): Segundos durante los que iniciar recorridos
+        iterations (int): Recorridos por usuario (si no hay duración)
+        env (str): Ambiente de Environment.ENVIRONMENTS
+        items (list): Productos a comprar en cada recorrido
+        customer (dict): Datos de envío
+        login_mode (str): Estrategia de login ('form' o 'session')
+    Returns:
+        LoadResults: Resultados agregados
+    """
+    config = Environment.ENVIRONMENTS[env]
+    with (LocalSiteServer() if env == "local" else nullcontext()) as server:
+        url = server.url if server else config["url"]
+        results = LoadResults()
+        # El cronómetro arranca cuando todos los navegadores están listos
+        start = threading.Barrier(users, action=lambda: setattr(results, "started", time.perf_counter()))
+        threads = [
+            threading.Thread(
+                target=virtual_user, name=f"user-{index}",
+                args=(results, url, config["username"], config["password"], items, customer,
+                      duration, iterations, login_mode, start)
+            )
+            for index in range(users)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        results.finished = time.perf_counter()
+    return results
+
+
+def print_report(summary):
+    print(f"Recorridos completados: {summary['journeys']} en {summary['elapsed_s']} s "
+          f"({summary['journeys_per_s']}/s)")
+    if summary["replaced_drivers"]:
+        print(f"Navegadores sustituidos tras no poder limpiarse: {summary['replaced_drivers']}")
+    print(f"{'paso':<12} {'n':>6} {'errores':>8} {'ops/s':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for step, stats in summary["steps"].items():
+        print(f"{step:<12} {stats['count']:>6} {stats['errors']:>8} {stats['throughput_per_s']:>8} "
+              f"{stats.get('p50_ms', '-'):>9} {stats.get('p95_ms', '-'):>9} {stats.get('p99_ms', '-'):>9}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Carga sintética con el recorrido de compra de los tests")
+    parser.add_argument("-u", "--users", type=int, default=4, help="Sesiones de navegador concurrentes")
+    limit = parser.add_mutually_exclusive_group()
+    limit.add_argument("--duration", type=float, help="Segundos durante los que iniciar recorridos")
+    limit.add_argument("--iterations", type=int, help="Recorridos por usuario")
+    parser.add_argument("--env", default="local", choices=sorted(Environment.ENVIRONMENTS),
+                        help="Ambiente objetivo (por defecto la réplica local)")
+    parser.add_argument("--login-mode", default=TestData.LOGIN_MODE, choices=("form", "session"),
+                        help="Estrategia de login de cada recorrido")
+    parser.add_argument("--headed", action="store_true", help="Mostrar los navegadores")
+    parser.add_argument("--output", default=os.path.join(TestData.REPORTS_PATH, "load", "summary.json"),
+                        help="Fichero JSON con el resumen")
+    args = parser.parse_args()
+
+    TestData.HEADLESS = not args.headed
+    # Sin límite explícito cada usuario completa un único recorrido
+    iterations = args.iterations or (None if args.duration else 1)
+    results = run(max(1, args.users), duration=args.duration, iterations=iterations,
+                  env=args.env, login_mode=args.login_mode)
+    summary = results.summary()
+    print_report(summary)
+
+    os.makedirs(os.path.dirname(args.output), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=2)
+    if results.startup_errors:
+        parser.exit(1, f"{results.startup_errors} navegadores no pudieron arrancar\n")
+
+
+if __name__ == "__main__":
+    main()
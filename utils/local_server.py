@@ -0,0 +1,86 @@
+# utils/local_server.py
+import functools
+import os
+import threading
+import time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+from config.config import TestData
+
+# Réplica local de las páginas de SauceDemo
+SITE_ROOT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                         "resources", "saucedemo")
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    """Handler de ficheros estáticos con latencia fija y sin log por petición"""
+
+    def do_GET(self):
+        time.sleep(self.server.latency)
+        super().do_GET()
+
+    def do_HEAD(self):
+        time.sleep(self.server.latency)
+        super().do_HEAD()
+
+    def end_headers(self):
+        # Sin caché del navegador: cada carga paga la misma latencia
+        self.send_header("Cache-Control", "no-store")
+        super().end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class LocalSiteServer:
+    """
+    Servidor HTTP local en un hilo de fondo que sirve la réplica funcional de
+    SauceDemo de resources/saucedemo (login, inventario, carrito y checkout).
+
+    Cada petición se retrasa una latencia fija y configurable, de modo que las
+    mediciones de rendimiento son reproducibles. Con port=0 el sistema asigna
+    un puerto libre.
+    """
+
+    def __init__(self, root=SITE_ROOT, host="127.0.0.1", port=TestData.LOCAL_PORT,
+                 latency_ms=TestData.LOCAL_LATENCY_MS):
+        """
+        Args:
+            root (str): Directorio a servir
+            host (str): Interfaz de escucha
+            port (int): Puerto (0 para uno libre)
+            latency_ms (int): Latencia añadida a cada respuesta, en milisegundos
+        """
+        self.root = root
+        self.host = host
+        self.port = port
+        self.latency_ms = latency_ms
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}"
+
+    def start(self):
+        """Arranca el servidor y devuelve la URL base"""
+        handler = functools.partial(_QuietHandler, directory=self.root)
+        self._server = ThreadingHTTPServer((self.host, self.port), handler)
+        self._server.latency = self.latency_ms / 1000
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self.url
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
@@ -0,0 +1,167 @@
+# utils/locator_benchmark.py
+"""
+Benchmark de las estrategias de localización definidas en config.Locators.
+
+Resuelve cada elemento de Locators.LOGIN/INVENTORY/CART/CHECKOUT con cada una
+de sus estrategias (id, css, class, xpath) contra la copia local de las
+páginas, mide la latencia de cada búsqueda y guarda p50/p95 por elemento y
+por estrategia. Locators.resolve() usa después esos resultados para elegir
+la estrategia válida más rápida.
+
+Uso:
+    python -m utils.locator_benchmark --repeats 50
+"""
+import argparse
+import json
+import os
+import statistics
+import time
+from datetime import datetime
+
+from config.config import Locators, TestData
+from utils.local_server import LocalSiteServer
+from utils.stats import percentile
+from utils.webdriver_manager import create_driver
+
+# Página de la copia local donde vive cada sección de localizadores
+SECTION_PAGES = {
+    "LOGIN": ["index.html"],
+    "INVENTORY": ["inventory.html"],
+    "CART": ["cart.html"],
+    "CHECKOUT": ["checkout-step-one.html", "checkout-step-two.html", "checkout-complete.html"]
+}
+
+
+def iter_entries(section):
+    """
+    Recorre los elementos (incluidos los anidados) de una sección
+    Yields:
+        tuple: (ruta, entrada) p. ej. ('CHECKOUT.summary.total', {...})
+    """
+    stack = [((section,), getattr(Locators, section))]
+    while stack:
+        path, entries = stack.pop()
+        for key, entry in entries.items():
+            if set(entry) <= set(Locators.STRATEGIES):
+                yield ".".join(path + (key,)), entry
+            else:
+                stack.append((path + (key,), entry))
+
+
+def measure(driver, by, value, repeats):
+    """
+    Mide la latencia de find_elements para un localizador
+    Returns:
+        tuple: (lista de latencias en ms, primer elemento encontrado o None)
+    """
+    samples = []
+    found = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        found = driver.find_elements(by, value)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples, found[0] if found else None
+
+
+def benchmark_entry(driver, base_url, section, entry, repeats):
+    """
+    Mide todas las estrategias de un elemento en la primera página donde aparece
+    Returns:
+        dict: Resultados por estrategia y la estrategia válida más rápida
+    """
+    for page in SECTION_PAGES[section]:
+        driver.get(f"{base_url}/{page}")
+        timings = {name: measure(driver, Locators.STRATEGIES[name], value, repeats)
+                   for name, value in entry.items()}
+        # La referencia es el elemento que encuentra la estrategia preferida
+        reference = next((timings[name][1] for name in Locators.STRATEGIES
+                          if name in timings and timings[name][1] is not None), None)
+        if reference is not None:
+            break
+    else:
+        return {"page": None, "fastest": None, "strategies": {}}
+
+    strategies = {
+        name: {
+            "p50_ms": round(statistics.median(samples), 3),
+            "p95_ms": round(percentile(samples, 0.95), 3),
+            "valid": element is not None and element == reference
+        }
+        for name, (samples, element) in timings.items()
+    }
+    valid = [name for name, result in strategies.items() if result["valid"]]
+    fastest = min(valid, key=lambda name: strategies[name]["p50_ms"]) if valid else None
+    return {"page": page, "fastest": fastest, "strategies": strategies}
+
+
+def run(repeats, output=TestData.LOCATOR_BENCHMARK_PATH):
+    """
+    Ejecuta el benchmark completo y persiste los resultados
+    Returns:
+        dict: Resultados por elemento y resumen por estrategia
+    """
+    driver = create_driver()
+    # Sin wait implícito: una estrategia inválida no debe costar el timeout
+    driver.implicitly_wait(0)
+    entries = {}
+    try:
+        with LocalSiteServer(latency_ms=0) as server:
+            # Sesión y carrito para que las páginas protegidas no redirijan al login
+            driver.get(server.url)
+            driver.add_cookie({"name": "session-username", "value": TestData.USERNAME, "path": "/"})
+            driver.execute_script("localStorage.setItem('cart-contents', '[4]');")
+            for section in Locators.SECTIONS:
+                for path, entry in iter_entries(section):
+                    entries[path] = benchmark_entry(driver, server.url, section, entry, repeats)
+    finally:
+        driver.quit()
+
+    summary = {}
+    for name in Locators.STRATEGIES:
+        p50s = [result["strategies"][name]["p50_ms"] for result in entries.values()
+                if name in result["strategies"]]
+        p95s = [result["strategies"][name]["p95_ms"] for result in entries.values()
+                if name in result["strategies"]]
+        if p50s:
+            summary[name] = {"p50_ms": round(statistics.median(p50s), 3),
+                             "p95_ms": round(max(p95s), 3),
+                             "entries": len(p50s)}
+
+    results = {
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "repeats": repeats,
+        "summary": summary,
+        "entries": entries
+    }
+    directory = os.path.dirname(output)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    return results
+
+
+def print_report(results):
+    print(f"{'Elemento':<40} {'Estrategia':<8} {'p50 (ms)':>9} {'p95 (ms)':>9}  Válida")
+    for path, result in sorted(results["entries"].items()):
+        for name, timing in result["strategies"].items():
+            marker = "*" if name == result["fastest"] else " "
+            print(f"{path:<40} {name:<8} {timing['p50_ms']:>9.3f} {timing['p95_ms']:>9.3f}  "
+                  f"{'sí' if timing['valid'] else 'no'} {marker}")
+    print("\nResumen por estrategia:")
+    for name, timing in results["summary"].items():
+        print(f"  {name:<8} p50={timing['p50_ms']:.3f} ms  p95={timing['p95_ms']:.3f} ms  "
+              f"({timing['entries']} elementos)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de estrategias de localización")
+    parser.add_argument("--repeats", type=int, default=50, help="Búsquedas por estrategia y elemento")
+    parser.add_argument("--output", default=TestData.LOCATOR_BENCHMARK_PATH,
+                        help="Fichero JSON donde guardar los resultados")
+    args = parser.parse_args()
+    print_report(run(args.repeats, args.output))
+
+
+if __name__ == "__main__":
+    main()
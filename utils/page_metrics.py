@@ -0,0 +1,151 @@
+# utils/page_metrics.py
+"""
+Métricas de rendimiento front-end por transición de página (opt-in, PAGE_METRICS).
+
+En cada documento nuevo se capturan:
+- Navigation Timing (TTFB, DOMContentLoaded, load, tamaños transferidos...)
+- Paint Timing (first-paint, first-contentful-paint)
+- CDP Performance.getMetrics (heap de JS, layouts, duración de scripts...)
+
+Las métricas se adjuntan al paso de Allure en curso y se añaden como una
+línea JSON al fichero de la ejecución (TestData.PAGE_METRICS_PATH). La
+captura se lanza desde BasePage.open() y desde los métodos de page objects
+marcados con @page_transition; si la URL actual ya se capturó no se repite.
+Los comandos de la captura no cuentan en los contadores de comandos ni en
+los tiempos por paso (ver step_timing.unmetered).
+"""
+import json
+import os
+import threading
+import time
+
+import allure
+from selenium.common import WebDriverException
+
+from config.config import TestData
+from utils.step_timing import unmetered
+
+# Métricas de Performance.getMetrics que se conservan
+CDP_METRICS = (
+    "JSHeapUsedSize", "JSHeapTotalSize", "Nodes", "Documents", "LayoutCount", "LayoutDuration",
+    "RecalcStyleCount", "RecalcStyleDuration", "ScriptDuration", "TaskDuration"
+)
+
+# Espera al evento load (como mucho arguments[0] ms) y devuelve las métricas
+# de la transición, o null si la URL actual ya se capturó. En una SPA (SauceDemo
+# es una aplicación React) los cambios de ruta no crean documento nuevo: la
+# primera captura del documento incluye Navigation/Paint Timing y las
+# siguientes (soft_navigation) solo los recursos cargados desde la anterior.
+METRICS_SCRIPT = """
+    const [timeoutMs, done] = arguments;
+    if (window.__pageMetricsHref === location.href) return done(null);
+    let finished = false;
+    const round = value => Math.round(value * 10) / 10;
+    const collect = () => {
+        if (finished) return;
+        finished = true;
+        const soft = window.__pageMetricsHref !== undefined;
+        const resources = performance.getEntriesByType('resource').length;
+        const previousResources = window.__pageMetricsResources || 0;
+        window.__pageMetricsHref = location.href;
+        window.__pageMetricsResources = resources;
+        window.__pageMetricsTransitions = (window.__pageMetricsTransitions || 0) + 1;
+        const nav = soft ? null : performance.getEntriesByType('navigation')[0];
+        const paint = {};
+        if (!soft) {
+            performance.getEntriesByType('paint').forEach(entry => { paint[entry.name] = round(entry.startTime); });
+        }
+        done({
+            url: location.href,
+            soft_navigation: soft,
+            transition: window.__pageMetricsTransitions,
+            navigation: nav ? {
+                type: nav.type,
+                redirect_ms: round(nav.redirectEnd - nav.redirectStart),
+                dns_ms: round(nav.domainLookupEnd - nav.domainLookupStart),
+                connect_ms: round(nav.connectEnd - nav.connectStart),
+                ttfb_ms: round(nav.responseStart - nav.requestStart),
+                response_end_ms: round(nav.responseEnd),
+                dom_interactive_ms: round(nav.domInteractive),
+                dom_content_loaded_ms: round(nav.domContentLoadedEventEnd),
+                load_ms: round(nav.loadEventEnd),
+                transfer_size: nav.transferSize,
+                decoded_body_size: nav.decodedBodySize
+            } : null,
+            paint: paint,
+            resources: resources - previousResources
+        });
+    };
+    if (document.readyState === 'complete') {
+        collect();
+    } else {
+        window.addEventListener('load', () => setTimeout(collect, 0), {once: true});
+        setTimeout(collect, timeoutMs);
+    }
+"""
+
+_lock = threading.Lock()
+_run_file = None
+
+
+def run_file():
+    """Fichero JSONL de la ejecución actual (uno por proceso/worker)"""
+    global _run_file
+    if _run_file is None:
+        worker = os.getenv("PYTEST_WORKER_ID")
+        name = time.strftime("page_metrics-%Y%m%d-%H%M%S") + (f"-{worker}" if worker else "") + ".jsonl"
+        _run_file = os.path.join(TestData.PAGE_METRICS_PATH, name)
+    return _run_file
+
+
+def _cdp_metrics(driver):
+    """Performance.getMetrics, o None si el driver no expone CDP"""
+    try:
+        if not getattr(driver, "_performance_domain_enabled", False):
+            driver.execute_cdp_cmd("Performance.enable", {})
+            driver._performance_domain_enabled = True
+        metrics = driver.execute_cdp_cmd("Performance.getMetrics", {})["metrics"]
+    except (AttributeError, WebDriverException):
+        return None
+    return {metric["name"]: metric["value"] for metric in metrics if metric["name"] in CDP_METRICS}
+
+
+def capture(driver, label, timeout_ms=5000):
+    """
+    Captura las métricas de la página actual si su URL aún no se capturó
+    Args:
+        driver (WebDriver): Driver de la sesión
+        label (str): Origen de la transición (p. ej. 'InventoryPage.go_to_cart')
+        timeout_ms (int): Espera máxima al evento load
+    Returns:
+        dict: Métricas registradas, o None si la URL actual ya se había capturado
+    """
+    with unmetered(driver):
+        try:
+            page = driver.execute_async_script(METRICS_SCRIPT, timeout_ms)
+        except WebDriverException:
+            return None
+        if page is None:
+            return None
+        page["cdp"] = _cdp_metrics(driver)
+
+    current_test = os.getenv("PYTEST_CURRENT_TEST", "")
+    record = {
+        "timestamp": round(time.time(), 3),
+        "test": current_test.rsplit(" ", 1)[0] or None,
+        "label": label,
+        "backend": getattr(driver, "_backend", "local"),
+        **page
+    }
+    content = json.dumps(record, ensure_ascii=False)
+    with _lock:
+        os.makedirs(TestData.PAGE_METRICS_PATH, exist_ok=True)
+        with open(run_file(), "a", encoding="utf-8") as f:
+            f.write(content + "\n")
+
+    allure.attach(
+        json.dumps(record, indent=2, ensure_ascii=False),
+        name=f"Métricas de página: {label}",
+        attachment_type=allure.attachment_type.JSON
+    )
+    return record
@@ -0,0 +1,207 @@
+# utils/parallel.py
+"""
+Ejecución paralela de la suite repartiendo los tests entre N procesos worker.
+
+Cada worker es un proceso pytest independiente, con su propio Chrome y su
+propio subdirectorio de resultados Allure. Al terminar, los resultados se
+fusionan en el directorio de Allure habitual, de modo que el reporte es el
+mismo que el de una ejecución en serie.
+
+Los tests se reparten con el algoritmo LPT (el más largo primero) usando las
+duraciones del histórico de ejecuciones (ver utils/run_history.py), en el
+que cada worker guarda sus resultados al terminar.
+
+Uso:
+    python -m utils.parallel --workers 4 tests/
+"""
+import argparse
+import heapq
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+
+import pytest
+
+from config.config import TestData
+from utils.impact import ImpactMap
+from utils.run_history import TestHistory
+
+
+def estimator(durations):
+    """
+    Args:
+        durations (dict): Segundos por node id de ejecuciones anteriores
+    Returns:
+        callable: Duración estimada de un test; para tests nuevos, la mediana conocida
+    """
+    default = statistics.median(durations.values()) if durations else 1.0
+    return lambda nodeid: durations.get(nodeid, default)
+
+
+def schedule(nodeids, durations, workers):
+    """
+    Reparte los tests entre workers asignando el más largo al worker menos cargado
+    Args:
+        nodeids (list): Tests en orden de colección
+        durations (dict): Segundos por node id de ejecuciones anteriores
+        workers (int): Número de workers
+    Returns:
+        list: Una lista de node ids por worker, en el orden original de colección
+    """
+    estimate = estimator(durations)
+    order = {nodeid: index for index, nodeid in enumerate(nodeids)}
+    heap = [(0.0, worker) for worker in range(workers)]
+    shards = [[] for _ in range(workers)]
+
+    for nodeid in sorted(nodeids, key=lambda n: (-estimate(n), order[n])):
+        load, worker = heapq.heappop(heap)
+        shards[worker].append(nodeid)
+        heapq.heappush(heap, (load + estimate(nodeid), worker))
+
+    # Dentro de cada shard se respeta el orden de una ejecución en serie
+    return [sorted(shard, key=order.get) for shard in shards if shard]
+
+
+class _Collector:
+    def __init__(self):
+        self.nodeids = []
+
+    def pytest_collection_finish(self, session):
+        self.nodeids = [item.nodeid for item in session.items]
+
+
+def collect(pytest_args):
+    """Obtiene los node ids que ejecutaría pytest con los argumentos dados"""
+    collector = _Collector()
+    code = pytest.main(["--collect-only", "-q", *pytest_args], plugins=[collector])
+    if code not in (pytest.ExitCode.OK, pytest.ExitCode.NO_TESTS_COLLECTED):
+        raise SystemExit(code)
+    return collector.nodeids
+
+
+def worker_options(pytest_args):
+    """
+    Opciones de pytest que se pasan a cada worker (-m, -x, -p, -o, --perf-budgets...)
+    Args:
+        pytest_args (list): Argumentos de pytest de la ejecución paralela
+    Returns:
+        list: Los argumentos sin las rutas de tests; cada worker recibe sus node ids
+    """
+    def is_target(arg):
+        return not arg.startswith("-") and os.path.exists(arg.split("::", 1)[0])
+
+    return [arg for arg in pytest_args if not is_target(arg)]
+
+
+def merge_allure_results(worker_dirs, results_dir):
+    """Copia los resultados de cada worker al directorio común de Allure"""
+    os.makedirs(results_dir, exist_ok=True)
+    for worker_dir in worker_dirs:
+        if not os.path.isdir(worker_dir):
+            continue
+        for name in os.listdir(worker_dir):
+            shutil.move(os.path.join(worker_dir, name), os.path.join(results_dir, name))
+        os.rmdir(worker_dir)
+
+
+def result_statuses(directories):
+    """
+    Estado de cada resultado Allure de los directorios indicados
+    Args:
+        directories (list): Directorios con ficheros *-result.json
+    Returns:
+        dict: (fullName, parámetros) -> estado ('passed', 'failed', ...)
+    """
+    statuses = {}
+    for directory in directories:
+        if not os.path.isdir(directory):
+            continue
+        for name in os.listdir(directory):
+            if not name.endswith("-result.json"):
+                continue
+            with open(os.path.join(directory, name), encoding="utf-8") as f:
+                result = json.load(f)
+            parameters = tuple((p["name"], p["value"]) for p in result.get("parameters", []))
+            statuses[(result.get("fullName"), parameters)] = result.get("status")
+    return statuses
+
+
+def run(workers, pytest_args, results_dir=TestData.ALLURE_RESULTS_PATH):
+    """
+    Ejecuta la suite en paralelo
+    Returns:
+        int: Código de salida (0 si todos los workers terminaron bien)
+    """
+    durations = {}
+    if os.path.exists(TestData.HISTORY_DB):
+        history = TestHistory()
+        durations = history.durations(TestHistory.RECENT_RUNS)
+        history.close()
+    estimate = estimator(durations)
+    shards = schedule(collect(pytest_args), durations, workers)
+    if not shards:
+        return pytest.ExitCode.NO_TESTS_COLLECTED
+
+    # Las mismas opciones que una ejecución en serie con esos argumentos
+    options = worker_options(pytest_args)
+    log_dir = os.path.join(TestData.REPORTS_PATH, "parallel")
+    os.makedirs(log_dir, exist_ok=True)
+
+    processes = []
+    for index, shard in enumerate(shards):
+        worker_id = f"worker-{index}"
+        env = dict(os.environ,
+                   PYTEST_WORKER_ID=worker_id,
+                   IMPACT_MAP_PATH=os.path.join(log_dir, f"{worker_id}-impact.json"))
+        log = open(os.path.join(log_dir, f"{worker_id}.log"), "w", encoding="utf-8")
+        command = [sys.executable, "-m", "pytest", *options, *shard,
+                   f"--alluredir={os.path.join(results_dir, worker_id)}"]
+        print(f"{worker_id}: {len(shard)} tests, ~{sum(map(estimate, shard)):.1f}s estimados")
+        processes.append((worker_id, subprocess.Popen(command, env=env, stdout=log, stderr=subprocess.STDOUT), log))
+
+    exit_code = 0
+    for worker_id, process, log in processes:
+        code = process.wait()
+        log.close()
+        print(f"{worker_id}: terminado con código {code}")
+        if code and not exit_code:
+            exit_code = code
+
+    # Un resultado por test recogido, como en una ejecución en serie
+    worker_dirs = [os.path.join(results_dir, worker_id) for worker_id, _, _ in processes]
+    expected = sum(len(shard) for shard in shards)
+    reported = len(result_statuses(worker_dirs))
+    if reported != expected:
+        print(f"Aviso: los workers generaron {reported} resultados Allure para {expected} tests")
+        exit_code = exit_code or 1
+
+    merge_allure_results(worker_dirs, results_dir)
+
+    # Consolidar los símbolos usados por cada test (selección por impacto)
+    impact_map = ImpactMap()
+    for worker_id, _, _ in processes:
+        worker_map_path = os.path.join(log_dir, f"{worker_id}-impact.json")
+        if os.path.exists(worker_map_path):
+            impact_map.update(ImpactMap(worker_map_path).symbols)
+            os.remove(worker_map_path)
+    if impact_map.symbols:
+        impact_map.save()
+
+    return exit_code
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ejecuta la suite en paralelo con reparto por duración")
+    parser.add_argument("-n", "--workers", type=int, default=os.cpu_count() or 1,
+                        help="Número de procesos worker")
+    parser.add_argument("--alluredir", default=TestData.ALLURE_RESULTS_PATH,
+                        help="Directorio común de resultados Allure")
+    args, pytest_args = parser.parse_known_args()
+    sys.exit(run(max(1, args.workers), pytest_args, args.alluredir))
+
+
+if __name__ == "__main__":
+    main()
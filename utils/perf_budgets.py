@@ -0,0 +1,118 @@
+# utils/perf_budgets.py
+"""
+Medición de los presupuestos de carga declarados en los page objects (BUDGET).
+
+Para cada página se mide, en N cargas sucesivas:
+- tti_ms: milisegundos desde el inicio de la navegación hasta que el
+  elemento clave existe, es visible y está habilitado
+- requests: peticiones de red de la carga (documento + Resource Timing)
+
+Con CDP disponible, un MutationObserver registrado antes de que cargue cada
+documento (Page.addScriptToEvaluateOnNewDocument) anota el instante exacto en
+que el elemento clave pasa a ser interactivo. Sin CDP se usa el instante en
+que lo detecta el sondeo del script de lectura, que es una cota superior.
+
+tests/test_performance_budgets.py (pytest --perf-budgets) falla si el p95 de
+alguna métrica supera el presupuesto.
+"""
+import json
+
+from selenium.common import WebDriverException
+
+from utils.stats import percentile
+
+# Se ejecuta al crear cada documento, antes que los scripts de la página
+KEY_ELEMENT_OBSERVER = """
+    window.__keyElementTimes = {};
+    const ready = el => el && !el.disabled && el.getClientRects().length > 0;
+    const check = () => {
+        for (const id of %s) {
+            if (!(id in window.__keyElementTimes) && ready(document.getElementById(id))) {
+                window.__keyElementTimes[id] = performance.now();
+            }
+        }
+    };
+    new MutationObserver(check).observe(document, {childList: true, subtree: true, attributes: true});
+    document.addEventListener('DOMContentLoaded', check);
+"""
+
+# Espera (como mucho arguments[1] ms) a que el elemento clave sea interactivo
+READ_SCRIPT = """
+    const [id, timeoutMs, done] = arguments;
+    const ready = el => el && !el.disabled && el.getClientRects().length > 0;
+    const deadline = performance.now() + timeoutMs;
+    const poll = () => {
+        const times = window.__keyElementTimes || {};
+        let tti = times[id];
+        if (tti === undefined && ready(document.getElementById(id))) tti = performance.now();
+        if (tti !== undefined || performance.now() > deadline) {
+            done({
+                tti_ms: tti === undefined ? null : Math.round(tti * 10) / 10,
+                requests: performance.getEntriesByType('resource').length + 1,
+                observed: window.__keyElementTimes !== undefined
+            });
+        } else {
+            requestAnimationFrame(poll);
+        }
+    };
+    poll();
+"""
+
+
+def install_observer(driver, key_elements):
+    """
+    Registra el observador de elementos clave para los próximos documentos
+    Args:
+        driver (WebDriver): Driver de la sesión
+        key_elements (list): IDs de los elementos clave a vigilar
+    Returns:
+        bool: False si el driver no expone CDP (se medirá por sondeo)
+    """
+    script = KEY_ELEMENT_OBSERVER % json.dumps(list(key_elements))
+    try:
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": script})
+    except (AttributeError, WebDriverException):
+        return False
+    return True
+
+
+def measure(driver, url, budget, timeout_ms=10000):
+    """
+    Carga la página una vez y mide su elemento clave y sus peticiones
+    Args:
+        driver (WebDriver): Driver de la sesión
+        url (str): URL base del ambiente
+        budget (PageBudget): Presupuesto de la página
+        timeout_ms (int): Espera máxima al elemento clave
+    Returns:
+        dict: tti_ms (None si no llegó a estar interactivo), requests y observed
+    """
+    driver.get(url.rstrip("/") + budget.path)
+    return driver.execute_async_script(READ_SCRIPT, budget.key_element, timeout_ms)
+
+
+def evaluate(samples, budget):
+    """
+    Compara el p95 de las muestras con el presupuesto
+    Args:
+        samples (list): Resultados de measure()
+        budget (PageBudget): Presupuesto de la página
+    Returns:
+        tuple: (resumen con p50/p95 por métrica, lista de incumplimientos)
+    """
+    violations = []
+    missing = sum(1 for sample in samples if sample["tti_ms"] is None)
+    if missing:
+        violations.append(f"'{budget.key_element}' no llegó a ser interactivo en {missing}/{len(samples)} cargas")
+
+    tti = [sample["tti_ms"] for sample in samples if sample["tti_ms"] is not None]
+    requests = [sample["requests"] for sample in samples]
+    summary = {"path": budget.path, "key_element": budget.key_element, "repeats": len(samples)}
+    for name, values, limit in (("tti_ms", tti, budget.tti_ms), ("requests", requests, budget.max_requests)):
+        if not values:
+            continue
+        p95 = percentile(values, 0.95)
+        summary[name] = {"p50": percentile(values, 0.5), "p95": p95, "budget": limit}
+        if p95 > limit:
+            violations.append(f"{name} p95 = {p95} supera el presupuesto de {limit}")
+    return summary, violations
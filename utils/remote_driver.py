@@ -0,0 +1,148 @@
+# utils/remote_driver.py
+"""
+Backend remoto de WebDriver (Selenium Grid, Selenoid o un chromedriver en modo servidor).
+
+- SharedRemoteConnection: una única conexión HTTP keep-alive por endpoint,
+  compartida por todos los drivers e hilos del proceso, con un pool de
+  conexiones de tamaño configurable. quit() de un driver no la cierra.
+- SessionLimiter: limita las sesiones abiertas a la vez; al agotarse la
+  capacidad las nuevas peticiones esperan en cola a que se libere una.
+- ChromedriverServer: arranca un chromedriver local en modo servidor, que se
+  comporta como un endpoint remoto (sustituto local de un grid).
+"""
+import atexit
+import functools
+import threading
+
+from selenium import webdriver
+from selenium.webdriver.chrome.remote_connection import ChromeRemoteConnection
+
+from config.config import TestData
+
+
+class SharedRemoteConnection(ChromeRemoteConnection):
+    """Conexión keep-alive compartida por todas las sesiones contra un endpoint"""
+
+    _connections = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def for_url(cls, url):
+        """
+        Returns:
+            SharedRemoteConnection: La conexión del endpoint (se crea la primera vez)
+        """
+        with cls._lock:
+            if url not in cls._connections:
+                cls._connections[url] = cls(url, keep_alive=True)
+            return cls._connections[url]
+
+    @classmethod
+    def shutdown_all(cls):
+        with cls._lock:
+            connections, cls._connections = list(cls._connections.values()), {}
+        for connection in connections:
+            connection.shutdown()
+
+    def _get_connection_manager(self):
+        manager = super()._get_connection_manager()
+        # urllib3 guarda por defecto una sola conexión por host; con varios hilos
+        # el resto se abrirían y descartarían en cada comando
+        manager.connection_pool_kw["maxsize"] = TestData.REMOTE_HTTP_POOL_SIZE
+        return manager
+
+    def close(self):
+        # La llama WebDriver.quit(): la conexión sigue en uso por otras sesiones
+        pass
+
+    def shutdown(self):
+        """Cierra de verdad las conexiones del pool"""
+        super().close()
+
+
+class SessionLimiter:
+    """Limita el número de sesiones abiertas a la vez en el proceso"""
+
+    def __init__(self, max_sessions=TestData.MAX_SESSIONS, timeout=TestData.SESSION_QUEUE_TIMEOUT):
+        """
+        Args:
+            max_sessions (int): Sesiones simultáneas permitidas (0 sin límite)
+            timeout (float): Segundos máximos de espera en cola por una sesión
+        """
+        self.max_sessions = max_sessions
+        self.timeout = timeout
+        self._semaphore = threading.BoundedSemaphore(max_sessions) if max_sessions else None
+
+    def acquire(self):
+        """
+        Reserva una sesión, esperando en cola si no hay capacidad
+        Raises:
+            TimeoutError: Si no se libera ninguna sesión en timeout segundos
+        """
+        if self._semaphore and not self._semaphore.acquire(timeout=self.timeout):
+            raise TimeoutError(f"No se liberó ninguna de las {self.max_sessions} sesiones en {self.timeout} s")
+
+    def release(self):
+        if self._semaphore:
+            self._semaphore.release()
+
+    def bind(self, driver):
+        """Libera la sesión reservada cuando el driver hace quit() (una sola vez)"""
+        quit_driver = driver.quit
+        released = threading.Event()
+
+        @functools.wraps(quit_driver)
+        def quit_and_release():
+            try:
+                quit_driver()
+            finally:
+                if not released.is_set():
+                    released.set()
+                    self.release()
+
+        driver.quit = quit_and_release
+
+
+class ChromedriverServer:
+    """chromedriver local en modo servidor, usado como endpoint remoto"""
+
+    _instance = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def url(cls, service_factory):
+        """
+        Arranca el servidor la primera vez y devuelve su URL
+        Args:
+            service_factory (callable): Devuelve el Service de chromedriver a lanzar
+        """
+        with cls._lock:
+            if cls._instance is None:
+                service = service_factory()
+                service.start()
+                atexit.register(service.stop)
+                cls._instance = service
+            return cls._instance.service_url
+
+
+def _execute_cdp_cmd(driver, cmd, cmd_args):
+    """execute_cdp_cmd para drivers remotos, vía el comando goog/cdp/execute"""
+    return driver.execute("executeCdpCommand", {"cmd": cmd, "params": cmd_args})["value"]
+
+
+def create_remote_driver(url, options):
+    """
+    Crea una sesión remota sobre la conexión compartida del endpoint
+    Args:
+        url (str): URL del endpoint WebDriver remoto
+        options (Options): Opciones de Chrome
+    Returns:
+        WebDriver: Driver remoto con execute_cdp_cmd disponible
+    """
+    driver = webdriver.Remote(command_executor=SharedRemoteConnection.for_url(url), options=options)
+    # Mismo API que webdriver.Chrome para el perfil lean y la limpieza del pool
+    driver.execute_cdp_cmd = functools.partial(_execute_cdp_cmd, driver)
+    return driver
+
+
+atexit.register(SharedRemoteConnection.shutdown_all)
@@ -0,0 +1,233 @@
+# utils/run_history.py
+"""
+Histórico local (SQLite) de resultados y duraciones por test.
+
+Cada ejecución registra, por test, el resultado y la duración de las fases
+setup/call/teardown. Con ese histórico:
+- pytest --order failed-first ejecuta primero los tests que fallaron
+  recientemente y después el resto, del más largo al más corto
+- pytest --order longest-first ordena solo por duración
+- python -m utils.parallel reparte los tests entre workers por duración
+- python -m utils.run_history muestra los tests más lentos y más inestables
+
+Uso:
+    python -m utils.run_history --runs 20 --limit 10
+"""
+import argparse
+import os
+import sqlite3
+import time
+
+from config.config import TestData
+
+ORDER_MODES = ("file", "failed-first", "longest-first")
+
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS runs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        started_at REAL NOT NULL,
+        worker TEXT
+    );
+    CREATE TABLE IF NOT EXISTS results (
+        run_id INTEGER NOT NULL REFERENCES runs(id),
+        nodeid TEXT NOT NULL,
+        outcome TEXT NOT NULL,
+        setup_s REAL NOT NULL DEFAULT 0,
+        call_s REAL NOT NULL DEFAULT 0,
+        teardown_s REAL NOT NULL DEFAULT 0,
+        finished_at REAL NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS results_nodeid ON results (nodeid, run_id);
+"""
+
+
+class TestHistory:
+    """Histórico de ejecuciones guardado en una base de datos SQLite"""
+
+    # No es una clase de tests aunque su nombre empiece por "Test"
+    __test__ = False
+
+    # Número de ejecuciones de cada test que cuentan como "recientes"
+    RECENT_RUNS = 3
+
+    def __init__(self, path=TestData.HISTORY_DB):
+        """
+        Args:
+            path (str): Fichero SQLite (se crea si no existe)
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # timeout: los workers paralelos escriben en la misma base de datos
+        self.connection = sqlite3.connect(path, timeout=30)
+        self.connection.executescript(SCHEMA)
+        self._pending = {}
+
+    def add_report(self, report):
+        """
+        Acumula el reporte de una fase; el test se completa con su teardown
+        Args:
+            report (TestReport): Reporte de pytest de setup, call o teardown
+        """
+        result = self._pending.setdefault(report.nodeid, {"outcome": "passed"})
+        result[f"{report.when}_s"] = report.duration
+        if report.failed:
+            # Un fallo fuera de la fase call es un error de fixture
+            result["outcome"] = "failed" if report.when == "call" else "error"
+        elif report.skipped and result["outcome"] == "passed":
+            result["outcome"] = "skipped"
+        if report.when == "teardown":
+            result["finished_at"] = time.time()
+
+    def save_run(self, worker=None):
+        """
+        Guarda los tests completados como una nueva ejecución
+        Returns:
+            int: Id de la ejecución, o None si no había resultados
+        """
+        finished = {nodeid: result for nodeid, result in self._pending.items() if "finished_at" in result}
+        if not finished:
+            return None
+        with self.connection:
+            run_id = self.connection.execute(
+                "INSERT INTO runs (started_at, worker) VALUES (?, ?)",
+                (min(result["finished_at"] for result in finished.values()), worker)
+            ).lastrowid
+            self.connection.executemany(
+                "INSERT INTO results (run_id, nodeid, outcome, setup_s, call_s, teardown_s, finished_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(run_id, nodeid, result["outcome"], result.get("setup_s", 0.0), result.get("call_s", 0.0),
+                  result.get("teardown_s", 0.0), result["finished_at"]) for nodeid, result in finished.items()]
+            )
+        for nodeid in finished:
+            del self._pending[nodeid]
+        return run_id
+
+    def recent_failures(self):
+        """
+        Returns:
+            set: Tests con algún fallo o error en sus últimas RECENT_RUNS ejecuciones
+        """
+        rows = self.connection.execute("""
+            SELECT nodeid FROM (
+                SELECT nodeid, outcome,
+                       ROW_NUMBER() OVER (PARTITION BY nodeid ORDER BY run_id DESC) AS position
+                FROM results
+            )
+            WHERE position <= ? AND outcome IN ('failed', 'error')
+        """, (self.RECENT_RUNS,))
+        return {nodeid for nodeid, in rows}
+
+    def durations(self, runs=None):
+        """
+        Args:
+            runs (int): Limitar a las últimas n ejecuciones de cada test
+        Returns:
+            dict: Node id -> duración media (setup + call + teardown) en segundos
+        """
+        rows = self.connection.execute("""
+            SELECT nodeid, AVG(setup_s + call_s + teardown_s) FROM (
+                SELECT *, ROW_NUMBER() OVER (PARTITION BY nodeid ORDER BY run_id DESC) AS position
+                FROM results
+            )
+            WHERE ? IS NULL OR position <= ?
+            GROUP BY nodeid
+        """, (runs, runs))
+        return dict(rows.fetchall())
+
+    def order(self, nodeids, mode):
+        """
+        Ordena los tests según el histórico
+        Args:
+            nodeids (list): Tests en orden de colección
+            mode (str): "file", "failed-first" o "longest-first"
+        Returns:
+            list: Node ids reordenados (sort estable: sin histórico se respeta el orden original)
+        """
+        if mode == "file":
+            return list(nodeids)
+        durations = self.durations(self.RECENT_RUNS)
+        failed = self.recent_failures() if mode == "failed-first" else set()
+        return sorted(nodeids, key=lambda nodeid: (nodeid not in failed, -durations.get(nodeid, 0.0)))
+
+    def slowest(self, runs=20, limit=10):
+        """
+        Returns:
+            list: (node id, ejecuciones, media, máximo, media de setup, call y teardown)
+        """
+        return self.connection.execute("""
+            SELECT nodeid, COUNT(*), AVG(setup_s + call_s + teardown_s), MAX(setup_s + call_s + teardown_s),
+                   AVG(setup_s), AVG(call_s), AVG(teardown_s)
+            FROM (
+                SELECT *, ROW_NUMBER() OVER (PARTITION BY nodeid ORDER BY run_id DESC) AS position
+                FROM results WHERE outcome != 'skipped'
+            )
+            WHERE position <= ?
+            GROUP BY nodeid
+            ORDER BY 3 DESC
+            LIMIT ?
+        """, (runs, limit)).fetchall()
+
+    def flaky(self, runs=20, limit=10):
+        """
+        Tests inestables: alternan entre pasar y fallar
+        Returns:
+            list: (node id, ejecuciones, fallos, cambios de resultado), de más a menos cambios
+        """
+        rows = self.connection.execute("""
+            SELECT nodeid, outcome FROM (
+                SELECT nodeid, outcome, run_id,
+                       ROW_NUMBER() OVER (PARTITION BY nodeid ORDER BY run_id DESC) AS position
+                FROM results WHERE outcome != 'skipped'
+            )
+            WHERE position <= ?
+            ORDER BY nodeid, run_id
+        """, (runs,))
+
+        history = {}
+        for nodeid, outcome in rows:
+            history.setdefault(nodeid, []).append(outcome == "passed")
+        result = []
+        for nodeid, passed in history.items():
+            flips = sum(1 for previous, current in zip(passed, passed[1:]) if previous != current)
+            if flips:
+                result.append((nodeid, len(passed), passed.count(False), flips))
+        result.sort(key=lambda row: (-row[3], -row[2]))
+        return result[:limit]
+
+    def close(self):
+        self.connection.close()
+
+
+def print_report(history, runs, limit):
+    print(f"Tests más lentos (últimas {runs} ejecuciones)")
+    print(f"{'media':>8} {'máx':>8} {'setup':>8} {'call':>8} {'teardown':>8} {'n':>4}  test")
+    for nodeid, count, mean, maximum, setup, call, teardown in history.slowest(runs, limit):
+        print(f"{mean:8.2f} {maximum:8.2f} {setup:8.2f} {call:8.2f} {teardown:8.2f} {count:4d}  {nodeid}")
+
+    print(f"\nTests inestables (últimas {runs} ejecuciones)")
+    flaky = history.flaky(runs, limit)
+    if not flaky:
+        print("Ninguno")
+    for nodeid, count, failures, flips in flaky:
+        print(f"{flips:3d} cambios, {failures}/{count} fallos  {nodeid}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Informe de tests lentos e inestables a partir del histórico")
+    parser.add_argument("--db", default=TestData.HISTORY_DB, help="Base de datos del histórico")
+    parser.add_argument("--runs", type=int, default=20, help="Ejecuciones por test a considerar")
+    parser.add_argument("--limit", type=int, default=10, help="Tests a mostrar por sección")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        parser.exit(1, f"No hay histórico en {args.db}\n")
+    history = TestHistory(args.db)
+    try:
+        print_report(history, args.runs, args.limit)
+    finally:
+        history.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+# utils/screenshots.py
+import io
+import os
+import threading
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+import allure
+
+from config.config import TestData
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow es opcional: sin él se guarda el PNG original
+    Image = None
+
+
+class ScreenshotPipeline:
+    """
+    Captura de screenshots en memoria con escritura a disco en segundo plano.
+
+    En el teardown solo se paga la llamada a get_screenshot_as_png: los bytes
+    se adjuntan a Allure directamente y el reescalado/recompresión opcional y
+    la escritura en disco se encolan en un pool de hilos que se vacía al
+    final de la sesión con drain().
+    """
+
+    def __init__(self, directory=TestData.SCREENSHOTS_PATH,
+                 max_width=TestData.SCREENSHOT_MAX_WIDTH, workers=2):
+        """
+        Args:
+            directory (str): Directorio donde guardar los PNG
+            max_width (int): Ancho máximo al guardar (0 para no reescalar; requiere Pillow)
+            workers (int): Hilos dedicados a procesar y escribir las capturas
+        """
+        self.directory = directory
+        self.max_width = max_width
+        self.workers = workers
+        self._executor = None
+        self._pending = []
+        self._lock = threading.Lock()
+
+    def capture(self, driver, name):
+        """
+        Toma el screenshot, lo adjunta a Allure y encola su guardado en disco
+        Returns:
+            bytes: Contenido PNG capturado
+        """
+        png = driver.get_screenshot_as_png()
+        allure.attach(png, name="Screenshot", attachment_type=allure.attachment_type.PNG)
+
+        path = os.path.join(self.directory, f"failure_{name}.png")
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="screenshots")
+            self._pending.append(self._executor.submit(self._store, png, path))
+        return png
+
+    def drain(self):
+        """
+        Espera a que se escriban todas las capturas pendientes. Un error al
+        guardar una captura se informa y no impide guardar las demás (ya
+        están adjuntas a Allure)
+        Returns:
+            list: Rutas de los ficheros escritos
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+            executor, self._executor = self._executor, None
+        paths = []
+        for future in pending:
+            try:
+                paths.append(future.result())
+            except Exception as e:
+                warnings.warn(f"No se pudo guardar un screenshot en {self.directory}: {type(e).__name__}: {e}")
+        if executor:
+            executor.shutdown()
+        return paths
+
+    def _store(self, png, path):
+        os.makedirs(self.directory, exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(self._shrink(png))
+        return path
+
+    def _shrink(self, png):
+        """Reescala y recomprime el PNG si está configurado y Pillow está disponible"""
+        if Image is None or not self.max_width:
+            return png
+        image = Image.open(io.BytesIO(png))
+        if image.width > self.max_width:
+            height = round(image.height * self.max_width / image.width)
+            image = image.resize((self.max_width, height), Image.LANCZOS)
+        output = io.BytesIO()
+        image.save(output, format="PNG", optimize=True)
+        return output.getvalue()
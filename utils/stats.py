@@ -0,0 +1,19 @@
+# utils/stats.py
+"""
+Estadísticos compartidos por los benchmarks y las mediciones de rendimiento
+(utils/locator_benchmark.py, utils/load_generator.py, utils/perf_budgets.py).
+"""
+
+
+def percentile(samples, fraction):
+    """
+    Percentil por rango más cercano
+    Args:
+        samples (iterable): Muestras (al menos una)
+        fraction (float): Percentil entre 0 y 1 (p. ej. 0.95)
+    Returns:
+        float: Muestra que ocupa el percentil indicado
+    """
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, round(fraction * len(ordered)) - 1))
+    return ordered[index]
@@ -0,0 +1,268 @@
+# utils/step_timing.py
+"""
+Instrumentación de tiempos por paso de los page objects.
+
+- install_command_hook() envuelve driver.execute para medir cada comando
+  WebDriver (también los que lanzan los WebElement) y avisar a los listeners.
+- TimedWait mide el tiempo que los page objects pasan dentro de waits explícitos.
+- StepTimer registra, por cada método público de un page object, el tiempo
+  total, el tiempo en waits y el tiempo en comandos fuera de waits.
+
+BasePage envuelve automáticamente los métodos públicos de sus subclases con
+timed_step(), así que no hace falta tocar cada método.
+"""
+import functools
+import json
+import os
+import re
+import time
+from contextlib import contextmanager
+from uuid import uuid4
+
+import allure
+from allure_commons import plugin_manager
+from allure_commons.model2 import Parameter
+from selenium.webdriver.support.ui import WebDriverWait
+
+from config.config import TestData
+from utils import impact
+
+
+def install_command_hook(driver):
+    """
+    Envuelve driver.execute para medir cada comando WebDriver (idempotente)
+    Returns:
+        list: Listeners del driver; cada uno recibe (comando, segundos)
+    """
+    listeners = getattr(driver, "_command_listeners", None)
+    if listeners is not None:
+        return listeners
+
+    listeners = driver._command_listeners = []
+    execute = driver.execute
+
+    @functools.wraps(execute)
+    def timed_execute(driver_command, params=None):
+        start = time.perf_counter()
+        try:
+            return execute(driver_command, params)
+        finally:
+            elapsed = time.perf_counter() - start
+            for listener in list(listeners):
+                listener(driver_command, elapsed)
+
+    driver.execute = timed_execute
+    return listeners
+
+
+def metered(listener):
+    """Marca un listener de comandos como medidor: unmetered() lo silencia"""
+    listener.__metered__ = True
+    return listener
+
+
+@contextmanager
+def unmetered(driver):
+    """
+    Oculta los comandos enviados dentro del bloque a los listeners medidores
+    (CommandCounter, StepTimer), de modo que la instrumentación auxiliar
+    (métricas de página, lectura del log de red) no altera los conteos ni los
+    tiempos de los tests. El resto de listeners siguen recibiéndolos.
+    """
+    listeners = getattr(driver, "_command_listeners", None)
+    hidden = [listener for listener in listeners or [] if getattr(listener, "__metered__", False)]
+    for listener in hidden:
+        listeners.remove(listener)
+    try:
+        yield
+    finally:
+        if hidden:
+            listeners.extend(hidden)
+
+
+def _allure_item(uuid):
+    """
+    Resultado en curso (paso o test) del reporter de allure-pytest
+    Returns:
+        object: El resultado con ese uuid, o None si Allure no está activo
+    """
+    for plugin in plugin_manager.get_plugins():
+        reporter = getattr(plugin, "allure_logger", None)
+        if reporter is not None:
+            return reporter.get_item(uuid)
+    return None
+
+
+class StepRecord:
+    """Tiempos de una llamada a un método de page object"""
+
+    def __init__(self, name, depth, start):
+        self.name = name
+        self.depth = depth
+        self.start = start
+        self.end = start
+        self.wait = 0.0
+        self.command = 0.0
+        self.commands = 0
+        self.error = None
+
+    def to_dict(self, origin):
+        return {
+            "name": self.name,
+            "depth": self.depth,
+            "start_ms": round((self.start - origin) * 1000, 3),
+            "total_ms": round((self.end - self.start) * 1000, 3),
+            "wait_ms": round(self.wait * 1000, 3),
+            "command_ms": round(self.command * 1000, 3),
+            "commands": self.commands,
+            "error": self.error
+        }
+
+
+class StepTimer:
+    """
+    Registra la línea temporal de pasos de page objects de un test.
+    Se asocia al driver con attach() y se retira con detach().
+    """
+
+    def __init__(self, test_name):
+        self.test_name = test_name
+        self.origin = time.perf_counter()
+        self.records = []
+        self._open = []
+        self._wait_depth = 0
+        self._driver = None
+
+    @classmethod
+    def attach(cls, driver, test_name):
+        timer = cls(test_name)
+        timer._driver = driver
+        install_command_hook(driver).append(timer._on_command)
+        driver._step_timer = timer
+        return timer
+
+    def detach(self):
+        self._driver._command_listeners.remove(self._on_command)
+        self._driver._step_timer = None
+
+    @contextmanager
+    def step(self, name):
+        record = StepRecord(name, len(self._open), time.perf_counter())
+        self.records.append(record)
+        self._open.append(record)
+        # Los pasos de primer nivel se abren en Allure antes de la llamada y se
+        # cierran después con sus tiempos como parámetros: el reporte muestra
+        # su duración real y su orden
+        step_uuid = str(uuid4()) if record.depth == 0 else None
+        if step_uuid:
+            plugin_manager.hook.start_step(uuid=step_uuid, title=f"⏱ {name}", params={})
+        exc_info = (None, None, None)
+        try:
+            yield record
+        except BaseException as e:
+            record.error = type(e).__name__
+            exc_info = (type(e), e, e.__traceback__)
+            raise
+        finally:
+            record.end = time.perf_counter()
+            self._open.pop()
+            if step_uuid:
+                self._close_step(step_uuid, record, exc_info)
+
+    def _close_step(self, step_uuid, record, exc_info):
+        """Añade los tiempos del paso como parámetros y lo cierra en Allure"""
+        step = _allure_item(step_uuid)
+        if step is not None:
+            timing = record.to_dict(self.origin)
+            step.parameters.extend(
+                Parameter(name=key, value=str(timing[key])) for key in ("total_ms", "wait_ms", "command_ms", "commands")
+            )
+        exc_type, exc_val, exc_tb = exc_info
+        plugin_manager.hook.stop_step(uuid=step_uuid, exc_type=exc_type, exc_val=exc_val, exc_tb=exc_tb)
+
+    @contextmanager
+    def waiting(self):
+        """Marca el tiempo transcurrido como espera en todos los pasos abiertos"""
+        start = time.perf_counter()
+        self._wait_depth += 1
+        try:
+            yield
+        finally:
+            self._wait_depth -= 1
+            if not self._wait_depth:
+                elapsed = time.perf_counter() - start
+                for record in self._open:
+                    record.wait += elapsed
+
+    @metered
+    def _on_command(self, command, elapsed):
+        for record in self._open:
+            record.commands += 1
+            # Los comandos lanzados dentro de un wait ya cuentan como espera
+            if not self._wait_depth:
+                record.command += elapsed
+
+    def timeline(self):
+        return {
+            "test": self.test_name,
+            # Permite comparar la latencia por comando entre backends local y remoto
+            "backend": getattr(self._driver, "_backend", "local"),
+            "steps": [record.to_dict(self.origin) for record in self.records]
+        }
+
+    def save(self, directory=TestData.TIMINGS_PATH):
+        """
+        Guarda la línea temporal del test en JSON y la adjunta al reporte
+        Returns:
+            str: Ruta del fichero generado
+        """
+        os.makedirs(directory, exist_ok=True)
+        file_name = re.sub(r"[^\w.-]+", "_", self.test_name).strip("_") + ".json"
+        path = os.path.join(directory, file_name)
+        content = json.dumps(self.timeline(), indent=2, ensure_ascii=False)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+        allure.attach(content, name="Tiempos por paso", attachment_type=allure.attachment_type.JSON)
+        return path
+
+
+class TimedWait(WebDriverWait):
+    """WebDriverWait que anota en el StepTimer activo el tiempo de espera"""
+
+    def until(self, method, message=""):
+        with _waiting(self._driver):
+            return super().until(method, message)
+
+    def until_not(self, method, message=""):
+        with _waiting(self._driver):
+            return super().until_not(method, message)
+
+
+@contextmanager
+def _waiting(driver):
+    timer = getattr(driver, "_step_timer", None)
+    if timer is None:
+        yield
+    else:
+        with timer.waiting():
+            yield
+
+
+def timed_step(func, owner):
+    """
+    Envuelve un método de page object para registrarlo en el StepTimer activo
+    y en el registro de impacto del test en curso (utils/impact.py)
+    """
+    name = f"{owner}.{func.__name__}"
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        impact.record(name)
+        timer = getattr(self.driver, "_step_timer", None)
+        if timer is None:
+            return func(self, *args, **kwargs)
+        with timer.step(name):
+            return func(self, *args, **kwargs)
+
+    wrapper.__timed__ = True
+    return wrapper
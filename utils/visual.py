@@ -0,0 +1,286 @@
+# utils/visual.py
+"""
+Checkpoints visuales: comparación del viewport actual con una captura de
+referencia (baseline) guardada en VISUAL_BASELINES_PATH/<nombre>.png.
+
+La comparación va de lo más barato a lo más caro:
+1. Digest SHA-256 del PNG: si coincide con el de la baseline el frame es
+   idéntico y no se decodifica nada
+2. Solo con VISUAL_HASH_DISTANCE >= 0: hash perceptual de la imagen
+   reducida (con las regiones ignoradas enmascaradas); si la distancia de
+   Hamming con el de la baseline no la supera, el frame se acepta sin diff
+   completo. Es más rápido pero puede pasar por alto cambios pequeños (p. ej.
+   el color de un botón), por eso está desactivado por defecto
+3. Diff completo vectorizado con NumPy, con tolerancia por canal; los
+   píxeles distintos se marcan en rojo en una imagen que se adjunta a Allure
+
+Las baselines se leen de disco una sola vez por sesión (BaselineCache). Si
+una baseline no existe el checkpoint falla (MissingBaselineError); con
+VISUAL_UPDATE_BASELINES=True la captura actual se guarda como nueva baseline.
+
+NumPy y Pillow son opcionales: sin ellos solo se hace la comparación por
+digest (sin regiones ignoradas ni imagen de diferencias).
+"""
+import hashlib
+import io
+import math
+import os
+import re
+import threading
+
+import allure
+
+from config.config import TestData
+
+try:
+    import numpy as np
+    from PIL import Image
+except ImportError:  # NumPy y Pillow son opcionales: sin ellos solo se compara el digest
+    np = None
+    Image = None
+
+# Lado de la imagen reducida sobre la que se calcula el hash perceptual
+HASH_SIZE = 16
+
+# Rectángulos (en píxeles de la captura) de los elementos a ignorar
+ELEMENT_RECTS_SCRIPT = """
+    const ratio = window.devicePixelRatio || 1;
+    return arguments[0].map(id => {
+        const el = document.getElementById(id);
+        if (!el) return null;
+        const rect = el.getBoundingClientRect();
+        return [rect.left * ratio, rect.top * ratio, rect.width * ratio, rect.height * ratio];
+    }).filter(rect => rect);
+"""
+
+
+class VisualMismatchError(AssertionError):
+    """La captura actual difiere de la baseline más de lo permitido"""
+
+
+class MissingBaselineError(VisualMismatchError):
+    """El checkpoint no tiene baseline y no se están grabando baselines"""
+
+
+class Frame:
+    """Captura PNG con su digest y, bajo demanda, sus píxeles decodificados"""
+
+    def __init__(self, png):
+        self.png = png
+        self.digest = hashlib.sha256(png).hexdigest()
+        self._pixels = None
+
+    @property
+    def pixels(self):
+        """Array (alto, ancho, 3) de uint8; se decodifica la primera vez"""
+        if self._pixels is None:
+            self._pixels = np.asarray(Image.open(io.BytesIO(self.png)).convert("RGB"))
+        return self._pixels
+
+
+def _mask(height, width, regions):
+    """
+    Returns:
+        ndarray: Matriz booleana con True en los píxeles que se comparan
+    """
+    mask = np.ones((height, width), dtype=bool)
+    for x, y, w, h in regions:
+        # Los elementos desplazados fuera del viewport tienen coordenadas
+        # negativas: se recortan a la imagen y se descartan si quedan vacíos
+        left, top = max(0, math.floor(x)), max(0, math.floor(y))
+        right, bottom = min(width, max(0, math.ceil(x + w))), min(height, max(0, math.ceil(y + h)))
+        if right > left and bottom > top:
+            mask[top:bottom, left:right] = False
+    return mask
+
+
+def perceptual_hash(pixels, mask):
+    """
+    Hash de medias por bloque: la imagen enmascarada en gris se reduce a
+    HASH_SIZE x HASH_SIZE y cada bit indica si el bloque supera la media
+    Returns:
+        bytes: Bits del hash empaquetados
+    """
+    gray = pixels.mean(axis=2) * mask
+    height, width = gray.shape
+    rows = np.linspace(0, height, HASH_SIZE + 1, dtype=int)
+    cols = np.linspace(0, width, HASH_SIZE + 1, dtype=int)
+    # Suma por bloques con np.add.reduceat en los dos ejes
+    blocks = np.add.reduceat(np.add.reduceat(gray, rows[:-1], axis=0), cols[:-1], axis=1)
+    return np.packbits(blocks > blocks.mean()).tobytes()
+
+
+def hash_distance(first, second):
+    """Distancia de Hamming (bits distintos) entre dos hashes perceptuales"""
+    return int(np.unpackbits(np.bitwise_xor(np.frombuffer(first, np.uint8), np.frombuffer(second, np.uint8))).sum())
+
+
+def diff(current, baseline, mask, tolerance=TestData.VISUAL_PIXEL_TOLERANCE):
+    """
+    Diff vectorizado de dos capturas del mismo tamaño
+    Args:
+        current (ndarray): Píxeles de la captura actual
+        baseline (ndarray): Píxeles de la baseline
+        mask (ndarray): Píxeles que se comparan (True)
+        tolerance (int): Diferencia máxima por canal que se considera igual
+    Returns:
+        tuple: (fracción de píxeles comparados que difieren, matriz booleana de diferencias)
+    """
+    delta = np.abs(current.astype(np.int16) - baseline.astype(np.int16)).max(axis=2)
+    changed = (delta > tolerance) & mask
+    return changed.sum() / max(1, mask.sum()), changed
+
+
+def diff_image(baseline, changed):
+    """Baseline atenuada en gris con los píxeles distintos en rojo (PNG)"""
+    gray = (baseline.mean(axis=2) * 0.4 + 150).astype(np.uint8)
+    image = np.stack([gray, gray, gray], axis=2)
+    image[changed] = (255, 0, 0)
+    output = io.BytesIO()
+    Image.fromarray(image).save(output, format="PNG")
+    return output.getvalue()
+
+
+class BaselineCache:
+    """Baselines leídas de disco una sola vez por sesión, con su hash perceptual por máscara"""
+
+    def __init__(self, directory=TestData.VISUAL_BASELINES_PATH):
+        self.directory = directory
+        self._frames = {}
+        self._hashes = {}
+        self._lock = threading.Lock()
+
+    def path(self, name):
+        return os.path.join(self.directory, f"{name}.png")
+
+    def exists(self, name):
+        return self.get(name) is not None
+
+    def get(self, name):
+        """
+        Returns:
+            Frame: Baseline del checkpoint, o None si no existe
+        """
+        with self._lock:
+            if name not in self._frames:
+                path = self.path(name)
+                if os.path.exists(path):
+                    with open(path, "rb") as f:
+                        self._frames[name] = Frame(f.read())
+                else:
+                    self._frames[name] = None
+            return self._frames[name]
+
+    def hash(self, name, mask, regions):
+        """Hash perceptual de la baseline con la máscara indicada (cacheado por regiones)"""
+        key = (name, tuple(regions))
+        with self._lock:
+            if key not in self._hashes:
+                self._hashes[key] = perceptual_hash(self._frames[name].pixels, mask)
+            return self._hashes[key]
+
+    def save(self, name, frame):
+        """Guarda la captura como baseline del checkpoint"""
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self.path(name), "wb") as f:
+            f.write(frame.png)
+        with self._lock:
+            self._frames[name] = frame
+            self._hashes = {key: value for key, value in self._hashes.items() if key[0] != name}
+
+
+# Baselines compartidas por toda la sesión (y por los hilos del generador de carga)
+baselines = BaselineCache()
+
+
+def _ignored_regions(driver, ignore):
+    """
+    Args:
+        ignore (iterable): Ids de elementos o rectángulos (x, y, ancho, alto) en píxeles
+    Returns:
+        list: Rectángulos a ignorar en píxeles de la captura
+    """
+    regions = [tuple(region) for region in ignore if not isinstance(region, str)]
+    element_ids = [region for region in ignore if isinstance(region, str)]
+    if element_ids:
+        regions.extend(tuple(rect) for rect in driver.execute_script(ELEMENT_RECTS_SCRIPT, element_ids))
+    return regions
+
+
+def _attach(name, png, label):
+    allure.attach(png, name=f"{label}: {name}", attachment_type=allure.attachment_type.PNG)
+
+
+def checkpoint_name(name):
+    """Nombre de fichero de la baseline de un checkpoint"""
+    return re.sub(r"[^\w.-]+", "_", name)
+
+
+def checkpoint(driver, name, ignore=(), threshold=TestData.VISUAL_THRESHOLD):
+    """
+    Compara el viewport actual con la baseline del checkpoint
+    Args:
+        driver (WebDriver): Driver de la sesión
+        name (str): Nombre del checkpoint (fichero de la baseline)
+        ignore (iterable): Ids de elementos o rectángulos (x, y, ancho, alto) a ignorar
+        threshold (float): Fracción máxima de píxeles distintos permitida
+    Returns:
+        dict: Resultado: método de comparación usado y fracción de píxeles distintos
+    Raises:
+        MissingBaselineError: Si no hay baseline y VISUAL_UPDATE_BASELINES=False
+        VisualMismatchError: Si la captura difiere de la baseline más de lo permitido
+    """
+    name = checkpoint_name(name)
+    frame = Frame(driver.get_screenshot_as_png())
+
+    if TestData.VISUAL_UPDATE_BASELINES:
+        baselines.save(name, frame)
+        _attach(name, frame.png, "Nueva baseline")
+        return {"checkpoint": name, "method": "baseline", "ratio": 0.0}
+
+    baseline = baselines.get(name)
+    if baseline is None:
+        _attach(name, frame.png, "Captura actual")
+        raise MissingBaselineError(
+            f"El checkpoint '{name}' no tiene baseline en {baselines.path(name)}; "
+            f"grábala con VISUAL_UPDATE_BASELINES=True"
+        )
+
+    if frame.digest == baseline.digest:
+        return {"checkpoint": name, "method": "digest", "ratio": 0.0}
+
+    if np is None:
+        _attach(name, frame.png, "Captura actual")
+        raise VisualMismatchError(
+            f"El checkpoint '{name}' no coincide con su baseline (sin NumPy/Pillow solo se compara el digest)"
+        )
+
+    if frame.pixels.shape != baseline.pixels.shape:
+        _attach(name, frame.png, "Captura actual")
+        raise VisualMismatchError(
+            f"El checkpoint '{name}' mide {frame.pixels.shape[1]}x{frame.pixels.shape[0]} "
+            f"y su baseline {baseline.pixels.shape[1]}x{baseline.pixels.shape[0]}"
+        )
+
+    regions = _ignored_regions(driver, ignore)
+    height, width = frame.pixels.shape[:2]
+    mask = _mask(height, width, regions)
+    if TestData.VISUAL_HASH_DISTANCE >= 0:
+        distance = hash_distance(perceptual_hash(frame.pixels, mask), baselines.hash(name, mask, regions))
+        if distance <= TestData.VISUAL_HASH_DISTANCE:
+            return {"checkpoint": name, "method": "hash", "ratio": 0.0, "hash_distance": distance}
+
+    ratio, changed = diff(frame.pixels, baseline.pixels, mask)
+    result = {"checkpoint": name, "method": "diff", "ratio": float(ratio)}
+    if ratio > threshold:
+        png = diff_image(baseline.pixels, changed)
+        os.makedirs(TestData.VISUAL_DIFFS_PATH, exist_ok=True)
+        with open(os.path.join(TestData.VISUAL_DIFFS_PATH, f"{name}-diff.png"), "wb") as f:
+            f.write(png)
+        _attach(name, frame.png, "Captura actual")
+        _attach(name, png, "Diferencias visuales")
+        raise VisualMismatchError(
+            f"El checkpoint '{name}' difiere de su baseline en un {ratio:.3%} de los píxeles "
+            f"(máximo {threshold:.3%})"
+        )
+    return result
@@ -0,0 +1,247 @@
+# utils/webdriver_manager.py
+"""
+Creación de drivers y resolución offline de los binarios de Chrome y chromedriver.
+
+Selenium Manager resuelve (y a veces descarga) chromedriver en cada
+webdriver.Chrome(...). Aquí los binarios se buscan una sola vez en disco
+(variables de entorno, PATH y las cachés de Selenium Manager y
+webdriver-manager) y las rutas se guardan en una caché local indexada por la
+versión del navegador, sin ninguna petición de red.
+
+create_driver() es además la factoría de backends (TestData.DRIVER_BACKEND):
+- local: webdriver.Chrome con el chromedriver resuelto
+- remote: sesión en el endpoint TestData.REMOTE_URL (Grid, Selenoid...)
+- chromedriver: chromedriver local en modo servidor usado como endpoint remoto
+"""
+import glob
+import json
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import time
+from collections import defaultdict
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+
+from config.config import TestData, get_chrome_options
+from utils.lean_profile import apply_lean_profile
+from utils.remote_driver import ChromedriverServer, SessionLimiter, create_remote_driver
+
+BACKENDS = ("local", "remote", "chromedriver")
+
+CHROME_CANDIDATES = [
+    "google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome",
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+    r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+    r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe"
+]
+
+# Cachés donde Selenium Manager y webdriver-manager dejan los chromedriver descargados
+CHROMEDRIVER_CACHE_GLOBS = [
+    "~/.cache/selenium/chromedriver/*/*/chromedriver*",
+    "~/.wdm/drivers/chromedriver/*/*/*/chromedriver*",
+    "~/.wdm/drivers/chromedriver/*/*/chromedriver*"
+]
+
+VERSION_PATTERN = re.compile(r"(\d+)\.\d+\.\d+(?:\.\d+)?")
+
+# Tiempos de arranque (segundos) de los drivers creados en este proceso, por backend
+startup_times = defaultdict(list)
+
+# Sesiones simultáneas permitidas en el proceso (TestData.MAX_SESSIONS)
+session_limiter = SessionLimiter()
+
+# Rutas ya resueltas en este proceso (chrome, chromedriver)
+_resolved = None
+
+
+def _binary_version(path):
+    """Versión que imprime un binario con --version, o None si no se puede obtener"""
+    try:
+        output = subprocess.run([path, "--version"], capture_output=True, text=True, timeout=10).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = VERSION_PATTERN.search(output)
+    return match.group(0) if match else None
+
+
+def _find_chrome():
+    for candidate in [os.getenv("CHROME_BINARY")] + CHROME_CANDIDATES:
+        if not candidate:
+            continue
+        path = candidate if os.path.isfile(candidate) else shutil.which(candidate)
+        if path:
+            return os.path.realpath(path)
+    return None
+
+
+def _find_chromedriver(chrome_version):
+    """Busca un chromedriver con la misma versión mayor que el navegador"""
+    major = chrome_version.split(".")[0] if chrome_version else None
+    candidates = [os.getenv("CHROMEDRIVER_PATH"), shutil.which("chromedriver")]
+    for pattern in CHROMEDRIVER_CACHE_GLOBS:
+        candidates.extend(sorted(glob.glob(os.path.expanduser(pattern)), reverse=True))
+
+    for candidate in candidates:
+        if not candidate or not os.path.isfile(candidate) or candidate.endswith((".zip", ".txt")):
+            continue
+        version = _binary_version(candidate)
+        if version and (major is None or version.split(".")[0] == major):
+            return os.path.realpath(candidate)
+    return None
+
+
+def _load_cache():
+    """Caché de rutas; vacía si no existe o está corrupta (se regenera)"""
+    try:
+        with open(TestData.DRIVER_CACHE_PATH, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {"browsers": {}, "drivers": {}}
+    if not isinstance(cache, dict):
+        return {"browsers": {}, "drivers": {}}
+    cache.setdefault("browsers", {})
+    cache.setdefault("drivers", {})
+    return cache
+
+
+def _save_cache(cache):
+    """
+    Escribe la caché de forma atómica: los procesos worker que la lean a la
+    vez ven la versión anterior o la nueva, nunca un fichero a medio escribir
+    """
+    directory = os.path.dirname(TestData.DRIVER_CACHE_PATH)
+    os.makedirs(directory, exist_ok=True)
+    handle, temp_path = tempfile.mkstemp(dir=directory, prefix=".drivers-", suffix=".json")
+    try:
+        with os.fdopen(handle, "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=2)
+        os.replace(temp_path, TestData.DRIVER_CACHE_PATH)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+def resolve_driver_paths():
+    """
+    Resuelve las rutas de Chrome y chromedriver usando la caché local
+    Returns:
+        tuple: (ruta de Chrome, ruta de chromedriver); None en lo que no se encuentre
+    """
+    global _resolved
+    if _resolved is not None:
+        return _resolved
+
+    cache = _load_cache()
+    changed = False
+    chrome = _find_chrome()
+    version = None
+    if chrome:
+        # La versión del navegador se reutiliza mientras el binario no cambie
+        mtime = os.path.getmtime(chrome)
+        browser = cache["browsers"].get(chrome)
+        if browser and browser["mtime"] == mtime:
+            version = browser["version"]
+        else:
+            version = _binary_version(chrome)
+            cache["browsers"][chrome] = {"mtime": mtime, "version": version}
+            changed = True
+
+    chromedriver = cache["drivers"].get(version) if version else None
+    if not chromedriver or not os.path.isfile(chromedriver):
+        chromedriver = _find_chromedriver(version)
+        if chromedriver and version:
+            cache["drivers"][version] = chromedriver
+            changed = True
+
+    # Solo se reescribe si hubo cambios: lo normal es que todos los procesos la lean
+    if changed:
+        _save_cache(cache)
+    _resolved = (chrome, chromedriver)
+    return _resolved
+
+
+def build_service():
+    """
+    Construye el Service de chromedriver a partir de la caché
+    Returns:
+        Service: Con la ruta resuelta
+    Raises:
+        FileNotFoundError: Si no hay un chromedriver compatible en disco (no se
+            recurre a Selenium Manager, que puede descargarlo de la red)
+    """
+    chrome, chromedriver = resolve_driver_paths()
+    if not chromedriver:
+        version = _binary_version(chrome) if chrome else None
+        wanted = f"chromedriver {version.split('.')[0]}" if version else "chromedriver"
+        raise FileNotFoundError(
+            f"No se encontró {wanted} para {chrome or 'Chrome'} en CHROMEDRIVER_PATH, el PATH "
+            f"ni las cachés de Selenium Manager/webdriver-manager. Indica su ruta con CHROMEDRIVER_PATH"
+        )
+    return Service(executable_path=chromedriver)
+
+
+def create_driver(backend=None):
+    """
+    Crea una nueva instancia de Chrome con la configuración del proyecto.
+    Si se alcanzó TestData.MAX_SESSIONS espera en cola a que se libere una sesión.
+    Args:
+        backend (str): 'local', 'remote' o 'chromedriver' (por defecto TestData.DRIVER_BACKEND)
+    Returns:
+        WebDriver: Driver listo para usar; driver._backend indica el backend
+    Raises:
+        ValueError: Si el backend no existe
+    """
+    backend = backend or TestData.DRIVER_BACKEND
+    if backend not in BACKENDS:
+        raise ValueError(f"Backend de driver desconocido: {backend} (opciones: {', '.join(BACKENDS)})")
+
+    options = get_chrome_options()
+    session_limiter.acquire()
+    try:
+        start = time.perf_counter()
+        if backend == "local":
+            chrome, _ = resolve_driver_paths()
+            if chrome and os.getenv("CHROME_BINARY"):
+                options.binary_location = chrome
+            driver = webdriver.Chrome(service=build_service(), options=options)
+        elif backend == "chromedriver":
+            driver = create_remote_driver(ChromedriverServer.url(build_service), options)
+        else:
+            driver = create_remote_driver(TestData.REMOTE_URL, options)
+        startup_times[backend].append(time.perf_counter() - start)
+    except Exception:
+        session_limiter.release()
+        raise
+    session_limiter.bind(driver)
+    driver._backend = backend
+
+    driver.implicitly_wait(TestData.IMPLICIT_WAIT)
+    if TestData.LEAN_MODE:
+        apply_lean_profile(driver)
+    return driver
+
+
+def startup_report():
+    """
+    Returns:
+        str: Resumen de los tiempos de arranque de los drivers, o None si no se creó ninguno
+    """
+    if not startup_times:
+        return None
+    chrome, chromedriver = _resolved or (None, None)
+    lines = [f"{backend}: {len(times)} drivers | arranque medio {sum(times) / len(times) * 1000:.0f} ms "
+             f"| máximo {max(times) * 1000:.0f} ms"
+             for backend, times in startup_times.items()]
+    if chromedriver or chrome or "local" in startup_times:
+        lines.append(f"chromedriver: {chromedriver or 'Selenium Manager'}"
+                     f"{'' if chrome else ' | Chrome no encontrado'}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    # python -m utils.webdriver_manager: muestra (y cachea) las rutas resueltas
+    print(json.dumps(dict(zip(("chrome", "chromedriver"), resolve_driver_paths())), indent=2))